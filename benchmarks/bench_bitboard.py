@@ -0,0 +1,59 @@
+"""Бенчмарк бітового поля проти engine.Board (списки байтів і NumPy).
+
+Для кожного розміру: генерація (place_mines за seed + update_numbers),
+каскад відкриття з нульової клітинки рідкого поля, перевірка перемоги і
+гра ботів simulate.py (random і solver) на полях 16x16.
+
+Запуск: python benchmarks/bench_bitboard.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bitboard import BitBoard
+from engine import Board, np
+import simulate
+from suite import measure
+
+SIZES = [16, 30, 100, 300]
+SEED = 12345
+GAMES = 200
+
+
+def make(kind, size, mines):
+    if kind == "bits":
+        return BitBoard(size, size, mines)
+    return Board(size, size, mines, backend=kind)
+
+
+def main():
+    kinds = ["python"] + (["numpy"] if np is not None else []) + ["bits"]
+    for size in SIZES:
+        for kind in kinds:
+            board = make(kind, size, size * size // 5)
+            generate = measure(lambda: (board.place_mines(seed=SEED), board.update_numbers())) * 1000
+
+            sparse = make(kind, size, max(1, size * size // 20))
+            sparse.place_mines(seed=SEED)
+            sparse.update_numbers()
+            mine, counts = sparse.mine, sparse.counts
+            start = next(i for i in range(sparse.cells) if not mine[i] and counts[i] == 0)
+            row, col = sparse.coords(start)
+            cascade = measure(lambda: sparse.reveal(row, col), setup=sparse.restart) * 1000
+            check = measure(lambda: [sparse.is_won() for _ in range(1000)])
+            print(f"{size}x{size} {kind:6}: генерація {generate:8.3f} мс, каскад {cascade:8.3f} мс, "
+                  f"перевірка перемоги {check * 1000:6.2f} мкс")
+
+    for bot in ("random", "solver"):
+        for kind in simulate.BOARDS:
+            t0 = time.perf_counter()
+            for seed in range(GAMES):
+                simulate.play_game(16, 16, 40, seed, bot, kind=kind)
+            elapsed = time.perf_counter() - t0
+            print(f"бот {bot:6} {kind:4}: {GAMES / elapsed:.0f} ігор/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Бенчмарк генерації поля: place_mines + update_numbers для кожного бекенда.
+
+Рядки "seed" будують поле за фіксованим seed (SplitMix64), як у грі.
+
+Запуск: python benchmarks/bench_generate.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import Board, np
+from suite import measure
+
+SIZES = [(16, 40), (100, 1600), (1000, 150000)]
+
+
+def bench(size, mines, backend, seed=None):
+    """Повертає найкращий час генерації поля (с)."""
+    def generate():
+        board = Board(size, size, mines, backend=backend)
+        board.place_mines(seed=seed)
+        board.update_numbers()
+    return measure(generate)
+
+
+def main():
+    backends = ["python"] + (["numpy"] if np is not None else [])
+    for size, mines in SIZES:
+        for backend in backends:
+            elapsed = bench(size, mines, backend)
+            print(f"{size}x{size}, {mines} мін, {backend}: {elapsed * 1000:.3f} мс")
+            elapsed = bench(size, mines, backend, seed=12345)
+            print(f"{size}x{size}, {mines} мін, {backend}, seed: {elapsed * 1000:.3f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Бенчмарк запису ходів: розмір запису на гру та швидкість відтворення.
+
+Запуск: python benchmarks/bench_movelog.py [кількість_ігор]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import movelog
+from engine import Board, DIFFICULTY_SETTINGS
+
+
+def play(board, rng):
+    """Випадкова гра: відкриває клітинки, а відомі міни інколи позначає прапорцем."""
+    log = movelog.MoveLog(board)
+    now = 0.0
+    while not board.lost and not board.is_won():
+        index = rng.randrange(board.cells)
+        if board.revealed[index] or board.flagged[index]:
+            continue
+        now += rng.uniform(0.2, 3.0)
+        if board.mine[index] and rng.random() < 0.95:
+            board.toggle_flag(*board.coords(index))
+            log.record(movelog.OP_FLAG, index, now)
+        else:
+            board.reveal(*board.coords(index))
+            log.record(movelog.OP_REVEAL, index, now)
+    return log
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rng = random.Random(1)
+    for name, (size, mines) in DIFFICULTY_SETTINGS.items():
+        logs = []
+        for _ in range(count):
+            board = Board(size, size, mines, backend="python")
+            board.place_mines(rng)
+            board.update_numbers()
+            logs.append(play(board, rng))
+        sizes = [len(log.encode()) for log in logs]
+        moves = sum(log.moves for log in logs)
+
+        t0 = time.perf_counter()
+        for log in logs:
+            movelog.replay(log.encode())
+        replay_time = time.perf_counter() - t0
+        print(f"{name}: {sum(sizes) / count:.0f} байт на гру (макс. {max(sizes)}), "
+              f"{moves / count:.0f} ходів, повне відтворення {replay_time / count * 1000:.3f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Пропускна здатність генератора полів без вгадування для кожного рівня.
+
+Запуск: python benchmarks/bench_noguess.py [полів_на_рівень]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import noguess
+from engine import DIFFICULTY_SETTINGS
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    cores = os.cpu_count() or 1
+    for name, (size, mines) in DIFFICULTY_SETTINGS.items():
+        for workers in sorted({1, cores}):
+            t0 = time.perf_counter()
+            noguess.find_seeds(size, size, mines, count, workers=workers)
+            elapsed = time.perf_counter() - t0
+            print(f"{name} ({size}x{size}, {mines} мін), процесів {workers}: "
+                  f"{count / elapsed:.1f} полів/с")
+
+
+if __name__ == "__main__":
+    main()
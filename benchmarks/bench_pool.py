@@ -0,0 +1,52 @@
+"""Бенчмарк пулу полів: перезапуск з готовим полем проти генерації на місці.
+
+Промах - пул порожній, і take() генерує поле синхронно (як раніше кожен
+перезапуск). Влучання - поле вже підготовлене в простої Tk. Потрібен лише
+інтерпретатор Tcl, дисплей не потрібен.
+
+Запуск: python benchmarks/bench_pool.py
+"""
+import os
+import sys
+import time
+import tkinter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from boardpool import BoardPool
+from engine import Board, new_seed
+
+SIZES = [(10, 10), (16, 40), (30, 180), (100, 1600)]
+ROUNDS = 50
+
+
+def generate(key):
+    size, mines = key
+    board = Board(size, size, mines)
+    board.place_mines(seed=new_seed())
+    board.update_numbers()
+    return board
+
+
+def main():
+    root = tkinter.Tcl()
+    for size, mines in SIZES:
+        pool = BoardPool(generate, depth=1, root=root)
+        pool.configure((size, mines))
+        pool.cancel()
+        miss = hit = 0.0
+        for _ in range(ROUNDS):
+            t0 = time.perf_counter()
+            pool.take()  # Пул порожній - генерація на місці
+            miss += time.perf_counter() - t0
+            root.update()  # Простій: пул готує наступне поле
+            t0 = time.perf_counter()
+            pool.take()
+            hit += time.perf_counter() - t0
+            pool.cancel()
+        print(f"{size}x{size}, {mines} мін: промах {miss / ROUNDS * 1000:.3f} мс, "
+              f"влучання {hit / ROUNDS * 1000:.3f} мс (влучань {pool.hits}, промахів {pool.misses})")
+
+
+if __name__ == "__main__":
+    main()
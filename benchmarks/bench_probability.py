@@ -0,0 +1,46 @@
+"""Бенчмарк точних ймовірностей мін на полях експерта (30x16, 99 мін).
+
+Бот щоразу відкриває клітинку з найменшою ймовірністю міни; вимірюється
+час ProbabilityEngine.compute() після кожного ходу і частка компонент,
+взятих з кешу.
+
+Запуск: python benchmarks/bench_probability.py [кількість_полів]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import Board
+from probability import ProbabilityEngine, safest_cell
+
+ROWS, COLS, MINES = 16, 30, 99
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    engine = ProbabilityEngine()
+    timings = []
+    wins = 0
+    for seed in range(1, count + 1):
+        board = Board(ROWS, COLS, MINES, backend="python")
+        board.place_mines(seed=seed)
+        board.update_numbers()
+        start = next(i for i in range(board.cells) if not board.mine[i] and board.counts[i] == 0)
+        board.reveal(*board.coords(start))
+        while not board.lost and board.safe_left:
+            t0 = time.perf_counter()
+            probabilities = engine.compute(board)
+            timings.append(time.perf_counter() - t0)
+            board.reveal(*board.coords(safest_cell(board, probabilities)))
+        wins += not board.lost
+    timings.sort()
+    print(f"Поля {COLS}x{ROWS}, {MINES} мін: бот за ймовірностями відкрив усе на {wins}/{count}")
+    print(f"compute(): {len(timings)} викликів, медіана {timings[len(timings) // 2] * 1000:.2f} мс, "
+          f"p99 {timings[int(len(timings) * 0.99)] * 1000:.2f} мс, макс. {timings[-1] * 1000:.2f} мс")
+    print(f"Кеш компонент: {engine.hits} влучань, {engine.misses} промахів")
+
+
+if __name__ == "__main__":
+    main()
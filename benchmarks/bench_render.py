@@ -0,0 +1,54 @@
+"""Бенчмарк побудови, перезапуску та зміни розміру поля для кожного способу відображення.
+
+Потрібен дисплей; без нього можна запустити під Xvfb:
+xvfb-run python benchmarks/bench_render.py
+"""
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from render import ButtonBoardView, CanvasBoardView
+
+DEFAULTS = dict(text="", bg="#e0e0e0", fg="#000000", activebackground="#E1F5FE",
+                disabledforeground="#000000", state="normal")
+
+
+def bench(root, view_class, size, repeat=5):
+    """Повертає час першої побудови, перезапуску та зміни розміру поля (с)."""
+    frame = tk.Frame(root)
+    frame.pack()
+    view = view_class(frame, lambda r, c: None, lambda r, c: None, lambda r, c: None)
+
+    def build(n):
+        t0 = time.perf_counter()
+        view.build(n, n, max(8, min(44, 704 // n)), **DEFAULTS)
+        root.update()
+        return time.perf_counter() - t0
+
+    first = build(size)
+    restart = min(build(size) for _ in range(repeat))
+    # Перехід на інший рівень складності і назад
+    resize = min(build(size // 2) + build(size) for _ in range(repeat)) / 2
+    frame.destroy()
+    return first, restart, resize
+
+
+def main():
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Немає дисплея: {e}")
+        return
+    for view_class in (ButtonBoardView, CanvasBoardView):
+        for size in (10, 16, 100):
+            first, restart, resize = bench(root, view_class, size)
+            print(f"{view_class.__name__}, {size}x{size}: побудова {first * 1000:.1f} мс, "
+                  f"перезапуск {restart * 1000:.1f} мс, зміна розміру {resize * 1000:.1f} мс")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Бенчмарк відкриття великих порожніх областей (flood fill) у рушії.
+
+Запуск: python benchmarks/bench_reveal.py
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import Board
+from suite import measure
+
+
+def bench(size, density, seed=1):
+    """Повертає найкращий час відкриття (с) і розмір відкритої області."""
+    board = Board(size, size, max(1, int(size * size * density)))
+    board.place_mines(random.Random(seed))
+    board.update_numbers()
+    start = next(i for i in range(board.cells) if board.counts[i] == 0 and not board.mine[i])
+    row, col = board.coords(start)
+    opened = len(board.reveal(row, col))
+    return measure(lambda: board.reveal(row, col), setup=board.restart), opened
+
+
+def main():
+    for size in (100, 500):
+        for density in (0.01, 0.05):
+            elapsed, opened = bench(size, density)
+            print(f"{size}x{size}, щільність {density:.0%}: "
+                  f"{opened} клітинок за {elapsed * 1000:.2f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Бенчмарк розв'язувача на корпусі полів за фіксованими seed.
+
+Кожне поле 30x16 з 99 мінами (експерт) грається розв'язувачем: перший хід
+відкриває нульову клітинку, далі відкриваються всі певні безпечні клітинки
+і позначаються певні міни, доки розв'язувач не зупиниться. Вимірюється час
+кожного виклику solve() - саме стільки коштує підказка після кліку.
+
+Запуск: python benchmarks/bench_solver.py [кількість_полів]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import solver
+from engine import Board
+
+ROWS, COLS, MINES = 16, 30, 99
+
+
+def corpus(count):
+    """Поля корпусу: seed 1..count, однакові на будь-якій машині."""
+    for seed in range(1, count + 1):
+        board = Board(ROWS, COLS, MINES, backend="python")
+        board.place_mines(seed=seed)
+        board.update_numbers()
+        yield board
+
+
+def play(board, timings):
+    """Грає поле розв'язувачем; повертає True, якщо поле розв'язано повністю."""
+    start = next(i for i in range(board.cells) if not board.mine[i] and board.counts[i] == 0)
+    board.reveal(*board.coords(start))
+    while not board.is_won():
+        t0 = time.perf_counter()
+        safe, mines = solver.solve(board)
+        timings.append(time.perf_counter() - t0)
+        progress = False
+        for index in safe:
+            if not board.revealed[index]:
+                board.reveal(*board.coords(index))
+                progress = True
+        for index in mines:
+            if not board.flagged[index]:
+                board.toggle_flag(*board.coords(index))
+                progress = True
+        if not progress:
+            return False
+    return True
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    timings = []
+    solved = sum(play(board, timings) for board in corpus(count))
+    timings.sort()
+    print(f"Поля {COLS}x{ROWS}, {MINES} мін: розв'язано без вгадування {solved}/{count}")
+    print(f"solve(): {len(timings)} викликів, медіана {timings[len(timings) // 2] * 1000:.2f} мс, "
+          f"p99 {timings[int(len(timings) * 0.99)] * 1000:.2f} мс, макс. {timings[-1] * 1000:.2f} мс")
+
+
+if __name__ == "__main__":
+    main()
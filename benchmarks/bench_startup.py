@@ -0,0 +1,62 @@
+"""Бенчмарк запуску: від старту процесу до першого намальованого кадру.
+
+Гра запускається окремим процесом з MINER_STARTUP_PROBE=1 (див. te.main):
+після першого кадру вона друкує "ready" і закривається. Час рахується від
+створення процесу до цього рядка, тож включає запуск інтерпретатора,
+імпорти, створення вікна і поля. Процес працює у тимчасовій теці, щоб не
+чіпати settings.json гравця. Потрібен дисплей (або Xvfb):
+
+    xvfb-run python benchmarks/bench_startup.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def startup_time(folder):
+    """Час до першого кадру (с) або None, якщо гра не змогла запуститися."""
+    env = dict(os.environ, MINER_STARTUP_PROBE="1")
+    t0 = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "te.py")], cwd=folder, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    elapsed = None
+    for line in process.stdout:
+        if line.strip() == "ready":
+            elapsed = time.perf_counter() - t0
+            break
+    process.stdout.close()
+    process.wait()
+    return elapsed
+
+
+def measure_startup(repeat=5):
+    """Найкращий і медіанний час запуску (с) або None без дисплея."""
+    times = []
+    with tempfile.TemporaryDirectory() as folder:
+        for _ in range(repeat):
+            elapsed = startup_time(folder)
+            if elapsed is None:
+                return None
+            times.append(elapsed)
+    times.sort()
+    return times[0], times[len(times) // 2]
+
+
+def main():
+    result = measure_startup()
+    if result is None:
+        print("Гра не запустилася (немає дисплея?) - бенчмарк пропущено")
+        return
+    best, median = result
+    print(f"Запуск до першого кадру: найкраще {best * 1000:.1f} мс, медіана {median * 1000:.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Бенчмарк зведеної статистики на великій таблиці games.
+
+Запуск: python benchmarks/bench_stats.py [кількість_ігор]
+"""
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import storage
+
+
+def synthetic_games(count, seed=1):
+    """Ігри, рівномірно розподілені за останні ~3 роки."""
+    rng = random.Random(seed)
+    start = time.time() - 3 * 365 * 86400
+    step = 3 * 365 * 86400 / count
+    for i in range(count):
+        date = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(start + i * step))
+        yield (date, rng.choice((storage.WIN, storage.LOSS)), rng.choice(("Легкий", "Середній", "Важкий")))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as folder:
+        conn = sqlite3.connect(os.path.join(folder, "bench.db"))
+        storage.create_schema(conn)
+
+        t0 = time.perf_counter()
+        with conn:
+            conn.executemany("INSERT INTO games (date, result, difficulty) VALUES (?, ?, ?)",
+                             synthetic_games(count))
+        insert_time = time.perf_counter() - t0
+        print(f"Вставка {count} ігор з оновленням статистики: {insert_time:.2f} с "
+              f"({count / insert_time:.0f} ігор/с)")
+
+        t0 = time.perf_counter()
+        storage.rebuild_stats(conn)
+        print(f"Повний перерахунок статистики: {time.perf_counter() - t0:.2f} с")
+
+        t0 = time.perf_counter()
+        for _ in range(100):
+            storage.fetch_stats(conn)
+        print(f"Читання статистики: {(time.perf_counter() - t0) * 10:.3f} мс")
+
+        t0 = time.perf_counter()
+        for _ in range(100):
+            storage.insert_game(conn, storage.WIN, "Легкий")
+        print(f"Збереження однієї гри: {(time.perf_counter() - t0) * 10:.3f} мс")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Бенчмарк топологій поля: побудова таблиці суміжності, генерація і каскад.
+
+Таблиця будується один раз на (топологія, rows, cols), тож перший рядок
+показує разову ціну, а генерація і каскад - що обхід сусідів через таблицю
+однаково швидкий для всіх топологій.
+
+Запуск: python benchmarks/bench_topology.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import Board
+from suite import measure
+from topology import TOPOLOGIES, Adjacency
+
+SIZES = [16, 30, 100]
+SEED = 12345
+
+
+def main():
+    for size in SIZES:
+        for topology in TOPOLOGIES:
+            build = measure(lambda: Adjacency(topology, size, size)) * 1000
+
+            board = Board(size, size, size * size // 5, backend="python", topology=topology)
+            generate = measure(lambda: (board.place_mines(seed=SEED), board.update_numbers())) * 1000
+
+            sparse = Board(size, size, max(1, size * size // 20), backend="python", topology=topology)
+            sparse.place_mines(seed=SEED)
+            sparse.update_numbers()
+            start = next(i for i in range(sparse.cells) if not sparse.mine[i] and sparse.counts[i] == 0)
+            row, col = sparse.coords(start)
+            cascade = measure(lambda: sparse.reveal(row, col), setup=sparse.restart) * 1000
+            print(f"{size}x{size} {topology:6}: таблиця {build:8.3f} мс, генерація {generate:8.3f} мс, "
+                  f"каскад {cascade:8.3f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Навантажувальний тест: кілька процесів одночасно записують ігри в одну базу.
+
+Кожен процес поводиться як окремий екземпляр гри: відкриває з'єднання
+записувача і зберігає ігри по одній транзакції. Звіт містить загальну
+пропускну здатність і затримку очікування блокування.
+
+Запуск: python benchmarks/stress_db.py [процеси] [ігор_на_процес] [шлях_до_бази]
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import storage
+
+
+def worker(db_path, games):
+    """Записує games ігор і повертає затримки кожної транзакції (с)."""
+    conn = storage.connect(db_path, writer=True)
+    latencies = []
+    for i in range(games):
+        record = storage.game_record(storage.WIN if i % 3 else storage.LOSS, "Легкий",
+                                     size=10, duration_ms=i, moves=i, clicks=i)
+        t0 = time.perf_counter()
+        storage.write_games(conn, [record])
+        latencies.append(time.perf_counter() - t0)
+    conn.close()
+    return latencies
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    games = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    with tempfile.TemporaryDirectory() as folder:
+        db_path = sys.argv[3] if len(sys.argv) > 3 else os.path.join(folder, "stress.db")
+        conn = storage.connect(db_path)
+        storage.create_schema(conn)
+        before = storage.count_games(conn)
+
+        t0 = time.perf_counter()
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.starmap(worker, [(db_path, games)] * processes)
+        elapsed = time.perf_counter() - t0
+
+        written = storage.count_games(conn) - before
+        stats, _ = storage.fetch_stats(conn)
+        conn.close()
+
+    latencies = sorted(latency for result in results for latency in result)
+    print(f"{processes} процесів x {games} ігор: записано {written} за {elapsed:.2f} с "
+          f"({written / elapsed:.0f} ігор/с)")
+    print(f"Затримка транзакції: p50 {percentile(latencies, 0.5) * 1000:.2f} мс, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f} мс, "
+          f"макс {latencies[-1] * 1000:.2f} мс")
+    print(f"Статистика узгоджена: {stats.get('*', (0,))[0] == written + before}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Повний набір бенчмарків гарячих шляхів з фіксованими seed.
+
+Вимірює рушій (place_mines, update_numbers, каскад reveal, перевірка
+перемоги; також для bitboard.BitBoard) для кількох розмірів поля, базу даних (save_game, сторінка
+історії, статистика) для кількох розмірів бази, запис налаштувань і, якщо
+є дисплей, частини Tk: перезапуск поля, set_board_state, зміну теми,
+save_settings, save_game і load_history_data, а також час запуску гри
+до першого кадру (bench_startup.py). Без дисплея Tk-частини
+пропускаються; їх можна запустити під Xvfb:
+
+    xvfb-run python benchmarks/suite.py
+
+Результати (найкращий час кожного вимірювання, с) пишуться в JSON і
+порівнюються з базовою лінією (за замовчуванням benchmarks/baseline.json
+у репозиторії): вимірювання, повільніше за неї більше ніж на --tolerance,
+вважається регресією, і скрипт завершується з кодом 1. Базова лінія
+залежить від машини - на новій машині її варто перезаписати.
+
+    python benchmarks/suite.py
+    python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+    python benchmarks/suite.py --baseline other.json --output results.json
+
+Інші бенчмарки в цій теці беруть measure() звідси.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bitboard import BitBoard
+import storage
+from bench_startup import measure_startup
+from bench_stats import synthetic_games
+from engine import Board, np
+from settings import SettingsStore
+
+SEED = 12345
+BOARD_SIZES = [10, 16, 30, 100, 300]
+DB_SIZES = [1_000, 100_000]
+# Різниця, меншу за яку вважаємо шумом таймера (с)
+NOISE_FLOOR = 0.00005
+# Швидкі вимірювання повторюються, доки не наберуть стільки часу (с)
+MIN_TOTAL = 0.2
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def measure(action, repeat=5, setup=None):
+    """Найкращий час action(); setup() не входить у вимір.
+
+    Щонайменше repeat запусків, а для швидких дій - скільки влізе в
+    MIN_TOTAL секунд (до 1000), щоб мінімум був стабільним.
+    """
+    best = None
+    total = 0.0
+    runs = 0
+    while runs < repeat or (total < MIN_TOTAL and runs < 1000):
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        action()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+        total += elapsed
+        runs += 1
+    return best
+
+
+def seeded_board(size, density, backend="python"):
+    mines = max(1, int(size * size * density))
+    board = BitBoard(size, size, mines) if backend == "bits" else Board(size, size, mines, backend=backend)
+    board.place_mines(seed=SEED)
+    board.update_numbers()
+    return board
+
+
+def bench_engine(results, sizes):
+    backends = ["python"] + (["numpy"] if np is not None else []) + ["bits"]
+    for size in sizes:
+        for backend in backends:
+            board = seeded_board(size, 0.2, backend)
+            results[f"place_mines[{backend},{size}x{size}]"] = measure(lambda: board.place_mines(seed=SEED))
+            if backend == "numpy":
+                # Без seed - вибірка генератора NumPy (seed іде через _numpy_seeded_sample)
+                results[f"place_mines[numpy-rng,{size}x{size}]"] = measure(
+                    lambda: board.place_mines(rng=np.random.default_rng(SEED)))
+            results[f"update_numbers[{backend},{size}x{size}]"] = measure(board.update_numbers)
+
+        # Каскад: рідке поле, відкриття з нульової клітинки
+        board = seeded_board(size, 0.05)
+        start = next(i for i in range(board.cells) if not board.mine[i] and board.counts[i] == 0)
+        row, col = board.coords(start)
+        results[f"reveal_cascade[{size}x{size}]"] = measure(lambda: board.reveal(row, col), setup=board.restart)
+        bits = seeded_board(size, 0.05, "bits")
+        results[f"reveal_cascade[bits,{size}x{size}]"] = measure(lambda: bits.reveal(row, col), setup=bits.restart)
+
+        # Перевірка перемоги на повністю відкритому полі
+        for index in range(board.cells):
+            if board.mine[index]:
+                board.toggle_flag(*board.coords(index))
+            elif not board.revealed[index]:
+                board.reveal(*board.coords(index))
+        results[f"check_win[{size}x{size}]"] = measure(lambda: [board.is_won() for _ in range(1000)]) / 1000
+
+
+def bench_storage(results, folder, db_sizes):
+    for db_size in db_sizes:
+        path = os.path.join(folder, f"games_{db_size}.db")
+        conn = storage.connect(path, writer=True)
+        storage.create_schema(conn)
+        with conn:
+            conn.executemany("INSERT INTO games (date, result, difficulty) VALUES (?, ?, ?)",
+                             synthetic_games(db_size, seed=SEED))
+        results[f"save_game[{db_size}]"] = measure(
+            lambda: storage.insert_game(conn, storage.WIN, "Легкий", size=10, moves=20, clicks=25), repeat=20)
+        results[f"load_history_data[{db_size}]"] = measure(
+            lambda: (storage.count_games(conn), storage.fetch_games_before(conn, None, 20)), repeat=20)
+        results[f"history_jump[{db_size}]"] = measure(
+            lambda: storage.fetch_games_at(conn, db_size // 2, 20), repeat=20)
+        middle = storage.fetch_games_at(conn, db_size // 2, 20)[-1][0]
+        results[f"history_scroll[{db_size}]"] = measure(
+            lambda: storage.fetch_games_before(conn, middle, 1), repeat=20)
+        results[f"fetch_stats[{db_size}]"] = measure(lambda: storage.fetch_stats(conn), repeat=20)
+        conn.close()
+
+
+def bench_settings(results, folder):
+    store = SettingsStore(os.path.join(folder, "settings.json"), {"dark_mode": False, "timer_pos": {}})
+    flip = iter(range(10 ** 9))
+    results["save_settings[disk]"] = measure(lambda: store.update({"dark_mode": next(flip) % 2 == 0}))
+
+
+def bench_tk(results, folder, sizes):
+    """Вимірює методи справжнього вікна гри; повертає False, якщо немає дисплея."""
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Tk-частини пропущено (немає дисплея): {e}")
+        return False
+
+    import te
+    # Гра пише налаштування і базу в робочу теку - підміняємо її тимчасовою
+    os.chdir(folder)
+    te.folder = folder
+    te.db_path = os.path.join(folder, "game_data.db")
+    random.seed(SEED)
+    app = te.Minesweeper(root)
+    root.update()
+
+    for size in sizes:
+        app.size, app.mines = size, max(1, size * size // 6)
+        results[f"restart_game[{size}x{size}]"] = measure(
+            lambda: (app.restart_game(confirm=False), root.update()))
+        results[f"set_board_state[{size}x{size}]"] = measure(
+            lambda: (app.set_board_state("normal"), root.update(),
+                     app.set_board_state("disabled"), root.update())) / 2
+    app.size, app.mines = te.DIFFICULTY_SETTINGS[app.last_difficulty]
+    app.restart_game(confirm=False)
+
+    results["toggle_theme"] = measure(lambda: (app.toggle_theme(), root.update()))
+    results["save_settings[app]"] = measure(lambda: (app.save_settings(), app.settings.flush()))
+
+    def save_and_wait():
+        # save_game лише ставить запис у чергу - чекаємо, доки GameWriter його закомітить
+        app.save_game(storage.WIN)
+        app.writer.saved.get(timeout=5)
+        app.pending_saves -= 1
+
+    results["save_game[app]"] = measure(save_and_wait, repeat=20)
+    app.show_history()
+    root.update()
+    results["load_history_data[app]"] = measure(lambda: (app.load_history_data(), root.update()))
+    app.on_close()
+    return True
+
+
+def compare(results, baseline, tolerance):
+    """Друкує порівняння з базовою лінією і повертає список регресій."""
+    regressions = []
+    for name, value in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        ratio = value / old if old else float("inf")
+        slower = ratio > 1 + tolerance and value - old > NOISE_FLOOR
+        mark = "РЕГРЕСІЯ" if slower else ""
+        print(f"{name:40} {old * 1000:10.4f} -> {value * 1000:10.4f} мс  x{ratio:.2f} {mark}")
+        if slower:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Набір бенчмарків гри «Мінер»")
+    parser.add_argument("--sizes", type=int, nargs="+", default=BOARD_SIZES, help="розміри поля")
+    parser.add_argument("--db-sizes", type=int, nargs="+", default=DB_SIZES, help="кількість ігор у базі")
+    parser.add_argument("--no-tk", action="store_true", help="не запускати Tk-частини")
+    parser.add_argument("--output", help="файл JSON з результатами")
+    parser.add_argument("--baseline", default=BASELINE, help="файл JSON базової лінії для порівняння")
+    parser.add_argument("--no-baseline", action="store_true", help="не порівнювати з базовою лінією")
+    parser.add_argument("--save-baseline", help="зберегти результати як базову лінію")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="допустиме сповільнення (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        bench_engine(results, args.sizes)
+        bench_storage(results, folder, args.db_sizes)
+        bench_settings(results, folder)
+        if not args.no_tk:
+            cwd = os.getcwd()
+            try:
+                bench_tk(results, folder, [size for size in args.sizes if size <= 100])
+            finally:
+                os.chdir(cwd)
+            startup = measure_startup()
+            if startup is not None:
+                results["startup[first_frame]"] = startup[0]
+
+    report = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+            "sqlite": sqlite3.sqlite_version,
+            "seed": SEED,
+        },
+        "results": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding='utf-8') as f:
+                json.dump(report, f, indent=4, ensure_ascii=False)
+
+    if args.save_baseline or args.no_baseline or not os.path.exists(args.baseline):
+        if not args.output:
+            for name, value in results.items():
+                print(f"{name:40} {value * 1000:10.4f} мс")
+    else:
+        with open(args.baseline, "r", encoding='utf-8') as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"Регресії: {len(regressions)}")
+            sys.exit(1)
+        print("Регресій немає")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Поле гри на бітових масках (цілі числа Python).
+
+Міни, відкриті клітинки і прапорці - це по одному цілому числу, де
+клітинка (row, col) - біт row * (cols + 1) + col. Останній стовпчик
+кожного рядка - захисний і завжди нульовий: зсув на один біт переносить
+крайню клітинку саме туди, тож маска full відсікає перехід на сусідній
+рядок без перевірок меж.
+
+Усі сусіди маски x - це _dilate(x): два зсуви по горизонталі і два по
+вертикалі. Числа рахуються побітовим додаванням восьми зсунутих копій
+мін у чотири бітові площини, каскад відкриття - розширенням фронту
+нульових клітинок за один крок на всю ширину поля, а перевірка перемоги -
+порівнянням масок (revealed | mine == full).
+
+Інтерфейс такий самий, як у engine.Board (reveal, toggle_flag, chord,
+is_won, place_mines і clear_start з тим самим seed), а масиви mine,
+revealed, flagged і counts доступні як незмінні bytes у звичайній
+нумерації row * cols + col, тож розв'язувач і боти simulate.py працюють з
+обома полями. Зсуви
+описують лише прямокутне поле, тому топологія BitBoard завжди "rect".
+"""
+import functools
+import random
+
+from engine import SplitMix64, neighbour_table, seeded_sample
+
+_BIT_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+
+@functools.lru_cache(maxsize=8)
+def _full_mask(rows, cols):
+    """Маска всіх клітинок поля без захисного стовпчика."""
+    row = (1 << cols) - 1
+    width = cols + 1
+    mask = 0
+    for r in range(rows):
+        mask |= row << (r * width)
+    return mask
+
+
+def _popcount(x):
+    return bin(x).count("1")
+
+
+class BitBoard:
+    """Поле гри: міни, відкриті клітинки та прапорці як бітові маски."""
+
+    topology = "rect"
+
+    def __init__(self, rows, cols, mines):
+        if not 0 <= mines < rows * cols:
+            raise ValueError("Кількість мін має бути меншою за кількість клітинок")
+        self.rows = rows
+        self.cols = cols
+        self.mines = mines
+        self.cells = rows * cols
+        self.width = cols + 1
+        self.full = _full_mask(rows, cols)
+        self.seed = None
+        self.reset()
+
+    def reset(self):
+        """Очищає поле без розміщення мін."""
+        self.mine_bits = 0
+        self.planes = (0, 0, 0, 0)  # Біти 1, 2, 4 і 8 кількості мін навколо
+        self.zero_bits = self.full
+        self._counts = None
+        self.restart()
+
+    def restart(self):
+        """Закриває всі клітинки та знімає прапорці, зберігаючи міни."""
+        self.revealed_bits = 0
+        self.flag_bits = 0
+        self.exploded = -1
+        self.lost = False
+        self._views = {}
+
+    # Перетворення індексів і масок
+
+    def index(self, row, col):
+        return row * self.cols + col
+
+    def coords(self, index):
+        return divmod(index, self.cols)
+
+    def bit(self, index):
+        row, col = divmod(index, self.cols)
+        return 1 << (row * self.width + col)
+
+    def indices(self, mask):
+        """Індекси row * cols + col встановлених бітів маски (за зростанням)."""
+        if mask & (mask - 1) == 0:  # Нуль або одна клітинка - без розпакування
+            if not mask:
+                return []
+            row, col = divmod(mask.bit_length() - 1, self.width)
+            return [row * self.cols + col]
+        data = self.unpack(mask)
+        result = []
+        index = data.find(1)
+        while index >= 0:
+            result.append(index)
+            index = data.find(1, index + 1)
+        return result
+
+    def unpack(self, mask):
+        """Маска як bytes з 0 і 1 у звичайній нумерації клітинок."""
+        width, cols = self.width, self.cols
+        bits = format(mask, f"0{self.rows * width}b")[::-1]
+        return "".join(bits[r * width:r * width + cols] for r in range(self.rows)).encode().translate(_BIT_BYTES)
+
+    def _dilate(self, x):
+        """Маска x разом з усіма сусідами її клітинок."""
+        width = self.width
+        h = x | x << 1 | x >> 1
+        return (h | h << width | h >> width) & self.full
+
+    def neighbours(self, index):
+        return neighbour_table(self.rows, self.cols)[index]
+
+    # Генерація поля
+
+    def place_mines(self, rng=None, seed=None):
+        """Розміщує міни; з seed розкладка така сама, як у engine.Board."""
+        self.reset()
+        self.seed = seed
+        if seed is not None:
+            indices = seeded_sample(seed, self.cells, self.mines)
+        else:
+            indices = (rng or random).sample(range(self.cells), self.mines)
+        # Рядок цифр "0"/"1" і один int(..., 2) замість зсуву на кожну міну
+        digits = bytearray(b"0") * (self.rows * self.width)
+        cols, width = self.cols, self.width
+        for index in indices:
+            digits[index // cols * width + index % cols] = 49  # b"1"
+        self.mine_bits = int(digits[::-1], 2) if digits else 0
+
+    def clear_start(self, index, area=True):
+        """Прибирає міни з першої відкритої клітинки (і, якщо area, з її сусідів).
+
+        Перенесення такі самі, як у engine.Board.clear_start з тим самим
+        seed; числа після них перераховуються зсувами масок.
+        """
+        bit = self.bit(index)
+        zone = self._dilate(bit) if area else bit
+        if area and self.cells - _popcount(zone) < self.mines:
+            zone = bit  # Поле надто щільне для вільної області 3x3
+        moving = self.indices(self.mine_bits & zone)
+        if not moving:
+            return []
+        rng = SplitMix64(self.seed ^ index << 32) if self.seed is not None else None
+        free = self.indices(self.full & ~self.mine_bits & ~zone)
+        moved = []
+        for old in moving:
+            j = rng.below(len(free)) if rng else random.randrange(len(free))
+            new = free[j]
+            free[j] = free[-1]
+            free.pop()
+            self.mine_bits ^= self.bit(old) | self.bit(new)
+            moved.append((old, new))
+        self.update_numbers()
+        return moved
+
+    def update_numbers(self):
+        """Рахує сусідні міни для всіх клітинок додаванням восьми зсунутих масок."""
+        m, width, full = self.mine_bits, self.width, self.full
+        p0 = p1 = p2 = p3 = 0
+        for shift in (1, width - 1, width, width + 1):
+            for shifted in (m << shift, m >> shift):
+                a = shifted & full
+                carry = p0 & a
+                p0 ^= a
+                a = p1 & carry
+                p1 ^= carry
+                p3 |= p2 & a
+                p2 ^= a
+        self.planes = (p0, p1, p2, p3)
+        self.zero_bits = full & ~(p0 | p1 | p2 | p3 | m)
+        self._counts = None
+
+    # Запити стану
+
+    def is_mine(self, row, col):
+        return bool(self.mine_bits >> (row * self.width + col) & 1)
+
+    def is_revealed(self, row, col):
+        return bool(self.revealed_bits >> (row * self.width + col) & 1)
+
+    def is_flagged(self, row, col):
+        return bool(self.flag_bits >> (row * self.width + col) & 1)
+
+    def count(self, row, col):
+        position = row * self.width + col
+        return sum((plane >> position & 1) << k for k, plane in enumerate(self.planes))
+
+    def mine_indices(self):
+        return self.indices(self.mine_bits)
+
+    def flagged_indices(self):
+        return self.indices(self.flag_bits)
+
+    def _view(self, name, mask):
+        cached = self._views.get(name)
+        if cached is None or cached[0] != mask:
+            cached = (mask, self.unpack(mask))
+            self._views[name] = cached
+        return cached[1]
+
+    @property
+    def mine(self):
+        return self._view("mine", self.mine_bits)
+
+    @property
+    def revealed(self):
+        return self._view("revealed", self.revealed_bits)
+
+    @property
+    def flagged(self):
+        return self._view("flagged", self.flag_bits)
+
+    @property
+    def counts(self):
+        if self._counts is None:
+            p0, p1, p2, p3 = (self.unpack(plane) for plane in self.planes)
+            self._counts = bytes(a | b << 1 | c << 2 | d << 3 for a, b, c, d in zip(p0, p1, p2, p3))
+        return self._counts
+
+    @property
+    def safe_left(self):
+        return _popcount(self.full & ~self.mine_bits & ~self.revealed_bits)
+
+    @property
+    def mines_left(self):
+        return _popcount(self.mine_bits & ~self.flag_bits & ~self.revealed_bits)
+
+    # Ходи гравця
+
+    def reveal(self, row, col):
+        """Відкриває клітинку; нуль розкриває всю сусідню область.
+
+        Повертає список щойно відкритих індексів. Відкриття міни позначає
+        програш і повертає лише саму міну.
+        """
+        bit = 1 << (row * self.width + col)
+        if (self.revealed_bits | self.flag_bits) & bit:
+            return []
+        if self.mine_bits & bit:
+            self.revealed_bits |= bit
+            self.exploded = self.index(row, col)
+            self.lost = True
+            return [self.exploded]
+        return self.indices(self._flood(bit))
+
+    def _flood(self, start):
+        """Відкриває клітинки маски start і області навколо їх нулів; повертає нові біти."""
+        blocked = self.revealed_bits | self.flag_bits
+        zero = self.zero_bits
+        opened = start
+        frontier = start & zero
+        while frontier:
+            grown = self._dilate(frontier) & ~blocked & ~opened
+            opened |= grown
+            frontier = grown & zero
+        self.revealed_bits |= opened
+        return opened
+
+    def toggle_flag(self, row, col):
+        """Ставить або знімає прапорець. Повертає новий стан або None."""
+        bit = 1 << (row * self.width + col)
+        if self.revealed_bits & bit:
+            return None
+        self.flag_bits ^= bit
+        return bool(self.flag_bits & bit)
+
+    def chord(self, row, col):
+        """Відкриває всіх сусідів числа, якщо навколо стоїть рівно стільки ж прапорців."""
+        bit = 1 << (row * self.width + col)
+        if not self.revealed_bits & bit or self.mine_bits & bit:
+            return []
+        around = self._dilate(bit) & ~bit
+        if _popcount(around & self.flag_bits) != self.count(row, col):
+            return []
+        targets = around & ~self.revealed_bits & ~self.flag_bits
+        hit = targets & self.mine_bits
+        opened = self.indices(self._flood(targets & ~hit)) if targets & ~hit else []
+        if hit:
+            # Прапорці стояли не там: відкриваємо міни і програємо
+            self.revealed_bits |= hit
+            mines = self.indices(hit)
+            self.exploded = mines[-1]
+            self.lost = True
+            opened.extend(mines)
+        return opened
+
+    def wrong_flags(self):
+        """Індекси прапорців, під якими немає міни."""
+        return self.indices(self.flag_bits & ~self.mine_bits)
+
+    def is_won(self):
+        """Перемога: усі безпечні клітинки відкриті, а міни позначені прапорцями."""
+        mine = self.mine_bits
+        return (not self.lost and self.revealed_bits | mine == self.full
+                and (self.flag_bits | self.revealed_bits) & mine == mine)
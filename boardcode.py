@@ -0,0 +1,67 @@
+"""Короткі коди полів, якими можна поділитися.
+
+Код містить rows, cols, кількість мін і seed (varint), для
+непрямокутного поля - ще номер топології, та байт контрольної суми,
+записані в base32 Крокфорда, наприклад "AB3DE-FG4HJ-K5MNP". Поле
+відновлюється через Board.place_mines(seed=...), тож сам код і є
+розкладкою мін. Коди прямокутних полів такі самі, як до появи топологій.
+"""
+import zlib
+
+from movelog import read_varint, write_varint
+from topology import TOPOLOGIES
+
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+# Символи, які легко сплутати при ручному введенні
+ALIASES = {"O": "0", "I": "1", "L": "1"}
+
+
+def encode(rows, cols, mines, seed, topology="rect"):
+    """Повертає код поля, розбитий дефісами на групи по 5 символів."""
+    data = bytearray()
+    values = [rows, cols, mines, seed]
+    if topology != "rect":
+        values.append(TOPOLOGIES.index(topology))
+    for value in values:
+        write_varint(data, value)
+    data.append(zlib.crc32(data) & 0xFF)
+    # Перший байт (rows >= 1) ненульовий, тож довжина відновлюється з числа
+    value = int.from_bytes(data, "big")
+    chars = []
+    while value:
+        value, digit = divmod(value, 32)
+        chars.append(ALPHABET[digit])
+    code = "".join(reversed(chars))
+    return "-".join(code[i:i + 5] for i in range(0, len(code), 5))
+
+
+def decode(code):
+    """Повертає (rows, cols, mines, seed, topology); некоректний код - ValueError."""
+    value = 0
+    for char in code.upper():
+        if char in "- ":
+            continue
+        char = ALIASES.get(char, char)
+        if char not in ALPHABET:
+            raise ValueError(f"Недопустимий символ у коді поля: {char}")
+        value = value * 32 + ALPHABET.index(char)
+    data = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    if len(data) < 5 or zlib.crc32(data[:-1]) & 0xFF != data[-1]:
+        raise ValueError("Невірний код поля")
+    values = []
+    pos = 0
+    try:
+        for _ in range(4):
+            number, pos = read_varint(data, pos)
+            values.append(number)
+        topology = 0
+        if pos < len(data) - 1:
+            topology, pos = read_varint(data, pos)
+    except IndexError:
+        raise ValueError("Невірний код поля") from None
+    if pos != len(data) - 1 or topology >= len(TOPOLOGIES):
+        raise ValueError("Невірний код поля")
+    rows, cols, mines, seed = values
+    if not (rows and cols and 0 <= mines < rows * cols):
+        raise ValueError("Невірний код поля")
+    return rows, cols, mines, seed, TOPOLOGIES[topology]
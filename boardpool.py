@@ -0,0 +1,70 @@
+"""Пул заздалегідь згенерованих полів.
+
+Поки гравець думає, пул у простої Tk (after_idle) готує наступні поля для
+поточного рівня, тож перезапуск лише бере готове поле. За один виклик
+генерується одне поле, щоб не затримувати обробку подій. Зміна рівня
+(configure з іншим ключем) відкидає готові поля і запускає поповнення для
+нового рівня.
+
+Без Tk (root=None) пул поповнюється одразу.
+"""
+import collections
+
+POOL_DEPTH = 2
+
+
+class BoardPool:
+    """Черга готових полів одного рівня з лічильниками влучань і промахів."""
+
+    def __init__(self, factory, depth=POOL_DEPTH, root=None):
+        self.factory = factory  # factory(key) -> нове поле рівня key
+        self.depth = depth
+        self.root = root
+        self.key = None
+        self.boards = collections.deque()
+        self.hits = 0
+        self.misses = 0
+        self._after_id = None
+
+    def configure(self, key):
+        """Задає рівень (будь-який хешований ключ); поля іншого рівня відкидаються."""
+        if key != self.key:
+            self.key = key
+            self.boards.clear()
+        self.schedule()
+
+    def take(self):
+        """Готове поле поточного рівня або, якщо пул порожній, нове."""
+        if self.boards:
+            self.hits += 1
+            board = self.boards.popleft()
+        else:
+            self.misses += 1
+            board = self.factory(self.key)
+        self.schedule()
+        return board
+
+    def schedule(self):
+        """Планує поповнення до depth полів; без Tk поповнює одразу."""
+        if len(self.boards) >= self.depth:
+            return
+        if self.root is None:
+            while len(self.boards) < self.depth:
+                self.boards.append(self.factory(self.key))
+        elif self._after_id is None:
+            self._after_id = self.root.after_idle(self._refill_step)
+
+    def _refill_step(self):
+        self._after_id = None
+        if len(self.boards) < self.depth:
+            self.boards.append(self.factory(self.key))
+            self.schedule()
+
+    def cancel(self):
+        """Скасовує заплановане поповнення (при закритті вікна)."""
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
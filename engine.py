@@ -0,0 +1,434 @@
+"""Безголовий рушій гри «Мінер», який не залежить від Tk.
+
+Увесь стан поля зберігається у плоских масивах довжиною rows*cols, де
+клітинка (row, col) має індекс row*cols + col. Інтерфейс лише спостерігає
+за рушієм: кожна операція повертає список індексів, які треба перемалювати.
+
+Якщо встановлено NumPy, генерація великих полів векторизується; інакше
+використовується реалізація на чистому Python. NumPy імпортується лише
+при першому такому полі (атрибут модуля np теж завантажує його), бо
+імпорт коштує більше, ніж генерація звичайного поля гри.
+
+Поле з seed будується власним генератором SplitMix64, тому розкладка мін
+однакова на будь-якій версії Python і з будь-яким бекендом (NumPy рахує
+ту саму вибірку векторно).
+
+Сусідів клітинки задає топологія поля (topology.py): прямокутне, тор,
+шестикутне або хід коня. Числа, каскад і розв'язувач беруть їх з
+кешованої таблиці суміжності, а не рахують межі у внутрішніх циклах.
+Виняток - велике прямокутне поле (від NUMPY_MIN_CELLS клітинок): воно
+буває на мільйони клітинок, тож сусіди рахуються за межами поля на місці.
+"""
+import random
+
+from topology import adjacency
+
+MASK64 = (1 << 64) - 1
+
+# З якої кількості клітинок бекенд за замовчуванням - NumPy
+NUMPY_MIN_CELLS = 1024
+
+_numpy = False  # False - ще не імпортовано, None - NumPy не встановлено
+
+
+def load_numpy():
+    """Модуль numpy (імпортується при першому виклику) або None."""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:  # NumPy необов'язковий
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def __getattr__(name):
+    if name == "np":
+        return load_numpy()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Рівень складності: (розмір поля, кількість мін)
+DIFFICULTY_SETTINGS = {
+    "Легкий": (10, 10),
+    "Середній": (12, 20),
+    "Важкий": (16, 40)
+}
+
+
+class SplitMix64:
+    """Швидкий детермінований генератор псевдовипадкових чисел (64 біти)."""
+
+    def __init__(self, seed):
+        self.state = seed & MASK64
+
+    def next(self):
+        self.state = (self.state + 0x9E3779B97F4A7C15) & MASK64
+        z = self.state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        return z ^ (z >> 31)
+
+    def below(self, n):
+        """Випадкове число з діапазону [0, n) (множення зі зсувом)."""
+        return (self.next() * n) >> 64
+
+
+def new_seed():
+    """Новий випадковий seed для поля (32 біти, щоб код поля був коротким)."""
+    return random.getrandbits(32)
+
+
+def seeded_sample(seed, population, k):
+    """k різних чисел з range(population): частковий Фішер-Йєтс за seed."""
+    rng = SplitMix64(seed)
+    swaps = {}
+    result = []
+    for i in range(k):
+        j = i + rng.below(population - i)
+        result.append(swaps.get(j, j))
+        swaps[j] = swaps.get(i, i)
+    return result
+
+
+class Board:
+    """Поле гри: міни, числа, відкриті клітинки та прапорці."""
+
+    def __init__(self, rows, cols, mines, backend=None, topology="rect"):
+        if not 0 <= mines < rows * cols:
+            raise ValueError("Кількість мін має бути меншою за кількість клітинок")
+        if backend is None:
+            large = rows * cols >= NUMPY_MIN_CELLS
+            backend = "numpy" if large and load_numpy() is not None else "python"
+        elif backend == "numpy" and load_numpy() is None:
+            raise ValueError("NumPy не встановлено")
+        self.rows = rows
+        self.cols = cols
+        self.mines = mines
+        self.cells = rows * cols
+        self.backend = backend
+        self.topology = topology
+        # Велике прямокутне поле обходиться без таблиці сусідів (межі
+        # рахуються на місці): на мільйоні клітинок вона займає сотні мегабайтів
+        self.use_table = topology != "rect" or self.cells < NUMPY_MIN_CELLS
+        self._table = None
+        self.seed = None
+        self.reset()
+
+    def reset(self):
+        """Очищає поле без розміщення мін."""
+        self.mine = bytearray(self.cells)
+        self.counts = bytearray(self.cells)
+        self.restart()
+
+    def restart(self):
+        """Закриває всі клітинки та знімає прапорці, зберігаючи міни."""
+        self.revealed = bytearray(self.cells)
+        self.flagged = bytearray(self.cells)
+        self.exploded = -1
+        self.lost = False
+        # Лічильники для перевірки перемоги за O(1)
+        self.safe_left = self.cells - self.mines
+        self.mines_left = self.mines
+
+    def index(self, row, col):
+        return row * self.cols + col
+
+    def coords(self, index):
+        return divmod(index, self.cols)
+
+    @property
+    def table(self):
+        """Сусіди кожної клітинки: table[index] (будується при першому зверненні).
+
+        Для малих полів - кортежі, для великих - сама CSR-таблиця, яка
+        віддає зрізи масиву без мільйонів кортежів.
+        """
+        if self._table is None:
+            graph = adjacency(self.topology, self.rows, self.cols)
+            self._table = graph.table if self.cells < NUMPY_MIN_CELLS else graph
+        return self._table
+
+    def neighbours(self, index):
+        """Повертає індекси сусідніх клітинок (без самої клітинки)."""
+        if self.use_table:
+            return self.table[index]
+        row, col = divmod(index, self.cols)
+        result = []
+        for r in range(max(0, row - 1), min(self.rows, row + 2)):
+            base = r * self.cols
+            for c in range(max(0, col - 1), min(self.cols, col + 2)):
+                if r != row or c != col:
+                    result.append(base + c)
+        return result
+
+    # Генерація поля
+
+    def place_mines(self, rng=None, seed=None):
+        """Розміщує міни на випадкових позиціях (вибірка без повторень).
+
+        rng може бути random.Random або numpy.random.Generator. Якщо задано
+        seed, розкладка повністю визначається seed, розміром і кількістю мін.
+        """
+        self.reset()
+        self.seed = seed
+        if seed is not None and self.backend == "numpy":
+            np = load_numpy()
+            mine = np.zeros(self.cells, dtype=np.uint8)
+            mine[_numpy_seeded_sample(seed, self.cells, self.mines)] = 1
+            self.mine = bytearray(mine.tobytes())
+            return
+        if seed is not None:
+            for index in seeded_sample(seed, self.cells, self.mines):
+                self.mine[index] = 1
+            return
+        if self.backend == "numpy" and not isinstance(rng, random.Random):
+            np = load_numpy()
+            generator = rng if rng is not None else np.random.default_rng()
+            mine = np.zeros(self.cells, dtype=np.uint8)
+            mine[generator.choice(self.cells, self.mines, replace=False)] = 1
+            self.mine = bytearray(mine.tobytes())
+            return
+        for index in (rng or random).sample(range(self.cells), self.mines):
+            self.mine[index] = 1
+
+    def clear_start(self, index, area=True):
+        """Прибирає міни з першої відкритої клітинки (і, якщо area, з її сусідів).
+
+        Кожна міна з цієї зони переноситься у випадкову вільну клітинку поза
+        нею (за seed поля, якщо він є), а числа змінюються лише навколо
+        старої і нової позиції. Повертає список перенесень (звідки, куди).
+        """
+        zone = {index}
+        if area:
+            zone.update(self.neighbours(index))
+            if self.cells - len(zone) < self.mines:
+                zone = {index}  # Поле надто щільне для вільної області 3x3
+        moving = sorted(i for i in zone if self.mine[i])
+        if not moving:
+            return []
+        rng = SplitMix64(self.seed ^ index << 32) if self.seed is not None else None
+        free = [i for i in range(self.cells) if not self.mine[i] and i not in zone]
+        counts = self.counts
+        moved = []
+        for old in moving:
+            j = rng.below(len(free)) if rng else random.randrange(len(free))
+            new = free[j]
+            free[j] = free[-1]
+            free.pop()
+            self.mine[old] = 0
+            self.mine[new] = 1
+            # Прапорці могли стояти ще до першого ходу: лічильник знайдених мін
+            # має враховувати міну під прапорцем на новому місці, а не на старому
+            self.mines_left += self.flagged[old] - self.flagged[new]
+            for n in self.neighbours(old):
+                counts[n] -= 1
+            for n in self.neighbours(new):
+                counts[n] += 1
+            moved.append((old, new))
+        return moved
+
+    def update_numbers(self):
+        """Оновлює кількість мін навколо кожної клітинки."""
+        if self.backend == "numpy":
+            if self.topology == "rect":
+                counts = _numpy_counts(self.mine, self.rows, self.cols)
+            else:
+                counts = _numpy_table_counts(self.mine, adjacency(self.topology, self.rows, self.cols))
+            self.counts = bytearray(counts.tobytes())
+            return
+        # Кожна міна додає одиницю своїм сусідам: O(кількість мін)
+        counts = bytearray(self.cells)
+        neighbours = self.table.__getitem__ if self.use_table else self.neighbours
+        for index in self.mine_indices():
+            for n in neighbours(index):
+                counts[n] += 1
+        self.counts = counts
+
+    # Запити стану
+
+    def is_mine(self, row, col):
+        return bool(self.mine[row * self.cols + col])
+
+    def is_revealed(self, row, col):
+        return bool(self.revealed[row * self.cols + col])
+
+    def is_flagged(self, row, col):
+        return bool(self.flagged[row * self.cols + col])
+
+    def count(self, row, col):
+        return self.counts[row * self.cols + col]
+
+    def mine_indices(self):
+        return [i for i, m in enumerate(self.mine) if m]
+
+    def flagged_indices(self):
+        return [i for i, f in enumerate(self.flagged) if f]
+
+    # Ходи гравця
+
+    def reveal(self, row, col):
+        """Відкриває клітинку; нуль розкриває всю сусідню область.
+
+        Повертає список щойно відкритих індексів. Відкриття міни позначає
+        програш і повертає лише саму міну.
+        """
+        index = row * self.cols + col
+        if self.revealed[index] or self.flagged[index]:
+            return []
+        if self.mine[index]:
+            self.revealed[index] = 1
+            self.mines_left -= 1
+            self.exploded = index
+            self.lost = True
+            return [index]
+        return self._flood(index)
+
+    def _flood(self, start):
+        """Ітеративно відкриває область навколо start і повертає відкриті індекси.
+
+        Сусіди нульової клітинки ніколи не бувають мінами, тому перевіряти
+        міни всередині циклу не потрібно.
+        """
+        if not self.use_table:
+            return self._flood_rect(start)
+        table = self.table
+        revealed, flagged, counts = self.revealed, self.flagged, self.counts
+        revealed[start] = 1
+        opened = [start]
+        stack = [start] if counts[start] == 0 else []
+        while stack:
+            for n in table[stack.pop()]:
+                if revealed[n] or flagged[n]:
+                    continue
+                revealed[n] = 1
+                opened.append(n)
+                if counts[n] == 0:
+                    stack.append(n)
+        self.safe_left -= len(opened)
+        return opened
+
+    def _flood_rect(self, start):
+        """Те саме, що _flood, з межами прямокутного поля замість таблиці."""
+        rows, cols = self.rows, self.cols
+        revealed, flagged, counts = self.revealed, self.flagged, self.counts
+        revealed[start] = 1
+        opened = [start]
+        stack = [start] if counts[start] == 0 else []
+        while stack:
+            row, col = divmod(stack.pop(), cols)
+            for r in range(max(0, row - 1), min(rows, row + 2)):
+                base = r * cols
+                for c in range(max(0, col - 1), min(cols, col + 2)):
+                    n = base + c
+                    if revealed[n] or flagged[n]:
+                        continue
+                    revealed[n] = 1
+                    opened.append(n)
+                    if counts[n] == 0:
+                        stack.append(n)
+        self.safe_left -= len(opened)
+        return opened
+
+    def toggle_flag(self, row, col):
+        """Ставить або знімає прапорець. Повертає новий стан або None."""
+        index = row * self.cols + col
+        if self.revealed[index]:
+            return None
+        flagged = self.flagged[index] ^ 1
+        self.flagged[index] = flagged
+        if self.mine[index]:
+            self.mines_left += -1 if flagged else 1
+        return bool(flagged)
+
+    def chord(self, row, col):
+        """Відкриває всіх сусідів числа, якщо навколо стоїть рівно стільки ж прапорців."""
+        index = row * self.cols + col
+        if not self.revealed[index] or self.mine[index]:
+            return []
+        around = self.neighbours(index)
+        if sum(self.flagged[n] for n in around) != self.counts[index]:
+            return []
+        opened = []
+        for n in around:
+            r, c = divmod(n, self.cols)
+            opened.extend(self.reveal(r, c))
+        return opened
+
+    def is_won(self):
+        """Перемога: усі безпечні клітинки відкриті, а міни позначені прапорцями."""
+        return not self.lost and self.safe_left == 0 and self.mines_left == 0
+
+
+def neighbour_table(rows, cols, topology="rect"):
+    """Кортеж сусідів для кожної клітинки поля rows x cols (обчислюється один раз)."""
+    return adjacency(topology, rows, cols).table
+
+
+def _numpy_counts(mine, rows, cols):
+    """Сума восьми зсунутих копій поля з рамкою з нулів."""
+    np = load_numpy()
+    padded = np.pad(np.frombuffer(bytes(mine), dtype=np.uint8).reshape(rows, cols), 1)
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr != 1 or dc != 1:
+                counts += padded[dr:dr + rows, dc:dc + cols]
+    return counts
+
+
+def _numpy_table_counts(mine, graph):
+    """Числа для будь-якої топології: кожна міна додає одиницю сусідам з CSR-таблиці."""
+    np = load_numpy()
+    dtype = np.dtype(f"i{graph.targets.itemsize}")  # Масиви CSR читаються без копії
+    offsets = np.frombuffer(graph.offsets, dtype=dtype)
+    targets = np.frombuffer(graph.targets, dtype=dtype)
+    mine = np.frombuffer(bytes(mine), dtype=bool)
+    from_mine = np.repeat(mine, np.diff(offsets))  # Для кожного запису: чи джерело - міна
+    return np.bincount(targets[from_mine], minlength=len(mine)).astype(np.uint8)
+
+
+def _numpy_seeded_sample(seed, population, k):
+    """Те саме, що seeded_sample(seed, population, k), але без циклу Python.
+
+    Потік SplitMix64 лічильниковий, тож усі j_i = i + below(population - i)
+    рахуються одразу (старші 64 біти добутку - через половинки по 32 біти).
+    Обміни Фішера-Йєтса розплутуються так: крок i бере значення, яке
+    поклав у клітинку j_i останній попередній крок з тим самим j, а крок s
+    кладе туди те, що лежало на позиції s, - тобто s, якщо жоден ранніший
+    крок не мав j = s, інакше (ланцюжком) значення того кроку. Ланцюжки
+    проходимо подвоєнням вказівників.
+    """
+    np = load_numpy()
+    u64 = np.uint64
+    step = np.arange(k, dtype=u64)
+    z = u64(seed & MASK64) + (step + u64(1)) * u64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> u64(30))) * u64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> u64(27))) * u64(0x94D049BB133111EB)
+    z ^= z >> u64(31)
+    span = u64(population) - step
+    high = ((z >> u64(32)) * span + (((z & u64(0xFFFFFFFF)) * span) >> u64(32))) >> u64(32)
+    step = step.astype(np.int64)
+    target = step + high.astype(np.int64)
+
+    # Кроки, впорядковані за (j, i): попередній крок з тим самим j - сусід зліва
+    keys = target * k + step
+    keys.sort()
+    order = keys % k
+    sorted_target = keys // k
+    previous = np.full(k, -1, dtype=np.int64)
+    same = sorted_target[1:] == sorted_target[:-1]
+    previous[order[1:][same]] = order[:-1][same]
+
+    # Останній крок r < i з j_r = i (усі такі r <= i, бо j_r >= r)
+    sizes = np.bincount(target[target < k], minlength=k)
+    last = np.cumsum(sizes) - 1 - (target == step)
+    writer = np.where(last >= np.cumsum(sizes) - sizes, order[np.maximum(last, 0)], -1)
+    value_at = np.where(writer >= 0, writer, step)
+    while True:
+        jumped = value_at[value_at]
+        if np.array_equal(jumped, value_at):
+            break
+        value_at = jumped
+    return np.where(previous >= 0, value_at[np.maximum(previous, 0)], target)
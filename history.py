@@ -0,0 +1,126 @@
+"""Віртуалізований список історії ігор.
+
+У tk.Listbox завжди лише ті рядки, що вміщуються на екрані. Скролбар
+відображає позицію у всій таблиці, а під час прокрутки з бази читаються
+тільки рядки, що з'явилися у вікні. Загальна кількість береться зі
+зведеної статистики (stats_summary), а стрибок повзунком шукає рядок за
+id, тож жоден запит не проходить усю таблицю.
+"""
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+
+import storage
+
+
+def format_game(row):
+    return f"Дата: {row[1]}, Результат: {row[2]}, Складність: {row[3]}"
+
+
+class HistoryView:
+    """Список історії, який читає з БД лише видиме вікно рядків."""
+
+    def __init__(self, master, conn, bg, fg, on_open=None):
+        self.conn = conn
+        self.on_open = on_open  # Викликається з id гри при подвійному кліку
+        self.total = 0
+        self.offset = 0     # Позиція першого видимого рядка
+        self.visible = 20
+        self.rows = []      # Видимі рядки (id, date, result, difficulty)
+
+        self.listbox = tk.Listbox(
+            master,
+            bg=bg,
+            fg=fg,
+            borderwidth=0,
+            highlightthickness=0,
+            font=("Arial", 10)
+        )
+        self.listbox.pack(side='left', fill='both', expand=True)
+        self.linespace = tkfont.Font(font=self.listbox.cget("font")).metrics("linespace")
+
+        self.scrollbar = ttk.Scrollbar(master, orient="vertical", command=self._on_scroll)
+        self.scrollbar.pack(side='right', fill='y')
+
+        self.listbox.bind("<Configure>", self._on_resize)
+        self.listbox.bind("<MouseWheel>", lambda event: self.scroll(-1 if event.delta > 0 else 1))
+        self.listbox.bind("<Button-4>", lambda event: self.scroll(-1))
+        self.listbox.bind("<Button-5>", lambda event: self.scroll(1))
+        for key, delta in (("<Up>", -1), ("<Down>", 1)):
+            self.listbox.bind(key, lambda event, d=delta: self.scroll(d) or "break")
+        self.listbox.bind("<Prior>", lambda event: self.scroll(-self.visible) or "break")
+        self.listbox.bind("<Next>", lambda event: self.scroll(self.visible) or "break")
+        self.listbox.bind("<Double-Button-1>", self._on_open)
+
+    def refresh(self):
+        """Перечитує кількість ігор і поточне вікно рядків."""
+        self.total = storage.count_games(self.conn)
+        self.offset = max(0, min(self.offset, self.total - self.visible))
+        self._load_at(self.offset)
+
+    def add_game(self, row):
+        """Додає щойно збережену гру без повного перечитування."""
+        self.total += 1
+        if self.offset == 0:
+            self.rows = ([row] + self.rows)[:self.visible]
+            self._render()
+        else:
+            # Нова гра з'явилася вище видимого вікна
+            self.offset += 1
+            self._update_scrollbar()
+
+    def scroll(self, delta):
+        """Прокручує на delta рядків, дочитуючи лише нові рядки за ключем."""
+        target = max(0, min(self.offset + delta, self.total - self.visible))
+        delta = target - self.offset
+        if delta == 0:
+            return
+        if abs(delta) >= self.visible or not self.rows:
+            self._load_at(target)
+            return
+        if delta > 0:
+            extra = storage.fetch_games_before(self.conn, self.rows[-1][0], delta)
+            self.rows = (self.rows + extra)[delta:]
+        else:
+            extra = storage.fetch_games_after(self.conn, self.rows[0][0], -delta)
+            self.rows = (extra + self.rows)[:self.visible]
+        self.offset = target
+        self._render()
+
+    def _load_at(self, offset):
+        if offset == 0:
+            self.rows = storage.fetch_games_before(self.conn, None, self.visible)
+        else:
+            self.rows = storage.fetch_games_at(self.conn, offset, self.visible)
+        self.offset = offset
+        self._render()
+
+    def _render(self):
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, *[format_game(row) for row in self.rows])
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        if self.total:
+            self.scrollbar.set(self.offset / self.total, (self.offset + len(self.rows)) / self.total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            target = int(float(amount) * self.total)
+            self.scroll(target - self.offset)
+        elif action == "scroll":
+            step = self.visible if unit == "pages" else 1
+            self.scroll(int(amount) * step)
+
+    def _on_open(self, event):
+        selection = self.listbox.curselection()
+        if self.on_open and selection and selection[0] < len(self.rows):
+            self.on_open(self.rows[selection[0]][0])
+
+    def _on_resize(self, event):
+        visible = max(1, event.height // (self.linespace + 1))
+        if visible != self.visible:
+            self.visible = visible
+            self.refresh()
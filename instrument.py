@@ -0,0 +1,130 @@
+"""Необов'язкове вимірювання затримки обробників подій Tk.
+
+Вмикається змінною середовища MINER_TRACE=шлях/trace.json. Тоді обробники
+гри (left_click, toggle_theme, timer_tick, ...) замінюються на екземплярі
+обгортками, а інтерпретатор Tcl - лічильником викликів. Кожен виклик
+записується в кільцевий буфер: час початку, тривалість, кількість
+викликів Tcl і розмір каскаду відкриття. При закритті гри буфер
+зберігається як Chrome trace (chrome://tracing, Perfetto), а в консоль
+друкується гістограма затримок.
+
+Без MINER_TRACE нічого не встановлюється, тож вимкнене вимірювання не
+коштує нічого, крім однієї перевірки self.tracer у show_revealed.
+"""
+import collections
+import functools
+import json
+import os
+import time
+
+# Бюджет одного кадру (60 Гц), мс
+FRAME_BUDGET_MS = 16
+HISTOGRAM_BOUNDS_MS = [1, 2, 4, 8, 16, 33, 100]
+
+
+class TclCounter:
+    """Обгортка над інтерпретатором Tcl (root.tk), яка рахує call і eval."""
+
+    def __init__(self, tkapp):
+        self._tkapp = tkapp
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tkapp.call(*args)
+
+    def eval(self, script):
+        self.calls += 1
+        return self._tkapp.eval(script)
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+
+class Tracer:
+    """Кільцевий буфер подій з експортом у Chrome trace і гістограму."""
+
+    def __init__(self, capacity=65536, budget_ms=FRAME_BUDGET_MS):
+        self.events = collections.deque(maxlen=capacity)
+        self.budget_ns = budget_ms * 1_000_000
+        self.counter = None
+        self.origin = time.perf_counter_ns()
+        self._notes = []  # Стек приміток для вкладених викликів
+
+    def install(self, root, target, names):
+        """Обгортає методи names об'єкта target; перший виклик підміняє root.tk.
+
+        Викликати до створення віджетів: вони копіюють root.tk і вже
+        прив'язані методи під час створення.
+        """
+        if self.counter is None:
+            self.counter = TclCounter(root.tk)
+            root.tk = self.counter
+        for name in names:
+            setattr(target, name, self.wrap(name, getattr(target, name)))
+
+    def wrap(self, name, callback):
+        @functools.wraps(callback)
+        def traced(*args, **kwargs):
+            notes = {}
+            self._notes.append(notes)
+            calls = self.counter.calls if self.counter else 0
+            start = time.perf_counter_ns()
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                duration = time.perf_counter_ns() - start
+                self._notes.pop()
+                tcl_calls = (self.counter.calls if self.counter else 0) - calls
+                self.events.append((name, start - self.origin, duration, tcl_calls, notes))
+        return traced
+
+    def note(self, **values):
+        """Додає значення (наприклад, розмір каскаду) до поточної події."""
+        if self._notes:
+            self._notes[-1].update(values)
+
+    def chrome_trace(self):
+        """Події у форматі Chrome trace-event (повні події "X", час у мкс)."""
+        pid = os.getpid()
+        events = []
+        for name, start, duration, tcl_calls, notes in self.events:
+            args = {"tcl_calls": tcl_calls, **notes}
+            if duration > self.budget_ns:
+                args["over_budget"] = True
+            events.append({
+                "name": name, "ph": "X", "pid": pid, "tid": 1,
+                "ts": start / 1000, "dur": duration / 1000, "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path):
+        with open(path, "w", encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f, ensure_ascii=False)
+
+    def summary(self):
+        """Текстова гістограма затримок для кожного обробника."""
+        durations = collections.defaultdict(list)
+        for name, _, duration, _, _ in self.events:
+            durations[name].append(duration / 1_000_000)
+        labels = [f"<{bound}" for bound in HISTOGRAM_BOUNDS_MS] + [f">={HISTOGRAM_BOUNDS_MS[-1]}"]
+        lines = [f"{'обробник':20} {'N':>6} {'p50':>7} {'p95':>7} {'max':>8} {'>бюджет':>8}  "
+                 + " ".join(f"{label:>6}" for label in labels)]
+        budget_ms = self.budget_ns / 1_000_000
+        for name, values in sorted(durations.items()):
+            values.sort()
+            buckets = [0] * len(labels)
+            for value in values:
+                buckets[next((i for i, bound in enumerate(HISTOGRAM_BOUNDS_MS) if value < bound),
+                             len(HISTOGRAM_BOUNDS_MS))] += 1
+            over = sum(value > budget_ms for value in values)
+            lines.append(
+                f"{name:20} {len(values):6} {values[len(values) // 2]:7.2f} "
+                f"{values[min(len(values) - 1, int(len(values) * 0.95))]:7.2f} {values[-1]:8.2f} {over:8}  "
+                + " ".join(f"{count:6}" for count in buckets))
+        return "\n".join(lines)
+
+
+def from_environment():
+    """Tracer, якщо задано MINER_TRACE, інакше None."""
+    return Tracer() if os.environ.get("MINER_TRACE") else None
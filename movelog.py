@@ -0,0 +1,118 @@
+"""Компактний двійковий запис ходів гри та їх повторення.
+
+Формат (усі числа - varint без знаку):
+
+    версія, rows, cols, топологія (номер у topology.TOPOLOGIES),
+    кількість мін, індекси мін (різниці між сусідніми),
+    далі для кожного ходу: dt (мс від попереднього ходу), cell * 4 + op
+
+Розкладка мін зберігається в заголовку, тож гру можна відтворити без
+генератора поля. Заголовок пишеться в encode(), бо перший хід може
+перенести міни (Board.clear_start). Типова гра займає кілька сотень
+байтів.
+"""
+import time
+
+from engine import Board
+from topology import TOPOLOGIES
+
+VERSION = 1
+
+OP_REVEAL = 0
+OP_FLAG = 1
+OP_CHORD = 2
+
+
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    """Повертає (значення, нова позиція)."""
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+class MoveLog:
+    """Запис ходів однієї гри."""
+
+    def __init__(self, board):
+        self.board = board
+        self.data = bytearray()
+        self.moves = 0
+        self.last_time = None
+
+    def record(self, op, index, now=None):
+        now = time.monotonic() if now is None else now
+        dt = 0 if self.last_time is None else int((now - self.last_time) * 1000)
+        self.last_time = now
+        write_varint(self.data, dt)
+        write_varint(self.data, index << 2 | op)
+        self.moves += 1
+
+    def encode(self):
+        header = bytearray()
+        write_varint(header, VERSION)
+        write_varint(header, self.board.rows)
+        write_varint(header, self.board.cols)
+        write_varint(header, TOPOLOGIES.index(self.board.topology))
+        mines = self.board.mine_indices()
+        write_varint(header, len(mines))
+        previous = 0
+        for index in mines:
+            write_varint(header, index - previous)
+            previous = index
+        return bytes(header + self.data)
+
+
+def decode(data):
+    """Повертає (board, moves): поле з мінами та список ходів (dt, op, cell)."""
+    version, pos = read_varint(data, 0)
+    if version != VERSION:
+        raise ValueError(f"Невідома версія запису ходів: {version}")
+    rows, pos = read_varint(data, pos)
+    cols, pos = read_varint(data, pos)
+    topology, pos = read_varint(data, pos)
+    count, pos = read_varint(data, pos)
+    board = Board(rows, cols, count, backend="python", topology=TOPOLOGIES[topology])
+    index = 0
+    for _ in range(count):
+        delta, pos = read_varint(data, pos)
+        index += delta
+        board.mine[index] = 1
+    board.update_numbers()
+    moves = []
+    while pos < len(data):
+        dt, pos = read_varint(data, pos)
+        packed, pos = read_varint(data, pos)
+        moves.append((dt, packed & 3, packed >> 2))
+    return board, moves
+
+
+def apply_move(board, op, index):
+    """Виконує один хід на полі і повертає відкриті клітинки."""
+    row, col = board.coords(index)
+    if op == OP_REVEAL:
+        return board.reveal(row, col)
+    if op == OP_FLAG:
+        board.toggle_flag(row, col)
+    elif op == OP_CHORD:
+        return board.chord(row, col)
+    return []
+
+
+def replay(data, upto=None):
+    """Відтворює гру без інтерфейсу до ходу upto (або до кінця) і повертає поле."""
+    board, moves = decode(data)
+    for _, op, index in moves[:upto]:
+        apply_move(board, op, index)
+    return board
@@ -0,0 +1,223 @@
+"""Генератор полів, які можна пройти без вгадування.
+
+Кандидат - це seed (див. Board.place_mines). Гра починається з нульової
+клітинки, найближчої до центру (start_cell); кандидат приймається, якщо
+solver.solve, починаючи з неї, відкриває все поле без жодного вгадування.
+Оскільки поле повністю задається seed, прийняте поле має звичайний код
+поля, а кеш на диску зберігає лише числа.
+
+Кандидати перевіряються пакетами на concurrent.futures.ProcessPoolExecutor.
+Пакети йдуть по черзі, тож результат не залежить від кількості процесів.
+Модуль concurrent.futures імпортується лише тоді, коли потрібен пул: гра
+імпортує noguess під час запуску.
+"""
+import collections
+import json
+import os
+import threading
+
+from engine import Board, new_seed
+from settings import write_atomic
+import solver
+
+BATCH_SIZE = 16
+CACHE_DEPTH = 10
+# Гра поповнює кеш, лише коли в ньому лишилося менше полів, і невеликим
+# пулом процесів, щоб не займати всі ядра заради кількох seed
+LOW_WATER = 3
+REFILL_WORKERS = 2
+
+
+def start_cell(board):
+    """Нульова клітинка без міни, найближча до центру поля (або None)."""
+    center_row, center_col = (board.rows - 1) / 2, (board.cols - 1) / 2
+    best = None
+    best_distance = None
+    for index in range(board.cells):
+        if board.mine[index] or board.counts[index]:
+            continue
+        row, col = board.coords(index)
+        distance = (row - center_row) ** 2 + (col - center_col) ** 2
+        if best is None or distance < best_distance:
+            best, best_distance = index, distance
+    return best
+
+
+def solvable(board, start):
+    """Чи відкриває розв'язувач усе поле з клітинки start без вгадування."""
+    board.restart()
+    board.reveal(*board.coords(start))
+    while not board.is_won():
+        safe, mines = solver.solve(board)
+        progress = False
+        for index in safe:
+            if not board.revealed[index]:
+                board.reveal(*board.coords(index))
+                progress = True
+        for index in mines:
+            if not board.flagged[index]:
+                board.toggle_flag(*board.coords(index))
+                progress = True
+        if not progress:
+            break
+    won = board.is_won()
+    board.restart()
+    return won
+
+
+def build(rows, cols, mines, seed, topology="rect"):
+    """Поле за seed (таке саме, як у грі)."""
+    board = Board(rows, cols, mines, backend="python", topology=topology)
+    board.place_mines(seed=seed)
+    board.update_numbers()
+    return board
+
+
+def check_seeds(rows, cols, mines, seeds, topology="rect"):
+    """Seed із пакета, поля яких проходяться без вгадування."""
+    accepted = []
+    for seed in seeds:
+        board = build(rows, cols, mines, seed, topology)
+        start = start_cell(board)
+        if start is not None and solvable(board, start):
+            accepted.append(seed)
+    return accepted
+
+
+def find_seeds(rows, cols, mines, count=1, workers=None, batch_size=BATCH_SIZE, topology="rect"):
+    """Повертає count seed полів без вгадування.
+
+    workers=1 перевіряє кандидатів у поточному процесі, інакше - у пулі
+    процесів (за замовчуванням на всіх ядрах).
+    """
+    base = new_seed()
+
+    def batch(number):
+        start = base + number * batch_size
+        return [(start + i) & 0xFFFFFFFF for i in range(batch_size)]
+
+    found = []
+    if workers == 1:
+        number = 0
+        while len(found) < count:
+            found.extend(check_seeds(rows, cols, mines, batch(number), topology))
+            number += 1
+        return found[:count]
+
+    import concurrent.futures
+
+    workers = workers or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = collections.deque()
+        number = 0
+        while len(found) < count:
+            # Тримаємо кожен процес зайнятим, але результати беремо по порядку
+            while len(pending) < workers * 2:
+                pending.append(pool.submit(check_seeds, rows, cols, mines, batch(number), topology))
+                number += 1
+            found.extend(pending.popleft().result())
+        for future in pending:
+            future.cancel()
+    return found[:count]
+
+
+class BoardCache:
+    """Невеликий кеш seed перевірених полів на диску, окремо для кожного розміру."""
+
+    def __init__(self, path, depth=CACHE_DEPTH, low_water=LOW_WATER):
+        self.path = path
+        self.depth = depth
+        self.low_water = low_water
+        self.seeds = {}
+        self.dirty = False  # Є зміни, яких ще немає на диску
+        self.lock = threading.Lock()
+        self._refilling = set()
+
+    @staticmethod
+    def key(rows, cols, mines, topology="rect"):
+        key = f"{rows}x{cols}x{mines}"
+        return key if topology == "rect" else f"{key}-{topology}"
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding='utf-8') as f:
+                self.seeds = {key: list(value) for key, value in json.load(f).items()}
+        except FileNotFoundError:
+            self.seeds = {}
+        except (json.JSONDecodeError, AttributeError, TypeError) as e:
+            print(f"Помилка завантаження кешу полів: {e}")
+            self.seeds = {}
+
+    def pop(self, rows, cols, mines, topology="rect"):
+        """Бере seed з кешу (None, якщо кеш порожній).
+
+        Лише в пам'яті: на диск кеш пише refill (у фоновому потоці) або save()
+        при закритті гри.
+        """
+        with self.lock:
+            seeds = self.seeds.get(self.key(rows, cols, mines, topology))
+            if not seeds:
+                return None
+            self.dirty = True
+            return seeds.pop(0)
+
+    def missing(self, rows, cols, mines, topology="rect"):
+        with self.lock:
+            return self.depth - len(self.seeds.get(self.key(rows, cols, mines, topology), []))
+
+    def needs_refill(self, rows, cols, mines, topology="rect"):
+        """Чи лишилося в кеші менше за low_water полів цього розміру."""
+        return self.depth - self.missing(rows, cols, mines, topology) < self.low_water
+
+    def add(self, rows, cols, mines, seeds, topology="rect"):
+        with self.lock:
+            self.seeds.setdefault(self.key(rows, cols, mines, topology), []).extend(seeds)
+            self.dirty = True
+        self.save()
+
+    def refill(self, rows, cols, mines, workers=None, topology="rect"):
+        """Догенеровує поля до повного кешу (викликати у фоновому потоці)."""
+        key = self.key(rows, cols, mines, topology)
+        with self.lock:
+            if key in self._refilling:
+                return
+            self._refilling.add(key)
+        try:
+            missing = self.missing(rows, cols, mines, topology)
+            if missing > 0:
+                seeds = find_seeds(rows, cols, mines, missing, workers, topology=topology)
+                self.add(rows, cols, mines, seeds, topology)
+        except Exception as e:
+            print(f"Помилка генерації полів без вгадування: {e}")
+        finally:
+            with self.lock:
+                self._refilling.discard(key)
+
+    def save(self):
+        """Атомарно записує кеш (settings.write_atomic), якщо він змінився."""
+        with self.lock:
+            if not self.dirty:
+                return
+            data = json.dumps(self.seeds)
+            self.dirty = False
+        try:
+            write_atomic(self.path, data, ".noguess-")
+        except Exception as e:
+            print(f"Помилка збереження кешу полів: {e}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from engine import DIFFICULTY_SETTINGS
+
+    parser = argparse.ArgumentParser(description="Заповнення кешу полів без вгадування")
+    parser.add_argument("cache", nargs="?", default="noguess_cache.json", help="шлях до файлу кешу")
+    parser.add_argument("--workers", type=int, default=None, help="кількість процесів")
+    args = parser.parse_args()
+
+    cache = BoardCache(args.cache)
+    cache.load()
+    for name, (size, mines) in DIFFICULTY_SETTINGS.items():
+        cache.refill(size, size, mines, args.workers)
+        print(f"{name}: {len(cache.seeds.get(cache.key(size, size, mines), []))} полів у кеші")
@@ -0,0 +1,196 @@
+"""Точні ймовірності мін для закритих клітинок.
+
+Обмеження з solver.py діляться на незалежні компоненти фронту. Кожна
+компонента рахується динамічним програмуванням по клітинках у порядку
+solver.frontier_order: стан - залишок мін для ще не закритих обмежень, а
+однакові стани зливаються (мемоізація), тож перебір не експоненційний.
+Результат компоненти - поліноми за кількістю мін k: скільки розв'язків
+мають k мін і в скількох з них кожна клітинка - міна.
+
+Компоненти поєднуються з глобальною кількістю мін: розв'язок фронту з K
+мінами має вагу C(U, R - K), де U - закриті клітинки поза фронтом, а R -
+міни, які ще не знайдено. Результати компонент кешуються за їх
+обмеженнями, тож після ходу перераховуються лише змінені компоненти.
+"""
+from math import comb
+
+import solver
+
+
+def _add_shifted(target, poly, shift):
+    """target += poly * x^shift (поліноми - списки коефіцієнтів)."""
+    if len(target) < len(poly) + shift:
+        target.extend([0] * (len(poly) + shift - len(target)))
+    for k, value in enumerate(poly):
+        target[k + shift] += value
+
+
+def _convolve(a, b):
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+def count_component(group):
+    """Рахує розв'язки компоненти.
+
+    Повертає (клітинки, totals, marginals): totals[k] - кількість розв'язків
+    з k мінами, marginals[j][k] - скільки з них мають міну в клітинці j.
+    """
+    order = solver.frontier_order(group)
+    size = len(order)
+    position = {cell: i for i, cell in enumerate(order)}
+    members = [sorted(position[cell] for cell in cells) for cells, _ in group]
+    start_need = [remaining for _, remaining in group]
+
+    # Для кожної позиції: обмеження, що її містять, і скільки їх клітинок лишається після неї
+    touching = [[] for _ in range(size)]
+    for ci, positions in enumerate(members):
+        for rank, p in enumerate(positions):
+            touching[p].append((ci, len(positions) - rank - 1))
+    # active[i] - обмеження, розпочаті до позиції i і ще не закриті
+    active = [tuple(ci for ci, positions in enumerate(members) if positions[0] < i <= positions[-1])
+              for i in range(size + 1)]
+
+    def step(i, state, value):
+        needs = dict(zip(active[i], state))
+        for ci, after in touching[i]:
+            rest = needs.get(ci, start_need[ci]) - value
+            if rest < 0 or rest > after:
+                return None
+            needs[ci] = rest
+        return tuple(needs[ci] for ci in active[i + 1])
+
+    # Прямий прохід: способи дійти до стану з k мінами
+    forward = [{(): [1]}]
+    transitions = []
+    for i in range(size):
+        following = {}
+        moves = {}
+        for state, poly in forward[i].items():
+            targets = (step(i, state, 0), step(i, state, 1))
+            moves[state] = targets
+            for value, target in enumerate(targets):
+                if target is not None:
+                    _add_shifted(following.setdefault(target, []), poly, value)
+        forward.append(following)
+        transitions.append(moves)
+
+    # Зворотний прохід: способи завершити розстановку зі стану
+    backward = {(): [1]}
+    marginals = [None] * size
+    for i in reversed(range(size)):
+        current = {}
+        as_mine = []
+        for state, (empty, mine) in transitions[i].items():
+            poly = []
+            if empty in backward:
+                _add_shifted(poly, backward[empty], 0)
+            if mine in backward:
+                _add_shifted(poly, backward[mine], 1)
+                _add_shifted(as_mine, _convolve(forward[i][state], backward[mine]), 1)
+            if poly:
+                current[state] = poly
+        marginals[i] = as_mine
+        backward = current
+    return order, backward.get((), []), marginals
+
+
+class ProbabilityEngine:
+    """Обчислює ймовірності мін і кешує результати компонент між ходами."""
+
+    def __init__(self):
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def component(self, group):
+        key = frozenset(group)
+        entry = self.cache.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = count_component(group)
+        else:
+            self.hits += 1
+        return key, entry
+
+    def compute(self, board):
+        """Список ймовірностей для кожної клітинки (None - відкрита клітинка).
+
+        Повертає None, якщо видимий стан суперечливий (наприклад, через
+        хибні прапорці).
+        """
+        cons, known_mines = solver.constraints(board)
+        safe, mines, _ = solver.propagate(dict(cons))
+        cons = solver.reduce_constraints(cons, safe, mines)
+
+        probabilities = [None] * board.cells
+        for index in known_mines | mines:
+            probabilities[index] = 1.0
+        for index in safe:
+            probabilities[index] = 0.0
+
+        cache = {}
+        entries = []
+        frontier = set()
+        for cells, group in solver.components(cons):
+            key, entry = self.component(group)
+            cache[key] = entry
+            entries.append(entry)
+            frontier.update(cells)
+        self.cache = cache  # Компоненти, яких більше немає, не потрібні
+
+        others = [i for i in range(board.cells)
+                  if not board.revealed[i] and probabilities[i] is None and i not in frontier]
+        unknown = len(others)
+        mines_left = board.mines - len(known_mines) - len(mines)
+
+        def weight(k):
+            rest = mines_left - k
+            return comb(unknown, rest) if 0 <= rest <= unknown else 0
+
+        # Добутки поліномів усіх компонент, крім j: префікси та суфікси
+        prefix = [[1]]
+        for _, totals, _ in entries:
+            prefix.append(_convolve(prefix[-1], totals))
+        suffix = [[1]]
+        for _, totals, _ in reversed(entries):
+            suffix.append(_convolve(suffix[-1], totals))
+        suffix.reverse()
+
+        everything = prefix[-1]
+        total = sum(count * weight(k) for k, count in enumerate(everything))
+        if total == 0:
+            return None
+
+        for j, (order, totals, marginals) in enumerate(entries):
+            rest = _convolve(prefix[j], suffix[j + 1])
+            weights = [sum(count * weight(k + extra) for extra, count in enumerate(rest))
+                       for k in range(len(totals))]
+            for cell, as_mine in zip(order, marginals):
+                probabilities[cell] = sum(count * weights[k] for k, count in enumerate(as_mine)) / total
+
+        if unknown:
+            # C(U, R - K) * (R - K) / U = C(U - 1, R - K - 1)
+            expected = sum(count * comb(unknown - 1, mines_left - k - 1)
+                           for k, count in enumerate(everything) if 0 < mines_left - k <= unknown)
+            for index in others:
+                probabilities[index] = expected / total
+        for index in range(board.cells):
+            if board.revealed[index]:
+                probabilities[index] = None
+        return probabilities
+
+
+def safest_cell(board, probabilities):
+    """Закрита клітинка без прапорця з найменшою ймовірністю міни (або None)."""
+    best = None
+    for index, p in enumerate(probabilities):
+        if p is None or board.flagged[index] or board.revealed[index]:
+            continue
+        if best is None or p < probabilities[best]:
+            best = index
+    return best
@@ -0,0 +1,273 @@
+"""Відображення ігрового поля.
+
+Обидва класи мають однаковий інтерфейс, тому інтерфейс гри не знає, чим
+саме намальоване поле:
+
+* ButtonBoardView — окрема tk.Button для кожної клітинки (класичний вигляд);
+* CanvasBoardView — усе поле на одному tk.Canvas з визначенням клітинки
+  за координатами кліку.
+
+Параметри клітинки повторюють параметри tk.Button: text, bg, fg,
+activebackground, disabledforeground, state. Для шестикутного поля
+build(..., shift_odd_rows=True) зсуває непарні рядки на пів клітинки
+вправо, як у topology.py. configure() лише запам'ятовує
+бажаний вигляд клітинки; раз на цикл подій flush() порівнює його з останнім
+застосованим і надсилає в Tcl одним пакетом тільки реальні зміни.
+"""
+import tkinter as tk
+
+
+def _tcl_word(value):
+    return "{" + str(value) + "}"
+
+
+class BoardView:
+    """Спільна логіка відображень: кеш вигляду клітинок і пакетні оновлення."""
+
+    def __init__(self, widget, on_left, on_right, on_middle):
+        self.widget = widget
+        self.on_left = on_left
+        self.on_right = on_right
+        self.on_middle = on_middle
+        self.rows = 0
+        self.cols = 0
+        self.shift_odd_rows = False
+        self.cells = []     # Бажаний вигляд кожної клітинки
+        self.applied = []   # Останній вигляд, надісланий у Tcl
+        self.dirty = set()
+        self._flush_id = None
+
+    def configure(self, row, col, **options):
+        index = row * self.cols + col
+        cell = self.cells[index]
+        for name, value in options.items():
+            if cell.get(name) != value:
+                cell[name] = value
+                self.dirty.add(index)
+        if self.dirty:
+            self._schedule()
+
+    def configure_batch(self, updates):
+        """Застосовує список (row, col, options)."""
+        for row, col, options in updates:
+            self.configure(row, col, **options)
+
+    def cget(self, row, col, option):
+        return self.cells[row * self.cols + col].get(option, "")
+
+    def set_state(self, state):
+        """Встановлює стан усіх клітинок."""
+        for index, cell in enumerate(self.cells):
+            if cell.get("state") != state:
+                cell["state"] = state
+                self.dirty.add(index)
+        if self.dirty:
+            self._schedule()
+
+    def _reset_cells(self, defaults):
+        """Скидає бажаний вигляд усіх клітинок до параметрів за замовчуванням."""
+        self.cells = [dict(defaults) for _ in range(self.rows * self.cols)]
+        self.dirty = set(range(len(self.cells)))
+        self._schedule()
+
+    def _schedule(self):
+        if self._flush_id is None:
+            self._flush_id = self.widget.after_idle(self.flush)
+
+    def flush(self):
+        """Надсилає в Tcl лише змінені параметри змінених клітинок."""
+        if self._flush_id is not None:
+            self.widget.after_cancel(self._flush_id)
+            self._flush_id = None
+        changes = []
+        for index in sorted(self.dirty):
+            applied = self.applied[index]
+            diff = {name: value for name, value in self.cells[index].items()
+                    if applied.get(name) != value}
+            if diff:
+                applied.update(diff)
+                changes.append((index, diff))
+        self.dirty.clear()
+        if changes:
+            self._apply(changes)
+
+    def _apply(self, changes):
+        raise NotImplementedError
+
+
+class ButtonBoardView(BoardView):
+    """Поле з окремих кнопок, розміщених у master через grid.
+
+    Кнопки зберігаються в пулі: при перезапуску з тим самим розміром вони
+    лише скидаються до початкового вигляду, а при зміні розміру пул
+    доповнюється новими кнопками або ховає зайві.
+    """
+
+    def __init__(self, master, on_left, on_right, on_middle):
+        super().__init__(master, on_left, on_right, on_middle)
+        self.pool = []
+        self.buttons = []
+
+    def build(self, rows, cols, cell_size, shift_odd_rows=False, **defaults):
+        """Розкладає кнопки поля та скидає їх до параметрів за замовчуванням.
+
+        Кожна кнопка займає два стовпчики grid, тож зсув непарних рядків
+        на пів клітинки - це зсув на один стовпчик.
+        """
+        count = rows * cols
+        for index in range(len(self.pool), count):
+            btn = tk.Button(self.widget, highlightthickness=0,
+                            command=lambda i=index: self._dispatch(i, self.on_left))
+            btn.bind("<Button-3>", lambda event, i=index: self._dispatch(i, self.on_right))
+            btn.bind("<Button-2>", lambda event, i=index: self._dispatch(i, self.on_middle))
+            self.pool.append(btn)
+            self.applied.append({})
+
+        if (rows, cols, shift_odd_rows) != (self.rows, self.cols, self.shift_odd_rows):
+            for btn in self.pool[count:]:
+                btn.grid_remove()
+            for index in range(count):
+                row, col = divmod(index, cols)
+                shift = row % 2 if shift_odd_rows else 0
+                self.pool[index].grid(row=row, column=2 * col + shift, columnspan=2,
+                                      padx=1, pady=1, sticky="nsew")
+            for row in range(max(rows, self.rows)):
+                self.widget.rowconfigure(row, weight=1 if row < rows else 0)
+            for col in range(2 * max(cols, self.cols) + 1):
+                self.widget.columnconfigure(col, weight=1 if col < 2 * cols + shift_odd_rows else 0)
+            self.rows, self.cols, self.shift_odd_rows = rows, cols, shift_odd_rows
+            self.buttons = [self.pool[row * cols:(row + 1) * cols] for row in range(rows)]
+
+        # Розмір у символах, як і раніше; grid стискає кнопки до розміру вікна
+        button_size = max(1, 40 - (rows - 8) * 4)
+        self._reset_cells(dict(defaults, width=button_size, height=button_size))
+
+    def clear(self):
+        """Видаляє всі кнопки поля разом із пулом."""
+        for btn in self.pool:
+            btn.destroy()
+        self.pool = []
+        self.buttons = []
+        self.cells = []
+        self.applied = []
+        self.dirty.clear()
+        self.rows = self.cols = 0
+        self.shift_odd_rows = False
+
+    def _dispatch(self, index, handler):
+        handler(*divmod(index, self.cols))
+
+    def _apply(self, changes):
+        """Одна команда Tcl для всіх змінених кнопок."""
+        commands = []
+        for index, diff in changes:
+            args = " ".join(f"-{name} {_tcl_word(value)}" for name, value in diff.items())
+            commands.append(f"{self.pool[index]} configure {args}")
+        self.widget.tk.eval("\n".join(commands))
+
+
+class CanvasBoardView(BoardView):
+    """Поле, намальоване на одному tk.Canvas.
+
+    Змінюються лише елементи змінених клітинок, тож Tk перемальовує тільки
+    їхні прямокутники.
+    """
+
+    def __init__(self, master, on_left, on_right, on_middle):
+        canvas = tk.Canvas(master, highlightthickness=0, bd=0, bg=master.cget("bg"))
+        canvas.pack()
+        super().__init__(canvas, on_left, on_right, on_middle)
+        self.canvas = canvas
+        self.cell_size = 0
+        self.rects = []
+        self.texts = []
+        self.hover = -1
+
+        self.canvas.bind("<ButtonRelease-1>", self._on_left)
+        self.canvas.bind("<Button-3>", lambda event: self._dispatch(event, self.on_right))
+        self.canvas.bind("<Button-2>", lambda event: self._dispatch(event, self.on_middle))
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", lambda event: self._set_hover(-1))
+
+    def build(self, rows, cols, cell_size, shift_odd_rows=False, **defaults):
+        """Малює поле; якщо розмір не змінився, лише скидає наявні елементи."""
+        self._set_hover(-1)
+        layout = (rows, cols, cell_size, shift_odd_rows)
+        if layout != (self.rows, self.cols, self.cell_size, self.shift_odd_rows):
+            self.canvas.delete("all")
+            self.rows, self.cols, self.cell_size, self.shift_odd_rows = layout
+            width = cols * cell_size + (cell_size // 2 if shift_odd_rows else 0)
+            self.canvas.config(width=width, height=rows * cell_size)
+            font = ("Arial", max(6, cell_size // 3), "bold")
+            self.rects = []
+            self.texts = []
+            for row in range(rows):
+                y = row * cell_size
+                for col in range(cols):
+                    x = col * cell_size + self._row_shift(row)
+                    self.rects.append(self.canvas.create_rectangle(
+                        x + 1, y + 1, x + cell_size - 1, y + cell_size - 1, width=0))
+                    self.texts.append(self.canvas.create_text(
+                        x + cell_size // 2, y + cell_size // 2, font=font))
+            self.applied = [{} for _ in range(rows * cols)]
+        self._reset_cells(defaults)
+
+    def clear(self):
+        self.canvas.delete("all")
+        self.rows = self.cols = self.cell_size = 0
+        self.shift_odd_rows = False
+        self.cells, self.applied, self.rects, self.texts = [], [], [], []
+        self.dirty.clear()
+
+    def _apply(self, changes):
+        """Одна команда Tcl для елементів усіх змінених клітинок."""
+        self.widget.tk.eval("\n".join(self._draw_command(index) for index, diff in changes))
+
+    def _draw_command(self, index):
+        cell = self.applied[index]
+        normal = cell.get("state", "normal") == "normal"
+        if normal and index == self.hover:
+            fill = cell.get("activebackground") or cell.get("bg")
+        else:
+            fill = cell.get("bg")
+        text_fill = cell.get("fg") if normal else cell.get("disabledforeground") or cell.get("fg")
+        return (f"{self.canvas} itemconfigure {self.rects[index]} -fill {_tcl_word(fill)}\n"
+                f"{self.canvas} itemconfigure {self.texts[index]} "
+                f"-text {_tcl_word(cell.get('text', ''))} -fill {_tcl_word(text_fill)}")
+
+    def _hit(self, event):
+        """Повертає (row, col) під курсором або None."""
+        if not self.cell_size:
+            return None
+        row = event.y // self.cell_size
+        col = (event.x - self._row_shift(row)) // self.cell_size
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def _row_shift(self, row):
+        """Горизонтальний зсув рядка в пікселях (пів клітинки для непарних рядків)."""
+        return self.cell_size // 2 if self.shift_odd_rows and row % 2 else 0
+
+    def _dispatch(self, event, handler):
+        hit = self._hit(event)
+        if hit:
+            handler(*hit)
+
+    def _on_left(self, event):
+        hit = self._hit(event)
+        if hit and self.cget(*hit, "state") == "normal":
+            self.on_left(*hit)
+
+    def _on_motion(self, event):
+        hit = self._hit(event)
+        self._set_hover(hit[0] * self.cols + hit[1] if hit else -1)
+
+    def _set_hover(self, index):
+        if index == self.hover:
+            return
+        previous, self.hover = self.hover, index
+        commands = [self._draw_command(i) for i in (previous, index)
+                    if 0 <= i < len(self.applied) and self.applied[i]]
+        if commands:
+            self.widget.tk.eval("\n".join(commands))
@@ -0,0 +1,87 @@
+"""Сховище налаштувань з відкладеним атомарним записом у JSON.
+
+Зміни накопичуються в пам'яті, а файл переписується не частіше ніж раз на
+delay_ms мілісекунд (або одразу через flush(), наприклад при закритті
+програми). Запис іде у тимчасовий файл поруч, який потім замінює
+основний, тож збій посеред запису не пошкоджує налаштування.
+"""
+import json
+import os
+import tempfile
+
+
+def write_atomic(path, text, prefix=".tmp-"):
+    """Записує text у path через тимчасовий файл поруч, fsync і os.replace."""
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=prefix, suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "w", encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class SettingsStore:
+    """Налаштування в пам'яті з об'єднанням записів на диск."""
+
+    def __init__(self, path, defaults, root=None, delay_ms=500):
+        self.path = path
+        self.defaults = dict(defaults)
+        self.values = dict(defaults)
+        self.root = root
+        self.delay_ms = delay_ms
+        self.dirty = False
+        self._after_id = None
+
+    def load(self):
+        """Читає файл налаштувань; відсутні ключі беруться зі значень за замовчуванням."""
+        self.values = dict(self.defaults)
+        try:
+            with open(self.path, "r", encoding='utf-8') as f:
+                self.values.update(json.load(f))
+            self.dirty = False
+            return True
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError, TypeError) as e:
+            print(f"Помилка завантаження налаштувань: {e}, використовуються значення за замовчуванням")
+            self.values = dict(self.defaults)
+            self.dirty = True
+            return False
+
+    def get(self, key):
+        return self.values.get(key, self.defaults.get(key))
+
+    def update(self, values):
+        """Оновлює значення в пам'яті і планує запис, якщо щось змінилося."""
+        for key, value in values.items():
+            if self.values.get(key) != value:
+                self.values[key] = value
+                self.dirty = True
+        if self.dirty:
+            self.schedule()
+
+    def schedule(self):
+        """Планує відкладений запис; без Tk записує одразу."""
+        if self.root is None:
+            self.flush()
+        elif self._after_id is None:
+            self._after_id = self.root.after(self.delay_ms, self.flush)
+
+    def flush(self):
+        """Атомарно записує налаштування, якщо вони змінилися."""
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        if not self.dirty:
+            return
+        try:
+            write_atomic(self.path, json.dumps(self.values, indent=4, ensure_ascii=False), ".settings-")
+            self.dirty = False
+        except Exception as e:
+            print(f"Помилка збереження налаштувань: {e}")
@@ -0,0 +1,252 @@
+"""Масова симуляція ігор ботами без Tk.
+
+Кожна гра визначається рівнем і seed (base_seed + номер гри), тож запуск
+відтворюваний. Ігри діляться на пакети, які грають процеси пулу; в
+обробці одночасно лише кілька пакетів, а результати одразу пишуться у
+файл або базу, тому пам'ять не росте з кількістю ігор.
+
+Боти:
+    random       - відкриває випадкові закриті клітинки;
+    solver       - певні ходи solver.solve, а коли їх немає - випадкова клітинка;
+    probability  - певні ходи, а коли їх немає - найбезпечніша клітинка
+                   за probability.ProbabilityEngine.
+
+Поле - звичайний engine.Board ("list") або bitboard.BitBoard ("bits", на
+бітових масках; швидше генерується і розкривається). Перший хід, як і в
+грі з налаштуваннями за замовчуванням, безпечний і відкриває область 3x3
+(clear_start).
+
+--topology задає сусідство клітинок (topology.py); бітове поле підтримує
+лише прямокутне.
+
+Вивід у .db пишеться в таблицю simulated_games, а не games: тригер
+статистики і вікно історії її не бачать, тож ігри ботів і їхній час
+обчислення не змішуються з іграми гравця навіть у game_data.db.
+
+Запуск:
+    python simulate.py --games 100000 --bot solver --output results.csv
+    python simulate.py --games 100000 --bot random --board bits
+    python simulate.py --games 1000 --bot probability --output simulation.db
+"""
+import argparse
+import collections
+import concurrent.futures
+import csv
+import json
+import os
+import sys
+import time
+
+from bitboard import BitBoard
+import boardcode
+from engine import Board, DIFFICULTY_SETTINGS, SplitMix64
+from probability import ProbabilityEngine, safest_cell
+import solver
+import storage
+from topology import TOPOLOGIES
+
+BOTS = ("random", "solver", "probability")
+BOARDS = ("list", "bits")
+FIELDS = ["difficulty", "seed", "result", "moves", "clicks", "revealed", "duration_ms"]
+
+
+def _random_cell(board, rng):
+    revealed, flagged = board.revealed, board.flagged
+    closed = [i for i in range(board.cells) if not revealed[i] and not flagged[i]]
+    return closed[rng.below(len(closed))]
+
+
+def new_board(rows, cols, mines, kind="list", topology="rect"):
+    if kind == "bits":
+        return BitBoard(rows, cols, mines)
+    return Board(rows, cols, mines, backend="python", topology=topology)
+
+
+def play_game(rows, cols, mines, seed, bot, probabilities=None, kind="list", topology="rect"):
+    """Грає одну гру і повертає (виграв, ходи, кліки, частка відкритих безпечних клітинок)."""
+    board = new_board(rows, cols, mines, kind, topology)
+    board.place_mines(seed=seed)
+    board.update_numbers()
+    rng = SplitMix64(seed ^ 0x5EED)  # Вгадування бота теж відтворювані
+    first = True
+    moves = clicks = 0
+    while not board.lost and not board.is_won():
+        if bot != "random":
+            safe, found = solver.solve(board)
+            revealed, flagged = board.revealed, board.flagged
+            safe = [i for i in safe if not revealed[i]]
+            found = [i for i in found if not flagged[i]]
+            if safe or found:
+                for index in sorted(safe):
+                    board.reveal(*board.coords(index))
+                for index in sorted(found):
+                    board.toggle_flag(*board.coords(index))
+                moves += len(safe) + len(found)
+                clicks += len(safe) + len(found)
+                continue
+        if board.safe_left == 0:
+            # Лишилися лише міни без прапорців
+            for index in range(board.cells):
+                if board.mine[index] and not board.flagged[index]:
+                    board.toggle_flag(*board.coords(index))
+                    moves += 1
+                    clicks += 1
+            break
+        if bot == "probability":
+            index = safest_cell(board, probabilities.compute(board) or [0.5] * board.cells)
+        else:
+            index = _random_cell(board, rng)
+        if first:
+            # Як у грі: перший хід відкриває область 3x3 без мін
+            board.clear_start(index)
+            first = False
+        board.reveal(*board.coords(index))
+        moves += 1
+        clicks += 1
+    opened = (board.cells - board.mines - board.safe_left) / (board.cells - board.mines)
+    return board.is_won(), moves, clicks, opened
+
+
+def play_batch(difficulty, seeds, bot, kind="list", topology="rect"):
+    """Грає пакет ігор одного рівня (виконується у процесі пулу)."""
+    size, mines = DIFFICULTY_SETTINGS[difficulty]
+    probabilities = ProbabilityEngine() if bot == "probability" else None
+    results = []
+    for seed in seeds:
+        t0 = time.perf_counter()
+        won, moves, clicks, opened = play_game(size, size, mines, seed, bot, probabilities, kind, topology)
+        results.append({
+            "difficulty": difficulty,
+            "seed": boardcode.encode(size, size, mines, seed, topology),
+            "result": storage.WIN if won else storage.LOSS,
+            "moves": moves,
+            "clicks": clicks,
+            "revealed": round(opened, 4),
+            "duration_ms": int((time.perf_counter() - t0) * 1000),
+        })
+    return results
+
+
+def batches(difficulties, games, base_seed, batch_size):
+    for difficulty in difficulties:
+        for start in range(0, games, batch_size):
+            seeds = [(base_seed + i) & 0xFFFFFFFF for i in range(start, min(games, start + batch_size))]
+            yield difficulty, seeds
+
+
+class Output:
+    """Потоковий запис результатів у CSV, JSONL або таблицю simulated_games."""
+
+    def __init__(self, path):
+        self.path = path
+        self.kind = os.path.splitext(path)[1].lower() if path else ""
+        self.file = None
+        self.conn = None
+        if self.kind == ".csv":
+            self.file = open(path, "w", encoding='utf-8', newline="")
+            self.writer = csv.DictWriter(self.file, fieldnames=FIELDS)
+            self.writer.writeheader()
+        elif self.kind == ".jsonl":
+            self.file = open(path, "w", encoding='utf-8')
+        elif self.kind == ".db":
+            self.conn = storage.connect(path, writer=True)
+            storage.create_simulation_schema(self.conn)
+        elif path:
+            raise ValueError(f"Невідомий формат виводу: {path} (потрібен .csv, .jsonl або .db)")
+
+    def write(self, results):
+        if self.kind == ".csv":
+            self.writer.writerows(results)
+        elif self.kind == ".jsonl":
+            for result in results:
+                self.file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        elif self.kind == ".db":
+            size_of = {name: size for name, (size, _) in DIFFICULTY_SETTINGS.items()}
+            storage.write_games(self.conn, [
+                storage.game_record(result["result"], result["difficulty"],
+                                    size=size_of[result["difficulty"]],
+                                    duration_ms=result["duration_ms"], moves=result["moves"],
+                                    clicks=result["clicks"], seed=result["seed"])
+                for result in results
+            ], storage.INSERT_SIMULATED)
+
+    def close(self):
+        if self.file:
+            self.file.close()
+        if self.conn:
+            self.conn.close()
+
+
+def run(difficulties, games, bot, output, workers=None, base_seed=1, batch_size=200, kind="list",
+        topology="rect"):
+    """Грає games ігор на кожному рівні; повертає {рівень: (ігри, перемоги, ходи)}."""
+    totals = collections.defaultdict(lambda: [0, 0, 0])
+    workers = workers or os.cpu_count() or 1
+    jobs = batches(difficulties, games, base_seed, batch_size)
+    total_games = games * len(difficulties)
+    done = 0
+    t0 = time.perf_counter()
+    last_report = t0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = collections.deque()
+        while True:
+            # Обмежена кількість пакетів в обробці - пам'ять не залежить від games
+            while len(pending) < workers * 2:
+                job = next(jobs, None)
+                if job is None:
+                    break
+                pending.append(pool.submit(play_batch, job[0], job[1], bot, kind, topology))
+            if not pending:
+                break
+            results = pending.popleft().result()
+            output.write(results)
+            for result in results:
+                entry = totals[result["difficulty"]]
+                entry[0] += 1
+                entry[1] += result["result"] == storage.WIN
+                entry[2] += result["moves"]
+            done += len(results)
+            now = time.perf_counter()
+            if now - last_report >= 1 or done == total_games:
+                last_report = now
+                print(f"\r{done}/{total_games} ігор, {done / (now - t0):.0f} ігор/с",
+                      end="", file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+    return {difficulty: tuple(values) for difficulty, values in totals.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Масова симуляція ігор «Мінер» ботами")
+    parser.add_argument("--games", type=int, default=1000, help="кількість ігор на кожен рівень")
+    parser.add_argument("--difficulty", action="append", choices=list(DIFFICULTY_SETTINGS),
+                        help="рівень (можна кілька разів; за замовчуванням усі)")
+    parser.add_argument("--bot", choices=BOTS, default="solver", help="стратегія бота")
+    parser.add_argument("--board", choices=BOARDS, default="list",
+                        help="представлення поля: list (engine.Board) або bits (bitboard.BitBoard)")
+    parser.add_argument("--topology", choices=TOPOLOGIES, default="rect", help="сусідство клітинок")
+    parser.add_argument("--output", help="файл результатів: .csv, .jsonl або .db (таблиця simulated_games)")
+    parser.add_argument("--workers", type=int, default=None, help="кількість процесів")
+    parser.add_argument("--seed", type=int, default=1, help="seed першої гри")
+    parser.add_argument("--batch", type=int, default=200, help="ігор в одному пакеті процесу")
+    args = parser.parse_args(argv)
+    if args.board == "bits" and args.topology != "rect":
+        parser.error("бітове поле (--board bits) підтримує лише --topology rect")
+
+    output = Output(args.output)
+    t0 = time.perf_counter()
+    try:
+        totals = run(args.difficulty or list(DIFFICULTY_SETTINGS), args.games, args.bot, output,
+                     args.workers, args.seed, args.batch, args.board, args.topology)
+    finally:
+        output.close()
+    elapsed = time.perf_counter() - t0
+
+    for difficulty, (games, wins, moves) in totals.items():
+        print(f"{difficulty}: ігор {games}, перемог {wins} ({wins * 100 / games:.1f}%), "
+              f"у середньому {moves / games:.1f} ходів")
+    count = sum(games for games, _, _ in totals.values())
+    print(f"Усього {count} ігор за {elapsed:.1f} с ({count / elapsed:.0f} ігор/с)")
+
+
+if __name__ == "__main__":
+    main()
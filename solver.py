@@ -0,0 +1,254 @@
+"""Розв'язувач за видимим станом поля: відкриті числа та прапорці.
+
+Розв'язувач не дивиться на масив мін. Прапорці вважаються мінами, а кожне
+відкрите число з закритими сусідами дає обмеження «серед цих клітинок
+рівно k мін». Спочатку працюють прості правила:
+
+- одна клітинка: k == 0 - усі клітинки безпечні, k == розмір - усі міни;
+- підмножина: якщо A ⊂ B, то в B \\ A рівно k(B) - k(A) мін.
+
+Коли правила більше нічого не дають, фронт (закриті клітинки біля чисел)
+ділиться на незалежні компоненти, і для кожної перебором з поверненням
+шукаються клітинки, які в усіх розв'язках однакові.
+"""
+from engine import neighbour_table
+
+# Найбільша кількість вузлів перебору на одну компоненту
+BACKTRACK_BUDGET = 2000
+
+
+def constraints(board):
+    """Повертає (обмеження, відомі міни): {frozenset(клітинок): кількість мін}."""
+    revealed, flagged, counts, mine = board.revealed, board.flagged, board.counts, board.mine
+    table = neighbour_table(board.rows, board.cols, board.topology)
+    # Відкрита міна (поле після програшу) теж відома міна
+    known_mines = {i for i in range(board.cells) if flagged[i] or (revealed[i] and mine[i])}
+    result = {}
+    for index in range(board.cells):
+        if not revealed[index] or mine[index] or not counts[index]:
+            continue
+        unknown = []
+        remaining = counts[index]
+        for n in table[index]:
+            if n in known_mines:
+                remaining -= 1
+            elif not revealed[n]:
+                unknown.append(n)
+        if unknown:
+            result[frozenset(unknown)] = remaining
+    return result, known_mines
+
+
+def reduce_constraints(cons, safe, mines):
+    """Прибирає з обмежень уже визначені клітинки."""
+    result = {}
+    for cells, remaining in cons.items():
+        if cells.isdisjoint(safe) and cells.isdisjoint(mines):
+            result[cells] = remaining
+            continue
+        remaining -= len(cells & mines)
+        cells = cells - safe - mines
+        if cells:
+            result[cells] = remaining
+    return result
+
+
+def propagate(cons):
+    """Застосовує правила однієї клітинки і підмножин до нерухомої точки.
+
+    Повертає (безпечні, міни, залишок обмежень).
+    """
+    safe = set()
+    mines = set()
+    while True:
+        found_safe = set()
+        found_mines = set()
+        for cells, remaining in cons.items():
+            if remaining == 0:
+                found_safe |= cells
+            elif remaining == len(cells):
+                found_mines |= cells
+        if found_safe or found_mines:
+            safe |= found_safe
+            mines |= found_mines
+            cons = reduce_constraints(cons, found_safe, found_mines)
+            continue
+
+        # Правило підмножин: шукаємо B ⊇ A серед обмежень, що містять клітинку з A
+        by_cell = {}
+        for cells in cons:
+            for cell in cells:
+                by_cell.setdefault(cell, []).append(cells)
+        derived = {}
+        for a, remaining in cons.items():
+            for b in by_cell[next(iter(a))]:
+                if len(b) > len(a) and a < b:
+                    rest = b - a
+                    if rest not in cons and rest not in derived:
+                        derived[rest] = cons[b] - remaining
+        if not derived:
+            return safe, mines, cons
+        cons.update(derived)
+
+
+def components(cons):
+    """Ділить обмеження на незалежні групи: [(клітинки, [(клітинки, k), ...]), ...]."""
+    parent = {}
+
+    def find(cell):
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    for cells in cons:
+        for cell in cells:
+            parent.setdefault(cell, cell)
+        first = find(next(iter(cells)))
+        for cell in cells:
+            root = find(cell)
+            if root != first:
+                parent[root] = first
+    groups = {}
+    for cells, remaining in cons.items():
+        groups.setdefault(find(next(iter(cells))), []).append((cells, remaining))
+    result = []
+    for group in groups.values():
+        cells = sorted(set().union(*(cells for cells, _ in group)))
+        result.append((cells, group))
+    return result
+
+
+def frontier_order(group):
+    """Порядок обходу клітинок компоненти - пошук у ширину по обмеженнях.
+
+    Сусідні клітинки йдуть поруч, тож обмеження закриваються (і відсікають
+    гілки перебору) якомога раніше.
+    """
+    by_cell = {}
+    for group_cells, _ in group:
+        for cell in group_cells:
+            by_cell.setdefault(cell, []).append(group_cells)
+    start = min(min(group, key=lambda item: len(item[0]))[0])
+    order = [start]
+    seen = {start}
+    for cell in order:
+        for group_cells in by_cell[cell]:
+            for other in sorted(group_cells - seen):
+                seen.add(other)
+                order.append(other)
+    return order
+
+
+def enumerate_component(cells, group, budget=BACKTRACK_BUDGET):
+    """Перебирає всі розстановки мін компоненти.
+
+    Повертає {кількість мін: [кількість розв'язків, мін у кожній клітинці]}
+    або None, якщо перебір перевищив budget вузлів.
+    """
+    order = frontier_order(group)
+    position = {cell: i for i, cell in enumerate(order)}
+    need = [remaining for _, remaining in group]
+    left = [len(group_cells) for group_cells, _ in group]
+    watch = [[] for _ in order]
+    for ci, (group_cells, _) in enumerate(group):
+        for cell in group_cells:
+            watch[position[cell]].append(ci)
+
+    size = len(order)
+    assignment = [0] * size
+    results = {}
+    nodes = 0
+
+    def search(i, placed):
+        nonlocal nodes
+        nodes += 1
+        if nodes > budget:
+            return False
+        if i == size:
+            entry = results.get(placed)
+            if entry is None:
+                entry = results[placed] = [0, [0] * size]
+            entry[0] += 1
+            per_cell = entry[1]
+            for j in range(size):
+                per_cell[j] += assignment[j]
+            return True
+        for value in (0, 1):
+            fits = True
+            for ci in watch[i]:
+                rest = need[ci] - value
+                if rest < 0 or rest > left[ci] - 1:
+                    fits = False
+                    break
+            if not fits:
+                continue
+            for ci in watch[i]:
+                need[ci] -= value
+                left[ci] -= 1
+            assignment[i] = value
+            ok = search(i + 1, placed + value)
+            for ci in watch[i]:
+                need[ci] += value
+                left[ci] += 1
+            assignment[i] = 0
+            if not ok:
+                return False
+        return True
+
+    if not search(0, 0):
+        return None
+    # Порядок клітинок у результаті - як у cells
+    return {placed: [count, [per_cell[position[cell]] for cell in cells]]
+            for placed, (count, per_cell) in results.items()}
+
+
+def solve(board, backtrack=True):
+    """Повертає (безпечні, міни) - множини індексів, визначених напевно."""
+    cons, known_mines = constraints(board)
+    safe, mines, cons = propagate(cons)
+
+    revealed = board.revealed
+    unknown = [i for i in range(board.cells)
+               if not revealed[i] and i not in known_mines and i not in safe and i not in mines]
+    mines_left = board.mines - len(known_mines) - len(mines)
+
+    # Глобальне правило: усі міни знайдено або всі закриті клітинки - міни
+    if mines_left == 0:
+        return safe | set(unknown), mines
+    if mines_left == len(unknown):
+        return safe, mines | set(unknown)
+
+    # Перебір - лише запасний шлях, коли правила нічого не знайшли
+    if backtrack and cons and not safe and not mines:
+        for cells, group in components(cons):
+            results = enumerate_component(cells, group)
+            if results is None:
+                continue
+            # Розв'язки з більшою кількістю мін, ніж лишилося, неможливі
+            feasible = [entry for placed, entry in results.items() if placed <= mines_left]
+            if not feasible:
+                continue
+            total = sum(count for count, _ in feasible)
+            for j, cell in enumerate(cells):
+                as_mine = sum(per_cell[j] for _, per_cell in feasible)
+                if as_mine == 0:
+                    safe.add(cell)
+                elif as_mine == total:
+                    mines.add(cell)
+    return safe, mines
+
+
+def hint(board):
+    """Наступний певний хід: (індекс, True якщо там міна) або None.
+
+    Безпечна клітинка має перевагу над міною без прапорця.
+    """
+    safe, mines = solve(board)
+    safe = [i for i in safe if not board.revealed[i] and not board.flagged[i]]
+    if safe:
+        return min(safe), False
+    mines = [i for i in mines if not board.flagged[i]]
+    if mines:
+        return min(mines), True
+    return None
@@ -0,0 +1,363 @@
+"""Робота з базою даних ігор (SQLite).
+
+Історія читається сторінками за ключем (keyset pagination): наступна
+сторінка починається після id останнього показаного рядка, тож запит
+не залежить від кількості вже пройдених записів.
+
+Результати ігор записує GameWriter у фоновому потоці з власним
+з'єднанням, тож головний потік Tk ніколи не чекає на диск.
+
+Правило одного записувача: у кожному процесі в games пише лише GameWriter
+(або write_games у headless-коді). Його транзакції починаються з
+BEGIN IMMEDIATE, тож блокування на запис береться одразу, а не при спробі
+підвищити блокування читання, і кілька процесів гри просто стають у чергу:
+спочатку чекає busy_timeout SQLite, а потім with_retry повторює транзакцію
+з експоненційною паузою.
+"""
+from datetime import datetime, timezone
+import queue
+import sqlite3
+import threading
+import time
+
+WIN = "Виграв"
+LOSS = "Програв"
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS games (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date TEXT,
+        result TEXT,
+        size INTEGER,
+        difficulty TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_games_date ON games(date)",
+    "CREATE INDEX IF NOT EXISTS idx_games_result ON games(result)",
+    "CREATE INDEX IF NOT EXISTS idx_games_difficulty ON games(difficulty)",
+    # Зведена статистика: рядок '*' - усі рівні разом, інші - окремі рівні
+    """
+    CREATE TABLE IF NOT EXISTS stats_summary (
+        difficulty TEXT PRIMARY KEY,
+        games INTEGER NOT NULL DEFAULT 0,
+        wins INTEGER NOT NULL DEFAULT 0,
+        streak INTEGER NOT NULL DEFAULT 0,
+        best_streak INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS stats_daily (
+        day TEXT PRIMARY KEY,
+        games INTEGER NOT NULL DEFAULT 0,
+        wins INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    # Тригер оновлює статистику в тій самій транзакції, що й INSERT гри.
+    # streak > 0 - перемоги поспіль, streak < 0 - поразки поспіль.
+    f"""
+    CREATE TRIGGER IF NOT EXISTS games_stats_insert AFTER INSERT ON games
+    BEGIN
+        INSERT INTO stats_summary (difficulty, games, wins, streak, best_streak)
+        SELECT scope, 1, NEW.result = '{WIN}',
+               CASE WHEN NEW.result = '{WIN}' THEN 1 ELSE -1 END, NEW.result = '{WIN}'
+        FROM (SELECT '*' AS scope UNION ALL SELECT COALESCE(NEW.difficulty, ''))
+        WHERE true
+        ON CONFLICT(difficulty) DO UPDATE SET
+            games = games + 1,
+            wins = wins + excluded.wins,
+            streak = CASE WHEN excluded.wins THEN MAX(streak, 0) + 1 ELSE MIN(streak, 0) - 1 END,
+            best_streak = MAX(best_streak, CASE WHEN excluded.wins THEN MAX(streak, 0) + 1 ELSE 0 END);
+        INSERT INTO stats_daily (day, games, wins)
+        VALUES (date(NEW.date), 1, NEW.result = '{WIN}')
+        ON CONFLICT(day) DO UPDATE SET games = games + 1, wins = wins + excluded.wins;
+    END
+    """,
+]
+
+# Колонки, додані після першої версії схеми: ім'я -> тип
+MIGRATED_COLUMNS = {
+    "duration_ms": "INTEGER",
+    "moves": "INTEGER",
+    "clicks": "INTEGER",
+    "seed": "TEXT",
+    "move_log": "BLOB",   # Двійковий запис ходів, див. movelog.py
+}
+
+GAME_COLUMNS = "id, date, result, difficulty"
+
+INSERT_GAME = """
+    INSERT INTO games (date, result, size, difficulty, duration_ms, moves, clicks, seed, move_log)
+    VALUES (:date, :result, :size, :difficulty, :duration_ms, :moves, :clicks, :seed, :move_log)
+"""
+
+# Ігри ботів (simulate.py) - окрема таблиця без тригера статистики, щоб
+# симуляція навіть у базі гравця не потрапляла в його статистику та історію
+SIMULATED_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS simulated_games (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date TEXT,
+        result TEXT,
+        size INTEGER,
+        difficulty TEXT,
+        duration_ms INTEGER,
+        moves INTEGER,
+        clicks INTEGER,
+        seed TEXT,
+        move_log BLOB
+    )
+"""
+
+INSERT_SIMULATED = INSERT_GAME.replace("INTO games", "INTO simulated_games")
+
+
+BUSY_TIMEOUT = 5.0
+RETRY_ATTEMPTS = 5
+RETRY_DELAY = 0.05
+
+
+def connect(path, writer=False, timeout=BUSY_TIMEOUT):
+    """Відкриває базу в режимі WAL: читачі не блокують записувача.
+
+    З'єднання записувача починає транзакції з BEGIN IMMEDIATE.
+    """
+    conn = sqlite3.connect(path, timeout=timeout,
+                           isolation_level="IMMEDIATE" if writer else "DEFERRED")
+    with_retry(lambda: conn.execute("PRAGMA journal_mode=WAL"))
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def is_busy_error(error):
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+def with_retry(action, attempts=RETRY_ATTEMPTS, delay=RETRY_DELAY):
+    """Виконує action, повторюючи його, доки база зайнята іншим процесом."""
+    for attempt in range(attempts):
+        try:
+            return action()
+        except sqlite3.OperationalError as e:
+            if not is_busy_error(e) or attempt == attempts - 1:
+                raise
+            time.sleep(delay * 2 ** attempt)
+
+
+def create_schema(conn):
+    """Створює таблиці та індекси, якщо їх ще немає."""
+    def transaction():
+        with conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+            migrate(conn)
+    with_retry(transaction)
+    # База зі старої версії: ігри є, а статистики ще немає
+    if (conn.execute("SELECT NOT EXISTS (SELECT 1 FROM stats_summary)").fetchone()[0]
+            and conn.execute("SELECT EXISTS (SELECT 1 FROM games)").fetchone()[0]):
+        rebuild_stats(conn)
+
+
+def create_simulation_schema(conn):
+    """Створює таблицю simulated_games, якщо її ще немає."""
+    def transaction():
+        with conn:
+            conn.execute(SIMULATED_SCHEMA)
+    with_retry(transaction)
+
+
+def migrate(conn):
+    """Додає до таблиці games колонки, яких немає у старих базах."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(games)")}
+    for name, column_type in MIGRATED_COLUMNS.items():
+        if name not in existing:
+            conn.execute(f"ALTER TABLE games ADD COLUMN {name} {column_type}")
+
+
+def rebuild_stats(conn):
+    """Перераховує зведену статистику з таблиці games за один прохід."""
+    summary = {}
+    daily = {}
+    cursor = conn.execute("SELECT date(date), result, COALESCE(difficulty, '') FROM games ORDER BY id")
+    for day, result, difficulty in cursor:
+        won = result == WIN
+        for scope in ("*", difficulty):
+            games, wins, streak, best = summary.get(scope, (0, 0, 0, 0))
+            streak = max(streak, 0) + 1 if won else min(streak, 0) - 1
+            summary[scope] = (games + 1, wins + won, streak, max(best, streak))
+        games, wins = daily.get(day, (0, 0))
+        daily[day] = (games + 1, wins + won)
+    with conn:
+        conn.execute("DELETE FROM stats_summary")
+        conn.execute("DELETE FROM stats_daily")
+        conn.executemany(
+            "INSERT INTO stats_summary (difficulty, games, wins, streak, best_streak) VALUES (?, ?, ?, ?, ?)",
+            [(scope,) + values for scope, values in summary.items()]
+        )
+        conn.executemany(
+            "INSERT INTO stats_daily (day, games, wins) VALUES (?, ?, ?)",
+            [(day,) + values for day, values in daily.items()]
+        )
+
+
+def fetch_stats(conn, days=7):
+    """Повертає зведення: {рівень: (ігри, перемоги, серія, найкраща серія)} і останні дні."""
+    summary = {row[0]: row[1:] for row in conn.execute(
+        "SELECT difficulty, games, wins, streak, best_streak FROM stats_summary")}
+    daily = conn.execute(
+        "SELECT day, games, wins FROM stats_daily ORDER BY day DESC LIMIT ?", (days,)
+    ).fetchall()
+    return summary, daily
+
+
+def game_record(result, difficulty, size=None, duration_ms=None, moves=None, clicks=None, seed=None,
+                move_log=None):
+    """Словник з параметрами для INSERT_GAME; дата - поточний час UTC, як datetime('now')."""
+    return {
+        "date": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        "result": result,
+        "size": size,
+        "difficulty": difficulty,
+        "duration_ms": duration_ms,
+        "moves": moves,
+        "clicks": clicks,
+        "seed": seed,
+        "move_log": move_log,
+    }
+
+
+def write_games(conn, records, statement=INSERT_GAME):
+    """Вставляє записи однією транзакцією (з повторами) і повертає збережені рядки."""
+    def transaction():
+        saved = []
+        with conn:
+            for record in records:
+                cursor = conn.execute(statement, record)
+                saved.append((cursor.lastrowid, record["date"], record["result"], record["difficulty"]))
+        return saved
+    return with_retry(transaction)
+
+
+def insert_game(conn, result, difficulty, **details):
+    """Синхронно додає результат гри і повертає рядок (id, date, result, difficulty)."""
+    return write_games(conn, [game_record(result, difficulty, **details)])[0]
+
+
+class GameWriter:
+    """Фоновий потік, який пакетно записує результати ігор.
+
+    submit() лише кладе запис у чергу. Потік забирає все, що накопичилося,
+    і вставляє одним пакетом в одній транзакції; збережені рядки
+    (id, date, result, difficulty) з'являються в черзі saved (None, якщо
+    запис не вдався).
+    """
+
+    def __init__(self, db_path, batch_size=64):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.saved = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="game-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, record):
+        self.queue.put(record)
+
+    def close(self, timeout=5):
+        """Дописує чергу і зупиняє потік."""
+        self.queue.put(None)
+        self.thread.join(timeout)
+
+    def _run(self):
+        conn = connect(self.db_path, writer=True)
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                running = False
+                batch = [record for record in batch if record is not None]
+            if batch:
+                self._write(conn, batch)
+        conn.close()
+
+    def _write(self, conn, batch):
+        try:
+            saved = write_games(conn, batch)
+        except sqlite3.Error as e:
+            print(f"Помилка запису гри: {e}")
+            saved = [None] * len(batch)  # Щоб очікувачі не чекали вічно
+        for row in saved:
+            self.saved.put(row)
+
+
+def count_games(conn):
+    """Кількість ігор з рядка '*' у stats_summary, без COUNT(*) по всій таблиці."""
+    row = conn.execute("SELECT games FROM stats_summary WHERE difficulty = '*'").fetchone()
+    return row[0] if row else 0
+
+
+def fetch_games_before(conn, before_id=None, limit=50):
+    """Наступна сторінка від новіших до старіших: ігри з id < before_id."""
+    if before_id is None:
+        return conn.execute(
+            f"SELECT {GAME_COLUMNS} FROM games ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+    return conn.execute(
+        f"SELECT {GAME_COLUMNS} FROM games WHERE id < ? ORDER BY id DESC LIMIT ?",
+        (before_id, limit)
+    ).fetchall()
+
+
+def fetch_games_after(conn, after_id, limit=50):
+    """Попередня сторінка: ігри з id > after_id, упорядковані від новіших."""
+    rows = conn.execute(
+        f"SELECT {GAME_COLUMNS} FROM games WHERE id > ? ORDER BY id ASC LIMIT ?",
+        (after_id, limit)
+    ).fetchall()
+    rows.reverse()
+    return rows
+
+
+def fetch_move_log(conn, game_id):
+    """Запис ходів гри або None, якщо його немає (наприклад, у старих іграх)."""
+    row = conn.execute("SELECT move_log FROM games WHERE id = ?", (game_id,)).fetchone()
+    return row[0] if row else None
+
+
+def fetch_games_at(conn, offset, limit=50):
+    """Сторінка за позицією; потрібна лише для стрибків повзунком скролбара.
+
+    Замість OFFSET, який проходить усі пропущені рядки, позиція
+    перераховується в id від найбільшого: ігри лише додаються, тож id
+    ідуть підряд, а після видалень стрибок буде лише приблизним.
+    """
+    last_id = conn.execute("SELECT MAX(id) FROM games").fetchone()[0]
+    if last_id is None:
+        return []
+    rows = fetch_games_before(conn, last_id - offset + 1, limit)
+    if len(rows) < limit:
+        # Позиція за межами таблиці - показуємо найстаріші ігри
+        rows = fetch_games_after(conn, 0, limit)
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Обслуговування бази даних ігор")
+    parser.add_argument("command", choices=["rebuild-stats"], help="rebuild-stats: перерахувати статистику")
+    parser.add_argument("db", nargs="?", default="game_data.db", help="шлях до бази даних")
+    args = parser.parse_args()
+
+    # Гра може бути відкрита: те саме з'єднання записувача, що й у GameWriter
+    conn = connect(args.db, writer=True)
+    create_schema(conn)
+    with_retry(lambda: rebuild_stats(conn))
+    summary, _ = fetch_stats(conn)
+    print(f"Статистику перераховано: {summary.get('*', (0,))[0]} ігор")
+    conn.close()
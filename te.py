@@ -2,16 +2,30 @@ import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
 from tkinter import Toplevel, Label, Button
-import random
-import sqlite3
+import threading
 from datetime import datetime
 import os
 import sys
-import json
 import time
+from engine import Board, DIFFICULTY_SETTINGS, new_seed
+from boardpool import BoardPool
+from render import ButtonBoardView, CanvasBoardView
+from settings import SettingsStore
+from history import HistoryView
+import boardcode
+import instrument
+import movelog
+import noguess
+from probability import ProbabilityEngine
+import solver
+import storage
+from topology import TOPOLOGIES, TOPOLOGY_NAMES
 os.environ['LANG'] = 'uk_UA.UTF-8'
 import locale
-locale.setlocale(locale.LC_ALL, 'uk_UA')
+try:
+    locale.setlocale(locale.LC_ALL, 'uk_UA')
+except locale.Error:
+    pass  # Локалі немає (наприклад, на Linux без uk_UA) - лишаємо стандартну
 
 
 
@@ -28,8 +42,19 @@ db_path = os.path.join(folder, filename)
 # Створення папки якщо вона не існує
 os.makedirs(folder, exist_ok=True)
 
+# Обробники подій, які вимірюються при MINER_TRACE
+TRACED_CALLBACKS = [
+    "left_click", "right_click", "middle_click", "start_game", "toggle_theme",
+    "set_difficulty", "timer_tick", "show_history", "show_hint"
+]
+
 class Minesweeper:
     def __init__(self, root, size=10, mines=10):
+        # Вимірювання встановлюється до створення віджетів, які копіюють обробники
+        self.tracer = instrument.from_environment()
+        if self.tracer:
+            self.tracer.install(root, self, TRACED_CALLBACKS)
+
         self.difficulty_var = tk.StringVar()
         self.root = root
         self.settings_file = "settings.json"
@@ -42,56 +67,77 @@ class Minesweeper:
         self.debug_mode = True  # Змініть на False для вимкнення
         self.mine_color_enabled = False
         self.dark_mode = False
-        self.dialog_enabled = True
+        self.safe_opening = True  # Перший хід відкриває область 3x3 без мін
         self.last_difficulty = "Легкий"
         self.game_active = False
         self.game_over = False
         self.first_click = True
-        self.flagged = set()
+        self.game_started_at = None
+        self.moves = 0
+        self.clicks = 0
+        self.pending_saves = 0
         self.history_window = None
+        self.history_view = None
+        self.stats_window = None
         self.info_window = None
-        self.buttons = []
-        self.board = []
+        self.board_view = None
+        self.engine = None
+        self.move_log = None
+        self.next_seed = None   # Seed із введеного коду поля для наступної гри
+        self.board_code = ""    # Код поточного поля (для збереження гри)
+        self.board_code_var = tk.StringVar()  # Поле введення коду у вікні налаштувань
+        self.replay_window = None
+        self.replay_data = None
+        self.replay_moves = []
+        self.replay_position = 0
+        self.replay_after_id = None
+        self.replay_saved_size = None
         self.timer_window = None
         self.timer_label = None
         self.timer_id = None
         self.timer_pos = {"x": 100, "y": 100}
         self.timer_geometry = "150x80"
         self.remaining_time = 0
+        self.renderer = "canvas"
+        self.heatmap_enabled = False
+        self.no_guess = False
+        self.topology = "rect"  # Сусідство клітинок (topology.TOPOLOGIES)
+        self.start_index = None  # Стартова клітинка поля без вгадування
+        self.board_fresh = False  # Поле ще не грали - start_game не створює нове
+        # Кеш полів без вгадування читається з диска лише при потребі (get_noguess_cache)
+        self.noguess_cache = None
+        self.probability_engine = ProbabilityEngine()
         
         self.load_settings()
         self.init_colors()
+        # Наступні поля готуються у простої Tk, поки гравець грає
+        self.board_pool = BoardPool(self.generate_board, self.board_pool_depth, root=self.root)
         
         # Ініціалізація змінних Tkinter після завантаження налаштувань
-        self.dialog_var = tk.BooleanVar(value=self.dialog_enabled)
+        self.safe_opening_var = tk.BooleanVar(value=self.safe_opening)
         self.difficulty_var = tk.StringVar(value=self.last_difficulty)
         self.mine_color_var = tk.BooleanVar(value=self.mine_color_enabled)
+        self.heatmap_var = tk.BooleanVar(value=self.heatmap_enabled)
+        self.no_guess_var = tk.BooleanVar(value=self.no_guess)
+        self.topology_var = tk.StringVar(value=TOPOLOGY_NAMES[self.topology])
         
         # Встановлення параметрів гри
-        difficulty_settings = {
-            "Легкий": (10, 10),
-            "Середній": (12, 20),
-            "Важкий": (16, 40)
-        }
-        self.size, self.mines = difficulty_settings.get(self.last_difficulty, (10, 10))
+        self.size, self.mines = DIFFICULTY_SETTINGS.get(self.last_difficulty, (10, 10))
         
         self.create_widgets()
         self.update_colors()
         
-        # База даних
-        self.conn = sqlite3.connect(self.db_path)
-        self.create_db()
+        # База даних відкривається після першого кадру або при першій потребі (ensure_db);
+        # вікно таймера створює start_game
+        self.conn = None
+        self.writer = None
         self._update_difficulty_menu()
         self.setup_initial_state()
         
-        # Таймер
-        if getattr(self, 'timer_enabled', False):
-            self.create_timer_window()
-            if self.game_active:
-                self.start_timer()
-        
         # Збереження налаштувань після повної ініціалізації
         self.save_settings()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(100, self.ensure_db)
 
     def init_colors(self):
         """Ініціалізує кольорові змінні на основі теми."""
@@ -104,10 +150,6 @@ class Minesweeper:
             self.mine_color = "#000000"
             self.flag_color = "#f39c12"
             self.hover_color = "#404EED"
-            self.style.configure("Vertical.TScrollbar",
-                                background=self.button_bg_color,
-                                troughcolor=self.bg_color,
-                                arrowcolor=self.text_color)
             self._configure_scrollbar_style()
             self.style.configure("TCheckbutton", 
                            background=self.bg_color,
@@ -116,10 +158,6 @@ class Minesweeper:
                            indicatordiameter=15,
                            indicatorbackground=self.button_bg_color,
                            relief="flat")
-            self.style.configure('TCheckbutton', 
-                    background=self.bg_color,
-                    foreground=self.text_color,
-                    indicatorbackground=self.button_bg_color)
             self.style.map("TMenubutton",
                       background=[('active', self.button_active_bg)]),
             self.style.map("TCheckbutton",
@@ -149,10 +187,6 @@ class Minesweeper:
                            indicatordiameter=15,
                            indicatorbackground=self.button_bg_color,
                            relief="flat")
-            self.style.configure('TCheckbutton', 
-                    background=self.bg_color,
-                    foreground=self.text_color,
-                    indicatorbackground=self.button_bg_color)
             self.style.map("TCheckbutton",
                           background=[("active", self.bg_color)],
                           indicatorcolor=[("selected", self.text_color)],
@@ -205,6 +239,7 @@ class Minesweeper:
         self.root.configure(bg=self.bg_color)
         self.menu_frame.configure(bg=self.bg_color)
         self.game_frame.configure(bg=self.bg_color)
+        self.board_view.widget.configure(bg=self.bg_color)
         
         # Стилізація ttk віджетів
         self.style.configure("TButton", 
@@ -216,7 +251,7 @@ class Minesweeper:
         
         # Оновлення кнопок меню
         for btn in [self.start_button, self.toggle_theme_button, 
-                   self.history_button, self.info_button]:
+                   self.history_button, self.info_button, self.hint_button]:
             btn.configure(style="TButton")
         
         # Чекбокс
@@ -229,10 +264,11 @@ class Minesweeper:
         theme_text = "Світла тема" if self.dark_mode else "Темна тема"
         self.toggle_theme_button.config(text=theme_text)
 
-        for row in self.buttons:
-            for btn in row:
-                current_text = btn.cget("text")
-                btn.config(
+        for row in range(self.board_view.rows):
+            for col in range(self.board_view.cols):
+                current_text = self.board_view.cget(row, col, "text")
+                self.board_view.configure(
+                    row, col,
                     bg=self.button_bg_color,
                     fg=self.text_color,
                     activebackground=self.hover_color,
@@ -374,34 +410,28 @@ class Minesweeper:
         """Завантажує налаштування зі збереженням українських символів."""
         default_settings = {
             "dark_mode": False,
-            "dialog_enabled": True,
+            "safe_opening": True,
             "last_difficulty": "Легкий",
             "timer_enabled": False,
             "timer_pos": {"x": 100, "y": 100},
             "timer_geometry": "150x80",
             "mine_color_enabled": False,
-            "debug_mode": False
+            "debug_mode": False,
+            "renderer": "canvas",
+            "heatmap_enabled": False,
+            "no_guess": False,
+            "topology": "rect",
+            "board_pool_depth": 2
         }
-        try:
-            with open(self.settings_file, "r", encoding='utf-8') as f:
-                saved_settings = json.load(f)
-                # М'яке оновлення налаштувань
-                self.debug_mode = saved_settings.get("debug_mode", default_settings["debug_mode"])
-                self.dark_mode = saved_settings.get("dark_mode", default_settings["dark_mode"])
-                self.dialog_enabled = saved_settings.get("dialog_enabled", default_settings["dialog_enabled"])
-                self.last_difficulty = saved_settings.get("last_difficulty", default_settings["last_difficulty"])
-                self.timer_enabled = saved_settings.get("timer_enabled", default_settings["timer_enabled"])
-                self.timer_pos = saved_settings.get("timer_pos", default_settings["timer_pos"])
-                self.timer_geometry = saved_settings.get("timer_geometry", default_settings["timer_geometry"])
-                self.debug_mode = saved_settings.get("debug_mode", default_settings["debug_mode"])
-                self.mine_color_enabled = saved_settings.get("mine_color_enabled", default_settings["mine_color_enabled"])
-            if hasattr(self, 'mine_color_var'):
-                self.mine_color_var.set(self.mine_color_enabled)  # Синхронізуємо Tkinter-змінну
-                
-        except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-            print(f"Помилка завантаження налаштувань: {e}, використовуються значення за замовчуванням")
-            self.__dict__.update(default_settings)
-            self.save_settings()
+        self.settings = SettingsStore(self.settings_file, default_settings, root=self.root)
+        self.settings.load()
+        # М'яке оновлення налаштувань
+        for key in default_settings:
+            setattr(self, key, self.settings.get(key))
+        if self.topology not in TOPOLOGIES:
+            self.topology = "rect"
+        if hasattr(self, 'mine_color_var'):
+            self.mine_color_var.set(self.mine_color_enabled)  # Синхронізуємо Tkinter-змінну
             
     def toggle_mine_color(self):
         """Перемикає та зберігає стан підсвітки мін"""
@@ -411,32 +441,85 @@ class Minesweeper:
         
         # Оновлюємо відображення мін
         if self.game_active:
-            for row in range(self.size):
-                for col in range(self.size):
-                    if self.board[row][col] == 'M' and self.buttons[row][col]['state'] == 'disabled':
-                        bg_color = "red" if self.mine_color_enabled else self.button_bg_color
-                        self.buttons[row][col].config(bg=bg_color)
+            bg_color = "red" if self.mine_color_enabled else self.button_bg_color
+            for index in self.engine.mine_indices():
+                row, col = self.engine.coords(index)
+                if self.board_view.cget(row, col, "state") == 'disabled':
+                    self.board_view.configure(row, col, bg=bg_color)
 
             
 
+    def toggle_heatmap(self):
+        """Вмикає або вимикає карту ймовірностей мін."""
+        self.heatmap_enabled = self.heatmap_var.get()
+        self.save_settings()
+        if self.heatmap_enabled:
+            self.update_heatmap()
+        elif self.game_active and not self.game_over:
+            for index in range(self.engine.cells):
+                if not self.engine.revealed[index]:
+                    row, col = self.engine.coords(index)
+                    self.board_view.configure(row, col, bg=self.button_bg_color)
+
+    def toggle_no_guess(self):
+        """Вмикає поля без вгадування (діє з наступної гри)."""
+        self.no_guess = self.no_guess_var.get()
+        self.save_settings()
+        self.board_fresh = False  # Поле згенеровано за старим режимом
+        if self.no_guess:
+            self._refill_noguess_cache()
+        self.board_pool.configure(self.pool_key())
+
+    def get_noguess_cache(self):
+        """Кеш полів без вгадування (читається з диска при першому зверненні)."""
+        if self.noguess_cache is None:
+            self.noguess_cache = noguess.BoardCache(os.path.join(folder, "noguess_cache.json"))
+            self.noguess_cache.load()
+        return self.noguess_cache
+
+    def _refill_noguess_cache(self):
+        """Догенеровує кеш полів без вгадування у фоновому потоці."""
+        cache = self.get_noguess_cache()
+        if cache.needs_refill(self.size, self.size, self.mines, self.topology):
+            threading.Thread(
+                target=cache.refill,
+                args=(self.size, self.size, self.mines, noguess.REFILL_WORKERS, self.topology),
+                name="noguess-refill",
+                daemon=True
+            ).start()
+
+    def update_heatmap(self):
+        """Фарбує закриті клітинки за ймовірністю міни: зелений - безпечно, червоний - міна."""
+        if not self.heatmap_enabled or not self.game_active or self.game_over:
+            return
+        probabilities = self.probability_engine.compute(self.engine)
+        if probabilities is None:
+            return  # Суперечливі прапорці - карту не показуємо
+        for index, p in enumerate(probabilities):
+            if p is None or self.engine.flagged[index]:
+                continue
+            row, col = self.engine.coords(index)
+            color = f"#{int(144 + 111 * p):02x}{int(238 - 178 * p):02x}{int(144 - 84 * p):02x}"
+            self.board_view.configure(row, col, bg=color)
+
     def save_settings(self):
-        """Зберігає поточний стан всіх налаштувань"""
-        settings = {
+        """Зберігає поточний стан всіх налаштувань (запис на диск відкладається)"""
+        self.settings.update({
             # Додаємо всі необхідні параметри
             "dark_mode": self.dark_mode,
-            "dialog_enabled": self.dialog_enabled,
+            "safe_opening": self.safe_opening,
             "last_difficulty": self.difficulty_var.get(),
             "timer_enabled": self.timer_enabled,
             "timer_pos": self.timer_pos,
             "timer_geometry": self.timer_geometry,
             "mine_color_enabled": self.mine_color_enabled,
-            "debug_mode": self.debug_mode
-        }
-        try:
-            with open(self.settings_file, "w", encoding='utf-8') as f:
-                json.dump(settings, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            print(f"Помилка збереження налаштувань: {e}")
+            "debug_mode": self.debug_mode,
+            "renderer": self.renderer,
+            "heatmap_enabled": self.heatmap_enabled,
+            "no_guess": self.no_guess,
+            "topology": self.topology,
+            "board_pool_depth": self.board_pool_depth
+        })
 
     def toggle_theme(self):
         """Перемикає тему та оновлює всі елементи."""
@@ -445,30 +528,17 @@ class Minesweeper:
         self.dark_mode = not self.dark_mode
         self.init_colors()
         
-        # Оновлюємо головне вікно
+        # Оновлюємо головне вікно (ігрове поле перемалює restart_game)
         self.update_colors()
-        
-        # Оновлюємо ігрове поле
-        for row in self.buttons:
-            for btn in row:
-                btn.configure(
-                    bg=self.button_bg_color, 
-                    fg=self.text_color,
-                    activebackground=self.hover_color
-                )
+        self._update_difficulty_menu_style()
+        self._update_menu_colors()
 
         # Оновлюємо додаткові вікна
-        for window in [self.history_window, self.info_window]:
+        for window in [self.history_window, self.stats_window, self.info_window]:
             if window and window.winfo_exists():
                 window.configure(bg=self.bg_color)
                 self._update_widgets(window)  # Викликаємо рекурсивне оновлення
 
-            self._update_difficulty_menu_style()
-            self._update_menu_colors()
-            self.init_colors()
-            self.update_colors()
-            self.save_settings()
-            self.restart_game(confirm=False)  # Відключаємо повторне підтвердження
         if self.timer_window and self.timer_window.winfo_exists():
             self.timer_window.configure(bg=self.bg_color)
             self.timer_label.config(
@@ -478,7 +548,7 @@ class Minesweeper:
             )
     
         self.save_settings()
-        self.restart_game(confirm=False)
+        self.restart_game(confirm=False)  # Відключаємо повторне підтвердження
 
     def toggle_timer(self):
         """Обробник перемикання таймера з виправленнями"""
@@ -554,10 +624,14 @@ class Minesweeper:
         
         self.info_button = ttk.Button(self.menu_frame, text="...", command=self.show_info)
         self.info_button.grid(row=0, column=4, padx=5, pady=5, sticky="w")
+
+        self.hint_button = ttk.Button(self.menu_frame, text="💡", width=3, command=self.show_hint)
+        self.hint_button.grid(row=0, column=5, padx=5, pady=5, sticky="w")
         
         # Ігрове поле
         self.game_frame = tk.Frame(self.root, bg=self.bg_color)
         self.game_frame.pack(pady=10)
+        self.create_board_view()
 
         self._update_difficulty_menu_style()  
         self._update_menu_colors() 
@@ -615,7 +689,6 @@ class Minesweeper:
                         "x": int(parts[-2]),
                         "y": int(parts[-1])
                     }
-                    # Примусове збереження при кожній зміні
                     self.save_settings()
             except Exception as e:
                 print(f"Помилка збереження позиції: {e}")
@@ -641,7 +714,7 @@ class Minesweeper:
         new_y = max(0, min(new_y, self.root.winfo_screenheight() - self.timer_window.winfo_height()))
         
         self.timer_window.geometry(f"+{new_x}+{new_y}")
-        self.save_position()  # Зберігаємо позицію під час перетягування
+        # Позиція зберігається лише після відпускання кнопки (save_position)
 
 
     def start_timer(self):
@@ -750,41 +823,36 @@ class Minesweeper:
     def setup_initial_state(self):
         """Очищає область гри і створює нову гру."""
         self.game_active = False
-        self.clear_game_frame()
         
         # Ініціалізація поля
-        self.board = [[0 for _ in range(self.size)] for _ in range(self.size)]
-        self.place_mines()
+        self.new_board()
         
-        # Створюємо кнопки
+        # Створюємо кнопки (міни режиму налагодження показує create_board)
         self.create_board()
-        self.update_numbers()
-        
-        # Оновлюємо кольори для режиму налагодження
-        if self.debug_mode:
-            for row in range(self.size):
-                for col in range(self.size):
-                    if self.board[row][col] == 'M':
-                        self.buttons[row][col].config(
-                            bg="#8B4513",
-                            text="💣",
-                            state="disabled" if not self.game_active else "normal"
-                        )
         
         self.set_board_state("disabled")
         self.game_active = False
+        self.board_fresh = True
 
     def update_button_styles(self):
         """Оновлює стиль кнопок у меню."""
-        for btn in [self.start_button, self.toggle_theme_button, self.history_button, self.info_button]:
+        for btn in [self.start_button, self.toggle_theme_button, self.history_button, self.info_button,
+                    self.hint_button]:
             btn.config(style="TButton")
         self.difficulty_menu.config(style="TMenubutton")
 
+    def ensure_db(self):
+        """Відкриває базу і запускає фоновий записувач, якщо це ще не зроблено."""
+        if self.conn is None:
+            self.connect_db()
+            self.create_db()
+            self.writer = storage.GameWriter(self.db_path)
+        return self.conn
+
     def connect_db(self):
         """Підключення до бази даних з перевіркою існування файлу"""
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            print(f"Підключено до бази даних: {self.db_path}")
+            self.conn = storage.connect(self.db_path)
         except Exception as e:
             messagebox.showerror("Помилка", f"Не вдалося підключитися до БД: {str(e)}")
             sys.exit(1)
@@ -792,41 +860,60 @@ class Minesweeper:
     def create_db(self):
         """Створення таблиць якщо вони не існують"""
         try:
-            with self.conn:
-                self.conn.execute("""
-                    CREATE TABLE IF NOT EXISTS games (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        date TEXT,
-                        result TEXT,
-                        size INTEGER,
-                        difficulty TEXT
-                    )
-                """)
+            storage.create_schema(self.conn)
             #print("Таблиці БД успішно створені/перевірені")
         except Exception as e:
             messagebox.showerror("Помилка", f"Помилка створення таблиць: {str(e)}")
 
     def save_game(self, result):
-        """Зберігає результат гри в базу даних."""
-        if self.conn:
-            with self.conn:
-                self.conn.execute(
-                    "INSERT INTO games (date, result, difficulty) VALUES (datetime('now'), ?, ?)", 
-                    (result, self.difficulty_var.get())  # Use actual difficulty from game state
-                )
-            if self.history_window and self.history_window.winfo_exists():
-                self.load_history_data()
+        """Передає результат гри фоновому записувачу БД."""
+        duration_ms = None
+        if self.game_started_at is not None:
+            duration_ms = int((time.monotonic() - self.game_started_at) * 1000)
+        self.ensure_db()
+        self.writer.submit(storage.game_record(
+            result,
+            self.difficulty_var.get(),  # Use actual difficulty from game state
+            size=self.size,
+            duration_ms=duration_ms,
+            moves=self.moves,
+            clicks=self.clicks,
+            seed=self.board_code,
+            move_log=self.move_log.encode()
+        ))
+        self.pending_saves += 1
+        if self.pending_saves == 1:
+            self.root.after(100, self._poll_saved_games)
+
+    def _poll_saved_games(self):
+        """Додає у відкрите вікно історії ігри, які вже записав фоновий потік."""
+        while not self.writer.saved.empty():
+            row = self.writer.saved.get_nowait()
+            self.pending_saves -= 1
+            if row and self.history_window and self.history_window.winfo_exists():
+                self.history_view.add_game(row)  # Додаємо лише нову гру
+        if self.pending_saves > 0 and self.writer.thread.is_alive():
+            self.root.after(100, self._poll_saved_games)
 
     def start_game(self):
         """Початок нової гри з перевіркою підтвердження"""
-        # Викликаємо перезапуск з підтвердженням, якщо гра активна
-        if not self.restart_game(confirm=self.game_active):
+        # Викликаємо перезапуск з підтвердженням, якщо гра активна;
+        # ще не зігране поле (після запуску, зміни рівня чи теми) використовуємо як є
+        if not self.board_fresh and not self.restart_game(confirm=self.game_active):
             return
+        self.board_fresh = False
+        self.next_seed = None  # Введений код діє лише на одну гру
         
         # Ініціалізація стану гри
         self.game_active = True
         self.game_over = False
+        self.game_started_at = time.monotonic()
         self.set_board_state("normal")
+        if self.start_index is not None:
+            # Поле без вгадування починається з відкритої стартової клітинки
+            self.reveal_cell(*self.engine.coords(self.start_index))
+            self.first_click = False
+        self.update_heatmap()
         
         # Обробка таймера
         if self.timer_enabled:
@@ -840,22 +927,21 @@ class Minesweeper:
             if not self.confirm_action("restart"):
                 return False
         
+        self.close_replay(restart=False)
+
         # Змінено порядок дій:
         self.game_active = False
         self.game_over = False
         self.first_click = True
-        self.flagged.clear()
+        self.game_started_at = None
+        self.moves = 0
+        self.clicks = 0
         self.stop_timer()
         
-        # Спочатку оновлюємо дошку
-        self.board = [[0 for _ in range(self.size)] for _ in range(self.size)]
-        self.place_mines()  # Спочатку розміщуємо міни
-        
         # Потім створюємо кнопки
         self.init_colors()
-        self.clear_game_frame()
+        self.new_board()  # Спочатку розміщуємо міни
         self.create_board()
-        self.update_numbers()
         self.set_board_state("disabled")
         
         # Перезапуск таймера
@@ -865,199 +951,112 @@ class Minesweeper:
             self.create_timer_window()
             self.start_timer()
         
+        self.board_fresh = True
         return True
 
         
-    def clear_game_frame(self):
-        """Очищає область гри."""
-        if hasattr(self, 'game_frame'):
-            for widget in self.game_frame.winfo_children():
-                widget.destroy()
-
-        self.buttons = []
-        self.board = []
+    def pool_key(self):
+        """Ключ рівня для пулу полів: (розмір, міни, без вгадування, топологія)."""
+        return self.size, self.mines, self.no_guess, self.topology
+
+    def generate_board(self, key, seed=None):
+        """Новий рушій поля рівня key з мінами за seed (без seed - новий або з кешу)."""
+        size, mines, no_guess, topology = key
+        if seed is None and no_guess:
+            # Фабрика працює в потоці Tk: лише бере готовий seed з пам'яті.
+            # Якщо кеш ще не заповнено, поле буде звичайним - пошук не блокує гру
+            seed = self.get_noguess_cache().pop(size, size, mines, topology)
+            self._refill_noguess_cache()
+        if seed is None:
+            seed = new_seed()
+        board = Board(size, size, mines, topology=topology)
+        board.place_mines(seed=seed)
+        board.update_numbers()
+        return board
+
+    def new_board(self):
+        """Бере нове поле з пулу (або за кодом поля, якщо його введено)."""
+        if self.next_seed is not None:
+            self.engine = self.generate_board(self.pool_key(), self.next_seed)
+        else:
+            self.board_pool.configure(self.pool_key())  # Після зміни рівня пул поповнюється заново
+            self.engine = self.board_pool.take()
+        self.start_index = noguess.start_cell(self.engine) if self.no_guess else None
+        self.board_code = boardcode.encode(self.size, self.size, self.mines, self.engine.seed,
+                                           self.engine.topology)
+        self.board_code_var.set(self.board_code)
+        self.move_log = movelog.MoveLog(self.engine)
+
+    def create_board_view(self):
+        """Створює відображення поля відповідно до налаштувань."""
+        view_class = ButtonBoardView if self.renderer == "buttons" else CanvasBoardView
+        self.board_view = view_class(self.game_frame, self.left_click, self.right_click, self.middle_click)
+        if self.tracer:
+            self.tracer.install(self.root, self.board_view, ["flush"])
+
+    def board_cell_size(self, cols, topology):
+        """Розмір клітинки: шестикутне поле не ширше за прямокутне того ж рівня.
+
+        Вікно кожного рівня має фіксовану ширину під прямокутне поле, а
+        непарні рядки шестикутного зсунуті ще на пів клітинки.
+        """
+        cell_size = max(8, min(44, 704 // cols))
+        if topology == "hex":
+            cell_size = max(8, cell_size * 2 * cols // (2 * cols + 1))
+        return cell_size
 
     def create_board(self):
         """Створює поле з оновленими кольорами"""
-        button_size = 40 - (self.size - 8) * 4
-        self.buttons = []
-        
-        for row in range(self.size):
-            row_buttons = []
-            for col in range(self.size):
-                # Визначаємо стиль для кнопок
-                bg_color = self.button_bg_color
-                text = ""
-                
-                # Якщо режим налагодження увімкнено і це міна
-                if self.debug_mode and self.board[row][col] == 'M':
-                    bg_color = "#8B4513"  # Коричневий колір
-                    text = "💣"  # Додаємо іконку міни
-                
-                btn = tk.Button(
-                    self.game_frame,
-                    text=text,
-                    width=button_size,
-                    height=button_size,
-                    bg=bg_color,
-                    fg=self.text_color,
-                    activebackground=self.hover_color,
-                    highlightthickness=0,
-                    disabledforeground=self.text_color,
-                    command=lambda r=row, c=col: self.left_click(r, c)
-                )
-                btn.bind("<Button-3>", lambda event, r=row, c=col: self.right_click(r, c))
-                btn.grid(row=row, column=col, padx=1, pady=1, sticky="nsew")
-                row_buttons.append(btn)
-            self.buttons.append(row_buttons)
+        self.board_view.build(
+            self.size, self.size, self.board_cell_size(self.size, self.topology),
+            shift_odd_rows=self.topology == "hex",
+            text="",
+            bg=self.button_bg_color,
+            fg=self.text_color,
+            activebackground=self.hover_color,
+            disabledforeground=self.text_color,
+            state="normal"
+        )
 
-        for row in range(self.size):
-            self.game_frame.rowconfigure(row, weight=1)
-            self.game_frame.columnconfigure(row, weight=1)
+        # Якщо режим налагодження увімкнено - показуємо міни
+        if self.debug_mode:
+            for index in self.engine.mine_indices():
+                row, col = self.engine.coords(index)
+                self.board_view.configure(row, col, bg="#8B4513", text="💣")  # Коричневий колір
 
     def set_board_state(self, state):
         """Встановлює стан всіх кнопок"""
-        for row_buttons in self.buttons:
-            for btn in row_buttons:
-                current_text = btn.cget("text")
-                # Зберігаємо колір мін у режимі налагодження
-                if self.debug_mode and current_text == "💣":
-                    btn.config(state=state, bg="#8B4513", disabledbackground="#8B4513")
-                else:
-                    btn.config(state=state)
-
-    def place_mines(self):
-        """Розміщує міни на випадкових позиціях."""
-        # Переконуємось що дошка ініціалізована
-        if not self.board or len(self.board) != self.size:
-            self.board = [[0 for _ in range(self.size)] for _ in range(self.size)]
-        
-        mines_placed = 0
-        while mines_placed < self.mines:
-            row = random.randint(0, self.size-1)
-            col = random.randint(0, self.size-1)
-            if self.board[row][col] != 'M':
-                self.board[row][col] = 'M'
-                mines_placed += 1
-
-    def update_numbers(self):
-        """Оновлює числові значення на клітинках навколо мін."""
-        # Перевіряємо коректність розміру дошки
-        if len(self.board) != self.size or any(len(row) != self.size for row in self.board):
-            self.board = [[0 for _ in range(self.size)] for _ in range(self.size)]
-            self.place_mines()
-        
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.board[row][col] != 'M':
-                    # Обчислюємо кількість мін у сусідніх клітинках з перевіркою меж
-                    mines_count = 0
-                    for r in range(max(0, row-1), min(self.size, row+2)):
-                        for c in range(max(0, col-1), min(self.size, col+2)):
-                            if self.board[r][c] == 'M':
-                                mines_count += 1
-                    self.board[row][col] = mines_count
-
-                    
-    def custom_dialog(self):
-        """Метод класу для створення діалогового вікна."""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Вибір")
-        dialog.geometry("340x100")
-        dialog.resizable(False, False)
-        dialog.configure(bg=self.bg_color)
-
-        label = tk.Label(dialog, text="Ви натрапили на міну! Хочете продовжити?", 
-                         font=("Arial", 12), bg=self.bg_color, fg=self.text_color)
-        label.pack(pady=10)
+        self.board_view.set_state(state)
 
-        result = {"choice": None}
-
-        def on_yes():
-            result["choice"] = True
-            dialog.destroy()
-
-        def on_no():
-            result["choice"] = False
-            dialog.destroy()
-
-        button_frame = tk.Frame(dialog, bg=self.bg_color)
-        button_frame.pack(pady=10)
-
-        # Оновлений стиль для кнопок
-        style = ttk.Style()
-        style.configure("RoundedButton.TButton",
-                        font=("Arial", 7, "bold"),
-                        relief="flat",
-                        padding=7,
-                        width=7,
-                        anchor="center",
-                        background=self.button_bg_color,
-                        foreground=self.text_color,  # Колір тексту
-                        borderwidth=1,
-                        focusthickness=3)
-        
-        style.map("RoundedButton.TButton",
-                  background=[("active", self.button_active_bg)],
-                  foreground=[("active", self.text_color)])
-
-        # Кнопка "Так"
-        yes_button = ttk.Button(button_frame, text="Так", style="RoundedButton.TButton", command=on_yes)
-        yes_button.pack(side="left", padx=10)
-
-        # Кнопка "Ні"
-        no_button = ttk.Button(button_frame, text="Ні", style="RoundedButton.TButton", command=on_no)
-        no_button.pack(side="right", padx=10)
-
-        # Не дозволяє закрити вікно за допомогою X вікна
-        dialog.protocol("WM_DELETE_WINDOW", lambda: None)
-
-        # Вікно стає модальним, чекає, поки користувач не вибере
-        dialog.transient(self.root)
-        dialog.grab_set()
-        self.root.wait_window(dialog)
-
-        return result["choice"]
-    
     def left_click(self, row, col):
         """Обробляє лівий клік на клітинці."""
-        if not self.game_active or self.game_over or (row, col) in self.flagged:
+        if not self.game_active or self.game_over:
+            return
+        self.clicks += 1
+        if self.engine.is_flagged(row, col):
             return
 
-        if self.board[row][col] == 'M':
-            if self.first_click and self.dialog_enabled:  # Діалог працює, якщо він увімкнений
-                choice = self.custom_dialog()  # Викликаємо діалогове вікно
-                if choice is None:  # Якщо закрили без вибору - нічого не робимо
-                    return
-                
-                self.first_click = False  # Після першого кліку більше не з’являється діалог у цій грі
-
-                if choice:
-                    # Гравець хоче продовжити
-                    self.buttons[row][col].config(text="💣", bg="red", fg=self.mine_color, state="disabled")
-                    self.reveal_cell(row, col)
-                    return
-                else:
-                    # Гравець обрав програти
-                    self.reveal_mines()
-                    self.game_over = True
-                    self.stop_timer()
-                    self.save_game("Програв")
-                    self.show_custom_dialog("Гра завершена", "Ви програли!")
-                    self.game_active = False
-                    self.set_board_state("disabled")
-                    return
-            else:
-                # Якщо діалог вимкнений або це не перший клік – одразу програємо
-                self.buttons[row][col].config(text="💣", bg="red", fg=self.mine_color, state="disabled")
-                self.reveal_mines()
-                self.game_over = True
-                self.stop_timer()
-                self.save_game("Програв")
-                self.show_custom_dialog("Гра завершена", "Ви програли!")
-                self.game_active = False
-                self.set_board_state("disabled")
-                return
+        if self.first_click:
+            # Міни остаточно розставляються на першому ході: з клітинки (і області 3x3) їх переносимо
+            moved = self.engine.clear_start(self.engine.index(row, col), area=self.safe_opening)
+            if self.debug_mode:
+                for old, new in moved:
+                    self.board_view.configure(*self.engine.coords(old), bg=self.button_bg_color, text="")
+                    self.board_view.configure(*self.engine.coords(new), bg="#8B4513", text="💣")
+
+        if self.engine.is_mine(row, col):
+            self.engine.reveal(row, col)
+            self.move_log.record(movelog.OP_REVEAL, self.engine.index(row, col))
+            self.moves += 1
+            self.board_view.configure(row, col, text="💣", bg="red", fg=self.mine_color, state="disabled")
+            self.reveal_mines()
+            self.game_over = True
+            self.stop_timer()
+            self.save_game("Програв")
+            self.show_custom_dialog("Гра завершена", "Ви програли!")
+            self.game_active = False
+            self.set_board_state("disabled")
+            return
 
         # Якщо це не міна, відкриваємо клітинку
         self.reveal_cell(row, col)
@@ -1066,56 +1065,62 @@ class Minesweeper:
         self.first_click = False
         # Після будь-якого кліку перевіряємо перемогу
         self.check_win()
+        self.update_heatmap()
 
     def reset_game(self):
         """Скидає гру для нового раунду."""
         self.game_over = False
         self.first_click = True  # Скидаємо стан першого кліку
-        self.flagged.clear()
-        self.buttons = []
-        self.board = []
+        self.engine = None
         self.create_widgets()  # Перестворюємо інтерфейс
 
     def reveal_cell(self, row, col):
         """Відкриває клітинку і показує число мін поруч."""
-        if self.buttons[row][col]['state'] == 'disabled':
-            return
-
-        value = self.board[row][col]
-        if value == 0:
-            self.buttons[row][col].config(text="", bg=self.reveal_color, state="disabled")
-            for r in range(max(0, row - 1), min(self.size, row + 2)):
-                for c in range(max(0, col - 1), min(self.size, col + 2)):
-                    self.reveal_cell(r, c)
-        else:
-            self.buttons[row][col].config(text=str(value), bg=self.reveal_color, state="disabled")
+        opened = self.engine.reveal(row, col)
+        if opened:
+            self.move_log.record(movelog.OP_REVEAL, self.engine.index(row, col))
+            self.moves += 1
+        self.show_revealed(opened)
+
+    def show_revealed(self, indices):
+        """Відображає клітинки, які відкрив рушій, одним пакетом."""
+        if self.tracer:
+            self.tracer.note(cascade=len(indices))
+        cols = self.engine.cols
+        self.board_view.configure_batch([
+            (index // cols, index % cols,
+             {"text": self.engine.counts[index] or "", "bg": self.reveal_color, "state": "disabled"})
+            for index in indices
+        ])
 
     def reveal_mines(self):
         """Відкриває всі міни та позначає невірні флажки"""
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.board[row][col] == 'M':
-                    bg_color = "red" if self.mine_color_enabled else self.button_bg_color
-                    
-                    if (row, col) in self.flagged:
-                        self.buttons[row][col].config(
-                            text="🚩",
-                            fg=self.flag_color,
-                            bg=bg_color,
-                            state="disabled",
-                            disabledforeground=self.flag_color
-                        )
-                    else:
-                        self.buttons[row][col].config(
-                            text="💣" if self.mine_color_enabled else " ",
-                            fg=self.mine_color,
-                            bg=bg_color,
-                            state="disabled"
-                        )
-        
-        for row, col in self.flagged:
-            if self.board[row][col] != 'M':
-                self.buttons[row][col].config(
+        bg_color = "red" if self.mine_color_enabled else self.button_bg_color
+        for index in self.engine.mine_indices():
+            row, col = self.engine.coords(index)
+            if self.engine.flagged[index]:
+                self.board_view.configure(
+                    row, col,
+                    text="🚩",
+                    fg=self.flag_color,
+                    bg=bg_color,
+                    state="disabled",
+                    disabledforeground=self.flag_color
+                )
+            else:
+                self.board_view.configure(
+                    row, col,
+                    text="💣" if self.mine_color_enabled else " ",
+                    fg=self.mine_color,
+                    bg=bg_color,
+                    state="disabled"
+                )
+        
+        for index in self.engine.flagged_indices():
+            row, col = self.engine.coords(index)
+            if not self.engine.mine[index]:
+                self.board_view.configure(
+                    row, col,
                     text="❌",
                     fg="red",
                     bg=self.button_bg_color,
@@ -1125,37 +1130,73 @@ class Minesweeper:
 
     def right_click(self, row, col):
         """Обробляє правий клік (додавання/зняття прапорця)."""
-        if self.buttons[row][col]['state'] == 'disabled' or self.game_over:
+        if not self.game_active or self.game_over:
             return
+        self.clicks += 1
 
-        if (row, col) in self.flagged:
-            self.buttons[row][col].config(text="", fg=self.text_color)
-            self.flagged.remove((row, col))
+        flagged = self.engine.toggle_flag(row, col)
+        if flagged is None:
+            return
+        self.move_log.record(movelog.OP_FLAG, self.engine.index(row, col))
+        self.moves += 1
+        if flagged:
+            self.board_view.configure(row, col, text="🚩", fg=self.flag_color, disabledforeground=self.flag_color)
         else:
-            self.buttons[row][col].config(text="🚩", fg=self.flag_color, disabledforeground=self.flag_color)
-            self.flagged.add((row, col))
+            self.board_view.configure(row, col, text="", fg=self.text_color)
         
         self.check_win()
+        self.update_heatmap()
+
+    def middle_click(self, row, col):
+        """Відкриває сусідів числа, навколо якого вже стоять усі прапорці."""
+        if not self.game_active or self.game_over:
+            return
+        self.clicks += 1
+
+        opened = self.engine.chord(row, col)
+        if opened or self.engine.lost:
+            self.move_log.record(movelog.OP_CHORD, self.engine.index(row, col))
+            self.moves += 1
+        if self.engine.lost:
+            index = self.engine.exploded
+            r, c = self.engine.coords(index)
+            self.board_view.configure(r, c, text="💣", bg="red", fg=self.mine_color, state="disabled")
+            self.reveal_mines()
+            self.game_over = True
+            self.stop_timer()
+            self.save_game("Програв")
+            self.show_custom_dialog("Гра завершена", "Ви програли!")
+            self.game_active = False
+            self.set_board_state("disabled")
+            return
+        if opened:
+            self.show_revealed(opened)
+            self.check_win()
+            self.update_heatmap()
+
+    def show_hint(self):
+        """Підсвічує клітинку, яку розв'язувач визначив напевно."""
+        if not self.game_active or self.game_over:
+            return
+        found = solver.hint(self.engine)
+        if found is None:
+            self.show_custom_dialog("Підказка", "Певних ходів немає - доведеться вгадувати")
+            return
+        index, is_mine = found
+        row, col = self.engine.coords(index)
+        hint_color = "#FFA500" if is_mine else "#7CFC00"  # Помаранчевий - міна, зелений - безпечно
+        self.board_view.configure(row, col, bg=hint_color)
+
+        def clear_hint():
+            # Клітинку могли вже відкрити - тоді її колір не чіпаємо
+            if self.board_view.cget(row, col, "bg") == hint_color:
+                self.board_view.configure(row, col, bg=self.button_bg_color)
+                self.update_heatmap()
+        self.root.after(1500, clear_hint)
 
     def check_win(self):
         """Перевірка на перемогу з правильним завершенням таймера"""
-        # Перевірка чи всі міни правильно позначені
-        correct_flags = all(
-            (r, c) in self.flagged 
-            for r in range(self.size) 
-            for c in range(self.size) 
-            if self.board[r][c] == 'M'
-        )
-        
-        # Перевірка чи всі безпечні клітинки відкриті
-        safe_revealed = all(
-            self.buttons[r][c]['state'] == 'disabled' 
-            for r in range(self.size) 
-            for c in range(self.size) 
-            if self.board[r][c] != 'M'
-        )
-        
-        if correct_flags and safe_revealed:
+        if self.engine.is_won():
             self.game_over = True
             self.stop_timer()
             self.save_game("Виграв")
@@ -1179,12 +1220,7 @@ class Minesweeper:
             return
         
         # Оновлюємо параметри гри
-        difficulty_settings = {
-            "Легкий": (10, 10),
-            "Середній": (12, 20),
-            "Важкий": (16, 40)
-        }
-        self.size, self.mines = difficulty_settings[selected_difficulty]
+        self.size, self.mines = DIFFICULTY_SETTINGS[selected_difficulty]
         self.last_difficulty = selected_difficulty  # Оновлюємо останній рівень
         
         # Оновлюємо інтерфейс
@@ -1231,32 +1267,194 @@ class Minesweeper:
         self.history_window.resizable(False, False)
         self.history_window.configure(bg=self.bg_color)
 
+        # Кнопка статистики
+        stats_button = ttk.Button(self.history_window, text="Статистика", command=self.show_stats)
+        stats_button.pack(anchor='w', padx=10, pady=(10, 0))
+
         # Головний контейнер
         main_frame = tk.Frame(self.history_window, bg=self.bg_color)
         main_frame.pack(fill='both', expand=True, padx=10, pady=10)
 
-        # Список історії
-        self.history_listbox = tk.Listbox(
-            main_frame,
+        # Список історії зі скролбаром (читає з БД лише видимі рядки)
+        self.history_view = HistoryView(main_frame, self.ensure_db(), self.bg_color, self.text_color,
+                                        on_open=self.show_replay)
+
+        self.load_history_data()  # Завантажуємо історію при відкритті
+
+    def show_stats(self):
+        """Показує статистику ігор із заздалегідь підрахованих зведень."""
+        if self.stats_window and self.stats_window.winfo_exists():
+            self.stats_window.destroy()
+
+        self.stats_window = tk.Toplevel(self.root)
+        self.stats_window.title("Статистика")
+        self.stats_window.geometry("360x320")
+        self.stats_window.resizable(False, False)
+        self.stats_window.configure(bg=self.bg_color)
+
+        summary, daily = storage.fetch_stats(self.ensure_db())
+
+        def describe(title, values):
+            games, wins, streak, best_streak = values
+            rate = wins * 100 / games if games else 0
+            if streak > 0:
+                streak_text = f"{streak} перемог поспіль"
+            else:
+                streak_text = f"{-streak} поразок поспіль"
+            return (f"{title}: ігор {games}, перемог {wins} ({rate:.0f}%)\n"
+                    f"    поточна серія: {streak_text}, найкраща: {best_streak}")
+
+        lines = [describe("Усього", summary.get("*", (0, 0, 0, 0)))]
+        for level in ["Легкий", "Середній", "Важкий"]:
+            if level in summary:
+                lines.append(describe(level, summary[level]))
+        if daily:
+            lines.append("Ігор за днями:")
+            lines.extend(f"    {day}: {games} (перемог {wins})" for day, games, wins in daily)
+
+        label = tk.Label(
+            self.stats_window,
+            text="\n".join(lines),
+            justify='left',
+            anchor='nw',
+            font=("Arial", 10),
             bg=self.bg_color,
-            fg=self.text_color,
-            borderwidth=0,
-            highlightthickness=0,
-            font=("Arial", 10)
+            fg=self.text_color
         )
-        self.history_listbox.pack(side='left', fill='both', expand=True)
+        label.pack(fill='both', expand=True, padx=10, pady=10)
 
-        # Скролбар
-        scrollbar = ttk.Scrollbar(
-            main_frame,
-            orient="vertical",
-            command=self.history_listbox.yview
+
+    def show_replay(self, game_id):
+        """Відкриває панель повтору збереженої гри (подвійний клік в історії)."""
+        data = storage.fetch_move_log(self.ensure_db(), game_id)
+        if not data:
+            self.show_custom_dialog("Повтор гри", "Для цієї гри немає запису ходів")
+            return
+        if self.game_active and not self.game_over and not self.confirm_action("restart"):
+            return
+        self.close_replay(restart=False)
+        self.stop_timer()
+        self.game_active = False
+        self.game_over = True
+        self.board_fresh = False  # Поле повтору не можна почати як нову гру
+
+        self.replay_data = data
+        self.engine, self.replay_moves = movelog.decode(data)
+        self.replay_position = 0
+        self.replay_saved_size = (self.size, self.mines)
+        self.size, self.mines = self.engine.rows, self.engine.mines
+        self.update_window_size()
+        self.board_view.build(
+            self.engine.rows, self.engine.cols, self.board_cell_size(self.engine.cols, self.engine.topology),
+            shift_odd_rows=self.engine.topology == "hex",
+            text="",
+            bg=self.button_bg_color,
+            fg=self.text_color,
+            activebackground=self.hover_color,
+            disabledforeground=self.text_color,
+            state="disabled"
         )
-        scrollbar.pack(side='right', fill='y')
-        self.history_listbox.config(yscrollcommand=scrollbar.set)
 
-        self.load_history_data()  # Завантажуємо історію при відкритті
+        self.replay_window = tk.Toplevel(self.root)
+        self.replay_window.title("Повтор гри")
+        self.replay_window.resizable(False, False)
+        self.replay_window.configure(bg=self.bg_color)
+        self.replay_window.protocol("WM_DELETE_WINDOW", self.close_replay)
 
+        self.replay_scale = tk.Scale(
+            self.replay_window, from_=0, to=len(self.replay_moves), orient="horizontal",
+            length=300, label="Хід", command=lambda value: self.replay_seek(int(float(value))),
+            bg=self.bg_color, fg=self.text_color, highlightthickness=0
+        )
+        self.replay_scale.pack(padx=10, pady=(10, 0))
+
+        controls = tk.Frame(self.replay_window, bg=self.bg_color)
+        controls.pack(pady=10)
+        self.replay_button = ttk.Button(controls, text="▶", width=3, command=self.toggle_replay)
+        self.replay_button.pack(side="left", padx=5)
+        self.replay_speed = tk.StringVar(value="1")
+        ttk.OptionMenu(controls, self.replay_speed, "1", "0.5", "1", "2", "4", "10").pack(side="left", padx=5)
+        tk.Label(controls, text="× швидкість", bg=self.bg_color, fg=self.text_color).pack(side="left")
+
+        self.render_engine_state()
+
+    def toggle_replay(self):
+        """Запускає або призупиняє відтворення."""
+        if self.replay_after_id is not None:
+            self.root.after_cancel(self.replay_after_id)
+            self.replay_after_id = None
+            self.replay_button.config(text="▶")
+            return
+        if self.replay_position >= len(self.replay_moves):
+            self.replay_seek(0)
+        self.replay_button.config(text="⏸")
+        self._schedule_replay_step()
+
+    def _schedule_replay_step(self):
+        if self.replay_position >= len(self.replay_moves):
+            self.replay_after_id = None
+            self.replay_button.config(text="▶")
+            return
+        dt = self.replay_moves[self.replay_position][0]
+        delay = max(1, int(dt / float(self.replay_speed.get())))
+        self.replay_after_id = self.root.after(delay, self._replay_step)
+
+    def _replay_step(self):
+        """Виконує наступний хід і малює лише змінені клітинки."""
+        _, op, index = self.replay_moves[self.replay_position]
+        movelog.apply_move(self.engine, op, index)
+        self.replay_position += 1
+        self.replay_scale.set(self.replay_position)
+        self.render_engine_state()
+        self._schedule_replay_step()
+
+    def replay_seek(self, position):
+        """Переходить до ходу position, відтворюючи гру без інтерфейсу."""
+        if position == self.replay_position:
+            return
+        if position > self.replay_position:
+            for _, op, index in self.replay_moves[self.replay_position:position]:
+                movelog.apply_move(self.engine, op, index)
+        else:
+            self.engine = movelog.replay(self.replay_data, position)
+        self.replay_position = position
+        self.replay_scale.set(position)
+        self.render_engine_state()
+
+    def render_engine_state(self):
+        """Приводить поле у відповідність до стану рушія; у Tcl ідуть лише зміни."""
+        engine = self.engine
+        for index in range(engine.cells):
+            row, col = engine.coords(index)
+            if engine.revealed[index]:
+                if engine.mine[index]:
+                    options = {"text": "💣", "bg": "red", "fg": self.mine_color}
+                else:
+                    options = {"text": engine.counts[index] or "", "bg": self.reveal_color, "fg": self.text_color}
+            elif engine.flagged[index]:
+                options = {"text": "🚩", "bg": self.button_bg_color, "fg": self.flag_color,
+                           "disabledforeground": self.flag_color}
+            else:
+                options = {"text": "", "bg": self.button_bg_color, "fg": self.text_color,
+                           "disabledforeground": self.text_color}
+            self.board_view.configure(row, col, state="disabled", **options)
+        if engine.lost:
+            self.reveal_mines()
+
+    def close_replay(self, restart=True):
+        """Закриває панель повтору і повертає поле поточного рівня."""
+        if self.replay_after_id is not None:
+            self.root.after_cancel(self.replay_after_id)
+            self.replay_after_id = None
+        if self.replay_window and self.replay_window.winfo_exists():
+            self.replay_window.destroy()
+        self.replay_window = None
+        if self.replay_saved_size is not None:
+            self.size, self.mines = self.replay_saved_size
+            self.replay_saved_size = None
+            self.update_window_size()
+            if restart:
+                self.restart_game(confirm=False)
 
         # Обробник закриття вікна
     def on_close(self):
@@ -1265,39 +1463,62 @@ class Minesweeper:
         if self.timer_window and self.timer_window.winfo_exists():
             self.save_position()
         
-        # Зберігаємо всі налаштування
+        # Зберігаємо всі налаштування і записуємо їх на диск негайно
         self.save_settings()
+        self.settings.flush()
         
-        # Зупиняємо таймер
+        # Зупиняємо таймер і поповнення пулу полів
         self.stop_timer()
+        self.board_pool.cancel()
+        if self.noguess_cache:
+            self.noguess_cache.save()  # pop змінює кеш лише в пам'яті
         
-        # Закриваємо з'єднання з БД
-        if hasattr(self, 'conn') and self.conn:
+        # Дописуємо чергу результатів і закриваємо з'єднання з БД
+        if self.writer:
+            self.writer.close()
+        if self.conn:
             try:
                 self.conn.close()
             except Exception as e:
                 print(f"Помилка закриття БД: {e}")
         
+        # Зберігаємо виміри обробників (MINER_TRACE)
+        if self.tracer:
+            try:
+                self.tracer.dump(os.environ["MINER_TRACE"])
+            except OSError as e:
+                print(f"Помилка збереження трасування: {e}")
+            print(self.tracer.summary())
+            print(f"Пул полів: влучань {self.board_pool.hits}, промахів {self.board_pool.misses}")
+
         # Закриваємо вікно
         self.root.destroy()
         
 
     def load_history_data(self):
-        """Завантажує дані історії з БД у список."""
-        if self.history_listbox:
-            self.history_listbox.delete(0, tk.END)
-            if self.conn:
-                with self.conn:
-                    cursor = self.conn.execute("SELECT date, result, difficulty FROM games ORDER BY id DESC")
-                    rows = cursor.fetchall()
-                for row in rows:
-                    self.history_listbox.insert(tk.END, f"Дата: {row[0]}, Результат: {row[1]}, Складність: {row[2]}")
-
-
-    def toggle_dialog(self):
-        """Обробник зміни стану чекбоксу"""
-        self.dialog_enabled = self.dialog_var.get()
+        """Завантажує видиму сторінку історії з БД у список."""
+        if self.history_view and self.conn:
+            self.history_view.refresh()
+
+
+    def toggle_safe_opening(self):
+        """Обробник чекбоксу безпечної області першого ходу"""
+        self.safe_opening = self.safe_opening_var.get()
         self.save_settings()
+
+    def set_topology(self, selected_name):
+        """Змінює сусідство клітинок і починає нове поле."""
+        topology = next(key for key, name in TOPOLOGY_NAMES.items() if name == selected_name)
+        if topology == self.topology:
+            return
+        if not self.game_over and not self.confirm_action("restart"):
+            self.topology_var.set(TOPOLOGY_NAMES[self.topology])
+            return
+        self.topology = topology
+        self.save_settings()
+        if self.no_guess:
+            self._refill_noguess_cache()
+        self.restart_game(confirm=False)
     
     def show_info(self):
         """Показує вікно з інформацією про гру."""
@@ -1343,15 +1564,56 @@ class Minesweeper:
         )
         self.mine_color_checkbox.pack(anchor='w', pady=(0, 10))
 
-        # Чекбокс
-        self.dialog_checkbox = ttk.Checkbutton(
+        # Чекбокс області першого ходу
+        self.safe_opening_checkbox = ttk.Checkbutton(
+            main_frame,
+            text="Перший хід відкриває область 3x3",
+            variable=self.safe_opening_var,
+            command=self.toggle_safe_opening,
+            style='TCheckbutton'
+        )
+        self.safe_opening_checkbox.pack(anchor='w', pady=(0, 10))
+
+        # Чекбокс карти ймовірностей
+        self.heatmap_checkbox = ttk.Checkbutton(
+            main_frame,
+            text="Карта ймовірностей мін",
+            variable=self.heatmap_var,
+            command=self.toggle_heatmap,
+            style='TCheckbutton'
+        )
+        self.heatmap_checkbox.pack(anchor='w', pady=(0, 10))
+
+        # Чекбокс полів без вгадування
+        self.no_guess_checkbox = ttk.Checkbutton(
             main_frame,
-            text="Запит при першому кліку на міну",
-            variable=self.dialog_var,
-            command=self.toggle_dialog,
+            text="Поля без вгадування",
+            variable=self.no_guess_var,
+            command=self.toggle_no_guess,
             style='TCheckbutton'
         )
-        self.dialog_checkbox.pack(anchor='w', pady=(0, 10))
+        self.no_guess_checkbox.pack(anchor='w', pady=(0, 10))
+
+        # Вибір топології поля
+        topology_frame = tk.Frame(main_frame, bg=self.bg_color)
+        topology_frame.pack(anchor='w', pady=(0, 10))
+        tk.Label(topology_frame, text="Поле:", bg=self.bg_color, fg=self.text_color).pack(side='left')
+        ttk.OptionMenu(
+            topology_frame,
+            self.topology_var,
+            self.topology_var.get(),
+            *TOPOLOGY_NAMES.values(),
+            command=self.set_topology
+        ).pack(side='left', padx=5)
+
+        # Код поля: показує код поточної гри і дозволяє вставити чужий
+        code_frame = tk.Frame(main_frame, bg=self.bg_color)
+        code_frame.pack(anchor='w', pady=(0, 10))
+        tk.Label(code_frame, text="Код поля:", bg=self.bg_color, fg=self.text_color).pack(side='left')
+        code_entry = ttk.Entry(code_frame, textvariable=self.board_code_var, width=20)
+        code_entry.pack(side='left', padx=5)
+        code_entry.bind("<Return>", lambda event: self.load_board_code())
+        ttk.Button(code_frame, text="Завантажити", command=self.load_board_code).pack(side='left')
 
         # Текстове поле
         self.info_text = tk.Text(
@@ -1383,6 +1645,31 @@ class Minesweeper:
             selectbackground=self.button_active_bg
         )
 
+    def load_board_code(self):
+        """Готує наступну гру за кодом поля з вікна налаштувань."""
+        try:
+            rows, cols, mines, seed, topology = boardcode.decode(self.board_code_var.get())
+        except ValueError as e:
+            self.show_custom_dialog("Код поля", str(e))
+            return
+        difficulty = next((name for name, settings in DIFFICULTY_SETTINGS.items()
+                           if rows == cols and settings == (rows, mines)), None)
+        if difficulty is None:
+            self.show_custom_dialog("Код поля", f"Поле {rows}x{cols} з {mines} мінами не підтримується")
+            return
+        if not self.confirm_action("restart"):
+            return
+        self.next_seed = seed
+        if topology != self.topology:
+            self.topology = topology
+            self.topology_var.set(TOPOLOGY_NAMES[topology])
+            self.save_settings()
+        if difficulty != self.last_difficulty:
+            self.game_over = True  # Підтвердження вже отримано
+            self.set_difficulty(difficulty)
+        else:
+            self.restart_game(confirm=False)
+
     def _insert_info_text(self):
         """Вставляє текст правил гри у текстове поле."""
         rules_text = """
@@ -1393,9 +1680,9 @@ class Minesweeper:
 2. Клітинки: Існують дві основні типи клітинок: безпечні (числові або порожні) і міни. 
 
 Дії гравця
-3. Натискання на клітинки: Клацніть на клітинку, щоб її відкрити. Якщо ви натиснете на міну, гра закінчиться. 
+3. Натискання на клітинки: Клацніть на клітинку, щоб її відкрити. Якщо ви натиснете на міну, гра закінчиться. Перший хід завжди безпечний: міни розставляються після нього, а з увімкненою опцією «Перший хід відкриває область 3x3» безпечні й усі сусідні клітинки. 
 4. Числові клітинки: Клітинки з числами вказують, скільки мін знаходиться у сусідніх клітинках. Використовуйте цю інформацію, щоб приймати обґрунтовані рішення. 
-5. Порожні клітинки: Якщо ви відкриваєте клітинку, що не має чисел, всі сусідні порожні клітинки відкриються автоматично. 
+5. Порожні клітинки: Якщо ви відкриваєте клітинку, що не має чисел, всі сусідні порожні клітинки відкриються автоматично. Які клітинки сусідні, залежить від вибору «Поле»: прямокутне (8 сусідів), тор (краї поля зшиті), шестикутне (6 сусідів) або хід коня (сусіди на відстані ходу шахового коня). 
 
 Використання флажків
 6. Додавання флажків: Клацніть правою кнопкою миші на клітинці, щоб позначити її флажком. Це вказує на те, що ви вважаєте цю клітинку небезпечною. 
@@ -1429,8 +1716,28 @@ class Minesweeper:
 
 
 
-# Створення вікна Tkinter
-root = tk.Tk()
-root.title("Мінер")
-app = Minesweeper(root)
-root.mainloop()
+def main():
+    """Створює головне вікно і запускає гру.
+
+    При MINER_STARTUP_PROBE=1 друкує "ready" після першого намальованого
+    кадру і закривається (так запуск вимірює benchmarks/bench_startup.py).
+    """
+    root = tk.Tk()
+    root.title("Мінер")
+    app = Minesweeper(root)
+    if os.environ.get("MINER_STARTUP_PROBE"):
+        root.wait_visibility()
+        root.update_idletasks()
+        print("ready", flush=True)
+        app.on_close()
+        return
+    root.mainloop()
+
+
+# Процеси пулу (noguess) імпортують цей модуль, тож вікно - лише в головному процесі
+if __name__ == "__main__":
+    # У зібраному exe (sys.frozen) процес пулу запускає той самий файл;
+    # freeze_support виконує в ньому завдання пулу замість нового вікна гри
+    import multiprocessing
+    multiprocessing.freeze_support()
+    main()
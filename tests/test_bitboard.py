@@ -0,0 +1,69 @@
+"""BitBoard проти engine.Board: однакові поля і однакова реакція на кожен хід.
+
+Запуск: python -m pytest tests
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bitboard import BitBoard
+from engine import Board
+
+
+def assert_same(bits, board):
+    assert bytes(bits.mine) == bytes(board.mine)
+    assert bytes(bits.revealed) == bytes(board.revealed)
+    assert bytes(bits.flagged) == bytes(board.flagged)
+    assert (bits.safe_left, bits.mines_left) == (board.safe_left, board.mines_left)
+    assert (bits.lost, bits.exploded) == (board.lost, board.exploded)
+    assert bits.is_won() == board.is_won()
+
+
+def test_counts_match():
+    for rows, cols, mines in ((1, 1, 0), (1, 9, 3), (9, 1, 3), (8, 8, 10), (16, 30, 99), (13, 7, 80)):
+        for seed in range(20):
+            bits = BitBoard(rows, cols, mines)
+            bits.place_mines(seed=seed)
+            bits.update_numbers()
+            board = Board(rows, cols, mines, backend="python")
+            board.place_mines(seed=seed)
+            board.update_numbers()
+            assert bits.counts == bytes(board.counts)
+            assert bits.mine_indices() == board.mine_indices()
+            assert all(bits.count(*board.coords(i)) == board.counts[i] for i in range(board.cells))
+
+
+def test_random_play_matches_board():
+    rng = random.Random(1)
+    for game in range(300):
+        rows, cols = rng.randint(1, 12), rng.randint(1, 12)
+        mines = rng.randint(0, rows * cols - 1)
+        bits = BitBoard(rows, cols, mines)
+        bits.place_mines(seed=game)
+        bits.update_numbers()
+        board = Board(rows, cols, mines, backend="python")
+        board.place_mines(seed=game)
+        board.update_numbers()
+        first = True
+        for _ in range(rows * cols * 2):
+            row, col = rng.randrange(rows), rng.randrange(cols)
+            move = rng.choice(("reveal", "reveal", "flag", "chord"))
+            if move == "reveal" and first:
+                # Перший хід, як у грі: міни переносяться з клітинки (або області 3x3)
+                area = rng.random() < 0.5
+                index = board.index(row, col)
+                assert bits.clear_start(index, area) == board.clear_start(index, area)
+                assert bits.counts == bytes(board.counts)
+                first = False
+            if move == "reveal":
+                assert sorted(bits.reveal(row, col)) == sorted(board.reveal(row, col))
+            elif move == "flag":
+                assert bits.toggle_flag(row, col) == board.toggle_flag(row, col)
+            else:
+                assert sorted(bits.chord(row, col)) == sorted(board.chord(row, col))
+            assert_same(bits, board)
+            if board.lost:
+                assert bits.wrong_flags() == [i for i in range(board.cells) if board.flagged[i] and not board.mine[i]]
+                break
@@ -0,0 +1,45 @@
+"""Коди полів (boardcode.py): кодування, декодування і контрольна сума.
+
+Запуск: python -m pytest tests
+"""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import boardcode
+from topology import TOPOLOGIES
+
+
+def test_round_trip():
+    rng = random.Random(1)
+    for _ in range(500):
+        rows, cols = rng.randint(1, 300), rng.randint(1, 300)
+        params = (rows, cols, rng.randrange(rows * cols), rng.getrandbits(rng.choice((8, 32, 64))),
+                  rng.choice(TOPOLOGIES))
+        code = boardcode.encode(*params)
+        assert boardcode.decode(code) == params
+        # Регістр, дефіси і схожі символи не важливі
+        assert boardcode.decode(code.lower().replace("-", "").replace("0", "o").replace("1", "l")) == params
+
+
+def test_rect_code_has_no_topology():
+    """Коди прямокутних полів не змінилися з появою топологій."""
+    assert boardcode.encode(16, 30, 99, 12345) == boardcode.encode(16, 30, 99, 12345, "rect")
+    assert len(boardcode.encode(16, 30, 99, 12345)) < len(boardcode.encode(16, 30, 99, 12345, "hex"))
+
+
+def test_bad_code_rejected():
+    code = boardcode.encode(16, 30, 99, 12345)
+    chars = code.replace("-", "")
+    for position in range(len(chars)):
+        digit = boardcode.ALPHABET.index(chars[position])
+        corrupted = chars[:position] + boardcode.ALPHABET[(digit + 1) % 32] + chars[position + 1:]
+        with pytest.raises(ValueError):
+            boardcode.decode(corrupted)
+    for bad in ("", "U", "!!!!!", "00000", code[:-1]):
+        with pytest.raises(ValueError):
+            boardcode.decode(bad)
@@ -0,0 +1,115 @@
+"""Перевірки рушія поля (engine.Board).
+
+Запуск: python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import engine
+from engine import Board, seeded_sample
+
+
+def play_perfectly(board):
+    """Відкриває всі безпечні клітинки і ставить прапорці на всі міни."""
+    for index in range(board.cells):
+        row, col = board.coords(index)
+        if board.mine[index]:
+            if not board.flagged[index]:
+                board.toggle_flag(row, col)
+        else:
+            if board.flagged[index]:
+                board.toggle_flag(row, col)
+            board.reveal(row, col)
+
+
+def test_clear_start_keeps_flag_counter():
+    """Прапорець до першого ходу не ламає лічильник мін після перенесення."""
+    for area in (False, True):
+        board = Board(5, 5, 3, backend="python")
+        board.place_mines(seed=7)
+        board.update_numbers()
+        assert board.mine[1]
+        board.toggle_flag(*board.coords(1))
+        board.clear_start(1, area=area)
+        play_perfectly(board)
+        assert board.mines_left == 0
+        assert board.is_won()
+
+
+def test_clear_start_onto_flagged_cell():
+    """Міна, перенесена під наявний прапорець, вважається знайденою."""
+    for seed in range(200):
+        board = Board(5, 5, 10, backend="python")
+        board.place_mines(seed=seed)
+        board.update_numbers()
+        for index in range(board.cells):
+            if not board.mine[index] and index != 12:
+                board.toggle_flag(*board.coords(index))
+        board.clear_start(12)
+        assert board.mines_left == sum(m and not f for m, f in zip(board.mine, board.flagged))
+        play_perfectly(board)
+        assert board.is_won()
+
+
+def test_clear_start_updates_counts():
+    """Після перенесення мін числа збігаються з повним перерахунком."""
+    for topology in ("rect", "torus", "hex", "knight"):
+        for seed in range(50):
+            board = Board(8, 8, 20, backend="python", topology=topology)
+            board.place_mines(seed=seed)
+            board.update_numbers()
+            board.clear_start(27)
+            counts = bytes(board.counts)
+            board.update_numbers()
+            assert counts == bytes(board.counts)
+            assert not any(board.mine[i] for i in (27, *board.neighbours(27)))
+
+
+@pytest.mark.skipif(engine.np is None, reason="NumPy не встановлено")
+def test_numpy_seeded_sample_matches_python():
+    """Векторна вибірка за seed дає ту саму розкладку, що й цикл Python."""
+    for seed in range(300):
+        population = 1 + seed % 97
+        k = seed * 7 % population
+        assert engine._numpy_seeded_sample(seed << 20, population, k).tolist() == seeded_sample(seed << 20, population, k)
+    for size, mines in ((16, 40), (100, 1600), (300, 20000)):
+        python = Board(size, size, mines, backend="python")
+        python.place_mines(seed=12345)
+        numpy = Board(size, size, mines, backend="numpy")
+        numpy.place_mines(seed=12345)
+        assert python.mine == numpy.mine
+
+
+@pytest.mark.skipif(engine.np is None, reason="NumPy не встановлено")
+def test_numpy_backend_matches_python():
+    """Числа і каскад NumPy-поля збігаються з полем python для всіх топологій."""
+    for topology in ("rect", "torus", "hex", "knight"):
+        for rows, cols in ((1, 7), (7, 2), (40, 33)):
+            boards = [Board(rows, cols, rows * cols // 8, backend=backend, topology=topology)
+                      for backend in ("python", "numpy")]
+            for board in boards:
+                board.place_mines(seed=rows * cols)
+                board.update_numbers()
+            python, numpy = boards
+            assert python.counts == numpy.counts
+            for index in range(python.cells):
+                assert sorted(python.neighbours(index)) == sorted(numpy.neighbours(index))
+            start = next((i for i in range(python.cells) if not python.mine[i] and python.counts[i] == 0), None)
+            if start is not None:
+                assert sorted(python.reveal(*python.coords(start))) == sorted(numpy.reveal(*numpy.coords(start)))
+
+
+@pytest.mark.skipif(engine.np is None, reason="NumPy не встановлено")
+def test_numpy_rect_board_skips_neighbour_table():
+    """Велике прямокутне поле не будує таблицю сусідів."""
+    for backend in ("python", "numpy"):
+        board = Board(300, 300, 9000, backend=backend)
+        board.place_mines(seed=1)
+        board.update_numbers()
+        start = next(i for i in range(board.cells) if not board.mine[i] and board.counts[i] == 0)
+        board.reveal(*board.coords(start))
+        assert board._table is None
@@ -0,0 +1,50 @@
+"""Запис ходів (movelog.py): закодована гра відтворюється в той самий стан.
+
+Запуск: python -m pytest tests
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import movelog
+from engine import Board
+from topology import TOPOLOGIES
+
+
+def test_varint_round_trip():
+    for value in (0, 1, 127, 128, 300, 2 ** 32 - 1, 2 ** 64 + 5):
+        data = bytearray()
+        movelog.write_varint(data, value)
+        assert movelog.read_varint(data, 0) == (value, len(data))
+
+
+def test_replay_matches_played_game():
+    """Після replay поле збігається з полем, на якому грали, на кожному ході."""
+    rng = random.Random(1)
+    for game in range(60):
+        rows, cols = rng.randint(2, 12), rng.randint(2, 12)
+        board = Board(rows, cols, rng.randint(1, rows * cols // 3), backend="python",
+                      topology=TOPOLOGIES[game % len(TOPOLOGIES)])
+        board.place_mines(seed=game)
+        board.update_numbers()
+        log = movelog.MoveLog(board)
+        now = 0.0
+        states = []
+        while not board.lost and not board.is_won() and log.moves < rows * cols * 2:
+            op = rng.choice((movelog.OP_REVEAL, movelog.OP_REVEAL, movelog.OP_FLAG, movelog.OP_CHORD))
+            index = rng.randrange(board.cells)
+            now += rng.random() * 3
+            log.record(op, index, now)
+            movelog.apply_move(board, op, index)
+            states.append((bytes(board.revealed), bytes(board.flagged), board.lost))
+        data = log.encode()
+        decoded, moves = movelog.decode(data)
+        assert (decoded.rows, decoded.cols, decoded.topology) == (board.rows, board.cols, board.topology)
+        assert decoded.mine_indices() == board.mine_indices()
+        assert len(moves) == log.moves
+        for upto in (len(states) // 2, len(states)):
+            if upto:
+                replayed = movelog.replay(data, upto)
+                assert (bytes(replayed.revealed), bytes(replayed.flagged), replayed.lost) == states[upto - 1]
@@ -0,0 +1,60 @@
+"""Ймовірності мін (probability.py) проти повного перебору розкладок.
+
+Запуск: python -m pytest tests
+"""
+import itertools
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import Board
+from probability import ProbabilityEngine
+from topology import TOPOLOGIES
+
+
+def brute_force(board):
+    """Ймовірності перебором усіх розкладок мін, сумісних з видимим станом."""
+    closed = [i for i in range(board.cells) if not board.revealed[i]]
+    numbers = [(i, board.counts[i]) for i in range(board.cells) if board.revealed[i]]
+    hits = dict.fromkeys(closed, 0)
+    total = 0
+    for layout in itertools.combinations(closed, board.mines):
+        mines = set(layout)
+        if any(board.flagged[i] and i not in mines for i in closed):
+            continue
+        if all(sum(n in mines for n in board.neighbours(i)) == count for i, count in numbers):
+            total += 1
+            for i in layout:
+                hits[i] += 1
+    return [hits[i] / total if i in hits else None for i in range(board.cells)]
+
+
+def partly_opened(rows, cols, mines, topology, seed):
+    """Поле після кількох безпечних ходів і, можливо, правильного прапорця."""
+    rng = random.Random(seed)
+    board = Board(rows, cols, mines, backend="python", topology=topology)
+    board.place_mines(seed=seed)
+    board.update_numbers()
+    safe = [i for i in range(board.cells) if not board.mine[i]]
+    for index in rng.sample(safe, rng.randint(1, 4)):
+        board.reveal(*board.coords(index))
+    if rng.random() < 0.3:
+        board.toggle_flag(*board.coords(rng.choice(board.mine_indices())))
+    return board
+
+
+def test_probabilities_match_brute_force():
+    engine = ProbabilityEngine()
+    for topology in TOPOLOGIES:
+        for seed in range(25):
+            board = partly_opened(4, 5, 5, topology, seed)
+            if board.safe_left == 0:
+                continue
+            expected = brute_force(board)
+            actual = engine.compute(board)
+            for p, q in zip(actual, expected):
+                assert (p is None) == (q is None)
+                if p is not None:
+                    assert abs(p - q) < 1e-9, (topology, seed)
@@ -0,0 +1,77 @@
+"""Перевірки бази ігор (storage.py).
+
+Запуск: python -m pytest tests
+"""
+import os
+import random
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import storage
+
+
+def stats_rows(conn):
+    return (conn.execute("SELECT * FROM stats_summary ORDER BY difficulty").fetchall(),
+            conn.execute("SELECT * FROM stats_daily ORDER BY day").fetchall())
+
+
+def test_trigger_matches_rebuild_stats(tmp_path):
+    """Статистика, яку веде тригер, збігається з повним перерахунком."""
+    rng = random.Random(1)
+    conn = storage.connect(str(tmp_path / "games.db"), writer=True)
+    storage.create_schema(conn)
+    records = []
+    for _ in range(500):
+        record = storage.game_record(rng.choice((storage.WIN, storage.LOSS, storage.LOSS)),
+                                     rng.choice(("Легкий", "Середній", "Складний", None)))
+        record["date"] = f"2026-10-{rng.randint(1, 5):02d} 12:00:00"
+        records.append(record)
+    for start in range(0, len(records), 37):
+        storage.write_games(conn, records[start:start + 37])
+    by_trigger = stats_rows(conn)
+    storage.rebuild_stats(conn)
+    assert by_trigger == stats_rows(conn)
+    assert {row[0]: row[1] for row in by_trigger[0]}["*"] == len(records)
+    conn.close()
+
+
+def test_migrate_baseline_database(tmp_path):
+    """База першої версії отримує нові колонки і статистику, старі ігри лишаються."""
+    path = str(tmp_path / "old.db")
+    old = sqlite3.connect(path)
+    old.execute("CREATE TABLE games (id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT, result TEXT, "
+                "size INTEGER, difficulty TEXT)")
+    old.executemany("INSERT INTO games (date, result, size, difficulty) VALUES (?, ?, ?, ?)",
+                    [("2026-10-01 10:00:00", storage.WIN, 8, "Легкий"),
+                     ("2026-10-02 10:00:00", storage.LOSS, 16, "Середній")])
+    old.commit()
+    old.close()
+
+    conn = storage.connect(path, writer=True)
+    storage.create_schema(conn)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(games)")}
+    assert set(storage.MIGRATED_COLUMNS) <= columns
+    assert conn.execute("SELECT games, wins FROM stats_summary WHERE difficulty = '*'").fetchone() == (2, 1)
+    storage.insert_game(conn, storage.WIN, "Легкий", size=8, duration_ms=1234, moves=5, clicks=7,
+                        seed="ABCDE", move_log=b"\x01")
+    assert conn.execute("SELECT COUNT(*), SUM(duration_ms) FROM games").fetchone() == (3, 1234)
+    assert conn.execute("SELECT games FROM stats_summary WHERE difficulty = '*'").fetchone() == (3,)
+    storage.create_schema(conn)
+    assert conn.execute("SELECT games FROM stats_summary WHERE difficulty = '*'").fetchone() == (3,)
+    conn.close()
+
+
+def test_history_jump_matches_offset(tmp_path):
+    """Стрибок за id дає ту саму сторінку, що й OFFSET, а count_games - що й COUNT(*)."""
+    conn = storage.connect(str(tmp_path / "games.db"), writer=True)
+    storage.create_schema(conn)
+    assert storage.count_games(conn) == 0 and storage.fetch_games_at(conn, 5, 10) == []
+    storage.write_games(conn, [storage.game_record(storage.WIN, "Легкий") for _ in range(300)])
+    assert storage.count_games(conn) == conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+    for offset in (0, 1, 137, 290, 299, 450):
+        expected = conn.execute(f"SELECT {storage.GAME_COLUMNS} FROM games ORDER BY id DESC LIMIT 10 OFFSET ?",
+                                (min(offset, 290),)).fetchall()
+        assert storage.fetch_games_at(conn, offset, 10) == expected
+    conn.close()
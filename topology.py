@@ -0,0 +1,108 @@
+"""Топології поля: які клітинки вважаються сусідніми.
+
+* rect   - звичайне прямокутне поле, до 8 сусідів;
+* torus  - прямокутне поле зі зшитими краями (тор), 8 сусідів у кожної клітинки;
+* hex    - шестикутні клітинки: непарні рядки зсунуті на пів клітинки
+           вправо, до 6 сусідів;
+* knight - сусіди на відстані ходу шахового коня, до 8.
+
+Для кожної трійки (топологія, rows, cols) таблиця суміжності будується
+один раз і кешується у форматі CSR: сусіди клітинки i - це
+targets[offsets[i]:offsets[i + 1]]. Генерація, числа, каскад відкриття і
+розв'язувач беруть сусідів лише з неї (Adjacency.table - ті самі зрізи у
+вигляді кортежів, найшвидших для обходу в Python; будується лише при
+першому зверненні). Прямокутне поле з бекендом NumPy таблиці не потребує
+взагалі (див. engine.Board). Сусідство в усіх
+топологіях симетричне, тож «міна додає одиницю своїм сусідам» і «число -
+це міни серед сусідів» дають однакові числа.
+"""
+import array
+import functools
+import itertools
+
+TOPOLOGIES = ("rect", "torus", "hex", "knight")
+# Назви для інтерфейсу
+TOPOLOGY_NAMES = {
+    "rect": "Прямокутне",
+    "torus": "Тор",
+    "hex": "Шестикутне",
+    "knight": "Хід коня"
+}
+
+_KING = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+_KNIGHT = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
+_HEX_EVEN = [(-1, -1), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 0)]
+_HEX_ODD = [(-1, 0), (-1, 1), (0, -1), (0, 1), (1, 0), (1, 1)]
+
+
+def _row_steps(topology, row):
+    if topology == "hex":
+        return _HEX_ODD if row % 2 else _HEX_EVEN
+    return _KNIGHT if topology == "knight" else _KING
+
+
+def _step_targets(topology, rows, cols, row, dr, dc):
+    """Сусід (row + dr, col + dc) для кожного col рядка; -1 - за межами поля.
+
+    Списки будуються з range цілими рядками, без перевірки меж для кожної
+    клітинки окремо.
+    """
+    r = row + dr
+    if topology == "torus":
+        base = r % rows * cols
+        shift = dc % cols
+        return list(range(base + shift, base + cols)) + list(range(base, base + shift))
+    if not 0 <= r < rows:
+        return None
+    lo = min(max(0, -dc), cols)
+    hi = max(lo, min(cols, cols - dc))
+    base = r * cols + dc
+    return [-1] * lo + list(range(base + lo, base + hi)) + [-1] * (cols - hi)
+
+
+class Adjacency:
+    """Таблиця суміжності одного поля у форматі CSR."""
+
+    def __init__(self, topology, rows, cols):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Невідома топологія поля: {topology}")
+        self.topology = topology
+        self.rows = rows
+        self.cols = cols
+        self.offsets = offsets = array.array("l", [0])
+        self.targets = targets = array.array("l")
+        for row in range(rows):
+            columns = [targets for targets in (_step_targets(topology, rows, cols, row, dr, dc)
+                                               for dr, dc in _row_steps(topology, row)) if targets]
+            if not columns:  # Жодного сусіднього рядка (наприклад, хід коня на полі 1xN)
+                offsets.extend([len(targets)] * cols)
+                continue
+            if topology == "torus":
+                # На вузькому торі зсуви повторюються або повертають у саму клітинку
+                for index, group in enumerate(zip(*columns), row * cols):
+                    targets.extend(sorted(set(group) - {index}))
+                    offsets.append(len(targets))
+                continue
+            # Кроки впорядковані за (dr, dc), тож сусіди вже відсортовані
+            targets.extend([n for n in itertools.chain.from_iterable(zip(*columns)) if n >= 0])
+            degrees = map(sum, zip(*[[n >= 0 for n in targets_of_step] for targets_of_step in columns]))
+            offsets.extend(itertools.islice(itertools.accumulate(degrees, initial=offsets[-1]), 1, None))
+
+    @functools.cached_property
+    def table(self):
+        """Сусіди кожної клітинки як кортежі (найшвидший обхід у Python)."""
+        offsets, targets = self.offsets, self.targets
+        return tuple(tuple(targets[offsets[i]:offsets[i + 1]]) for i in range(self.rows * self.cols))
+
+    def __getitem__(self, index):
+        """Сусіди клітинки як зріз масиву (без побудови table)."""
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    def degree(self, index):
+        return self.offsets[index + 1] - self.offsets[index]
+
+
+@functools.lru_cache(maxsize=8)
+def adjacency(topology, rows, cols):
+    """Кешована таблиця суміжності для (topology, rows, cols)."""
+    return Adjacency(topology, rows, cols)